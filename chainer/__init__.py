@@ -30,11 +30,12 @@ from chainer.configuration import using_config  # NOQA
 from chainer.function import force_backprop_mode  # NOQA
 from chainer.function import Function  # NOQA
 from chainer.function import FunctionAdapter  # NOQA
+from chainer.function import inference_mode  # NOQA
 from chainer.function import no_backprop_mode  # NOQA
 from chainer.function_hook import FunctionHook  # NOQA
 from chainer.function_node import FunctionNode  # NOQA
 from chainer.function_node import grad  # NOQA
-from chainer.functions import array  # NOQA
+from chainer.functions.array import get_item  # NOQA
 from chainer.functions.math import basic_math  # NOQA
 from chainer.initializer import Initializer  # NOQA
 from chainer.link import Chain  # NOQA
@@ -132,6 +133,7 @@ def is_arrays_compatible(arrays):
 global_config.debug = bool(int(os.environ.get('CHAINER_DEBUG', '0')))
 global_config.cudnn_deterministic = False
 global_config.enable_backprop = True
+global_config.inference = False
 global_config.keep_graph_on_report = bool(int(
     os.environ.get('CHAINER_KEEP_GRAPH_ON_REPORT', '0')))
 global_config.train = True
@@ -197,6 +199,6 @@ class DebugMode(object):
 
 
 basic_math.install_variable_arithmetics()
-array.get_item.install_variable_get_item()
+get_item.install_variable_get_item()
 
 disable_experimental_feature_warning = False
@@ -2,8 +2,6 @@ import os
 import sys
 import warnings
 
-import numpy.distutils.system_info
-
 
 def _check_python_350():
     if sys.version_info[:3] == (3, 5, 0):
@@ -22,6 +20,9 @@ def _check_osx_numpy_backend():
     if sys.platform != 'darwin':
         return
 
+    # numpy.distutils takes long to import.
+    import numpy.distutils.system_info
+
     blas_opt_info = numpy.distutils.system_info.get_info('blas_opt')
     if blas_opt_info:
         extra_link_args = blas_opt_info.get('extra_link_args')
@@ -0,0 +1,101 @@
+import importlib
+import sys
+import types
+
+
+# Module type is replaceable since Python 3.5.
+_available = sys.version_info >= (3, 5)
+
+
+class _LazyModule(types.ModuleType):
+
+    """Module type that imports the attributes on their first access."""
+
+    def __getattr__(self, name):
+        # This method is called only if the attribute is not loaded yet.
+        if name.startswith('__'):
+            raise AttributeError(name)
+        attributes = self.__dict__.get('_lazy_attributes', {})
+        aliases = self.__dict__.get('_lazy_aliases', {})
+        if name in attributes:
+            module = importlib.import_module(
+                '{}.{}'.format(self.__name__, attributes[name]))
+            value = getattr(module, name)
+        elif name in aliases:
+            value = getattr(self, aliases[name])
+        else:
+            # Submodules used to be accessible as attributes since they were
+            # imported with the package.
+            module_name = '{}.{}'.format(self.__name__, name)
+            try:
+                value = importlib.import_module(module_name)
+            except ImportError as e:
+                if getattr(e, 'name', None) != module_name:
+                    raise
+                raise AttributeError(
+                    "module '{}' has no attribute '{}'".format(
+                        self.__name__, name))
+        setattr(self, name, value)
+        return value
+
+    def __setattr__(self, name, value):
+        # Subpackages are also made lazy when they are imported, so that
+        # their submodules are imported on access as well.
+        if (isinstance(value, types.ModuleType) and
+                value.__name__ == '{}.{}'.format(self.__name__, name)):
+            _make_lazy(value)
+        super(_LazyModule, self).__setattr__(name, value)
+
+    def __dir__(self):
+        return sorted(set(self.__dict__).union(
+            self.__dict__.get('_lazy_attributes', ()),
+            self.__dict__.get('_lazy_aliases', ())))
+
+
+def _make_lazy(module):
+    # Makes submodules of a plain package imported on access.
+    if (isinstance(module, types.ModuleType) and
+            not isinstance(module, _LazyModule) and
+            hasattr(module, '__path__')):
+        module.__class__ = _LazyModule
+
+
+def install(module_name, attributes, aliases=None):
+    """Makes the attributes of a package imported on their first access.
+
+    This function is called at the end of the ``__init__.py`` of a package
+    instead of importing all the public classes and functions from its
+    submodules, which takes long for packages with many submodules. Each
+    attribute is imported from the submodule when it is accessed for the
+    first time, and any submodule is imported when it is accessed as an
+    attribute of the package or its subpackages. Where the module type cannot
+    be replaced (i.e. Python 2), all the attributes are imported immediately.
+
+    Args:
+        module_name (str): Name of the package, i.e. ``__name__``.
+        attributes (dict): Dictionary mapping the name of each attribute to
+            the name of the submodule defining it, relative to the package.
+        aliases (dict): Dictionary mapping the name of each alias to the name
+            of the attribute of the package it refers to.
+
+    """
+    module = sys.modules[module_name]
+    if aliases is None:
+        aliases = {}
+    module._lazy_attributes = attributes
+    module._lazy_aliases = aliases
+    module.__all__ = sorted(set(attributes).union(aliases))
+    if _available:
+        module.__class__ = _LazyModule
+        # Subpackages imported before the package is made lazy.
+        prefix = module_name + '.'
+        for name, submodule in list(sys.modules.items()):
+            if name.startswith(prefix) and submodule is not None:
+                _make_lazy(submodule)
+    else:
+        for name, submodule in attributes.items():
+            submodule = importlib.import_module(
+                '{}.{}'.format(module_name, submodule))
+            setattr(module, name, getattr(submodule, name))
+        for name, target in aliases.items():
+            setattr(module, name, getattr(module, target))
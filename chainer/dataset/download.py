@@ -1,9 +1,16 @@
+import contextlib
 import hashlib
+from multiprocessing import pool
 import os
 import shutil
 import sys
+import threading
+import time
 
 import filelock
+import numpy
+import six
+from six.moves.urllib import error
 from six.moves.urllib import request
 
 from chainer import utils
@@ -66,7 +73,109 @@ def get_dataset_directory(dataset_name, create_directory=True):
     return path
 
 
-def cached_download(url):
+_read_size = 1 << 16
+
+
+class _Progress(object):
+
+    # Thread-safe counter of downloaded bytes. If ``report`` is True, the
+    # progress is written to the standard error at most once per second.
+
+    def __init__(self, total, report):
+        self.total = total
+        self.report = report
+        self.downloaded = 0
+        self._last_report = None
+        self._lock = threading.Lock()
+
+    def update(self, n):
+        with self._lock:
+            self.downloaded += n
+            if not self.report:
+                return
+            now = time.time()
+            if self._last_report is not None and now - self._last_report < 1:
+                return
+            self._last_report = now
+            self._write()
+
+    def close(self):
+        if self.report and self._last_report is not None:
+            self._write()
+            sys.stderr.write('\n')
+
+    def _write(self):
+        if self.total:
+            sys.stderr.write('\r{} / {} bytes ({:.1f}%)'.format(
+                self.downloaded, self.total,
+                100. * self.downloaded / self.total))
+        else:
+            sys.stderr.write('\r{} bytes'.format(self.downloaded))
+        sys.stderr.flush()
+
+
+def _urlopen(url, start=None, end=None):
+    req = request.Request(url)
+    if start is not None:
+        req.add_header('Range', 'bytes={}-{}'.format(
+            start, '' if end is None else end - 1))
+    return request.urlopen(req)
+
+
+def _get_size_for_ranges(url):
+    # Returns the size of the file if the server supports range requests, or
+    # None otherwise.
+    try:
+        response = _urlopen(url, 0, 1)
+    except error.HTTPError as e:
+        if e.code == 416:  # Range Not Satisfiable, e.g. for an empty file
+            return None
+        raise
+    with contextlib.closing(response):
+        if response.getcode() != 206:
+            return None
+        content_range = response.info().get('Content-Range', '')
+        total = content_range.rpartition('/')[2]
+        if not total.isdigit():
+            return None
+        return int(total)
+
+
+def _copy_response(response, f, progress):
+    while True:
+        data = response.read(_read_size)
+        if not data:
+            break
+        f.write(data)
+        progress.update(len(data))
+
+
+def _download_range(url, path, start, end, progress):
+    # Downloads the bytes from start to end to the part file, resuming from
+    # the bytes already in the file.
+    offset = start
+    if os.path.exists(path):
+        offset += os.path.getsize(path)
+        progress.update(offset - start)
+    if offset >= end:
+        return
+    response = _urlopen(url, offset, end)
+    with contextlib.closing(response), open(path, 'ab') as f:
+        if response.getcode() != 206:
+            raise IOError('range request to {} is not satisfied'.format(url))
+        _copy_response(response, f, progress)
+    if os.path.getsize(path) != end - start:
+        raise IOError('incomplete download from {}'.format(url))
+
+
+def _download_whole(url, path, progress):
+    response = _urlopen(url)
+    with contextlib.closing(response), open(path, 'wb') as f:
+        _copy_response(response, f, progress)
+
+
+def cached_download(url, checksum=None, hash_name='sha256', n_connections=1,
+                    progress=True):
     """Downloads a file and caches it.
 
     It downloads a file from the URL if there is no corresponding cache. After
@@ -75,12 +184,31 @@ def cached_download(url):
     for the given URL, it just returns the path to the cache without
     downloading the same file.
 
+    If the server supports range requests, the file is downloaded in
+    ``n_connections`` ranges in parallel, and the downloaded parts are kept
+    in the cache directory until the download completes, so that an
+    interrupted download is resumed by calling this function again.
+    Otherwise, the whole file is downloaded by one request.
+
+    Downloads of the same URL are serialized by a file lock for each URL, so
+    that concurrent processes do not download the same file twice and
+    downloads of different files do not block each other.
+
     .. note::
         This function raises :class:`OSError` when it fails to create
         the cache directory. In older version, it raised :class:`RuntimeError`.
 
     Args:
         url (str): URL to download from.
+        checksum (str): Expected hex digest of the file. If it is given, the
+            downloaded file is verified before it is cached, and
+            :class:`IOError` is raised on mismatch. The existing cache is not
+            verified.
+        hash_name (str): Name of the hash algorithm for ``checksum``, which is
+            passed to :func:`hashlib.new`.
+        n_connections (int): Number of parallel connections.
+        progress (bool): If ``True``, the progress of the download is
+            written to the standard error.
 
     Returns:
         str: Path to the downloaded file.
@@ -93,19 +221,61 @@ def cached_download(url):
         if not os.path.isdir(cache_root):
             raise
 
-    lock_path = os.path.join(cache_root, '_dl_lock')
     urlhash = hashlib.md5(url.encode('utf-8')).hexdigest()
     cache_path = os.path.join(cache_root, urlhash)
+    lock_path = cache_path + '.lock'
 
     with filelock.FileLock(lock_path):
         if os.path.exists(cache_path):
             return cache_path
 
-    with utils.tempdir(dir=cache_root) as temp_root:
-        temp_path = os.path.join(temp_root, 'dl')
         sys.stderr.write('Downloading from {}...\n'.format(url))
-        request.urlretrieve(url, temp_path)
-        with filelock.FileLock(lock_path):
+        size = _get_size_for_ranges(url)
+        counter = _Progress(size, progress)
+        if size is None:
+            part_paths = [cache_path + '.part']
+            _download_whole(url, part_paths[0], counter)
+        else:
+            n = max(1, min(n_connections, size))
+            bounds = [size * i // n for i in six.moves.range(n + 1)]
+            part_paths = [cache_path + '.part{}-{}'.format(n, i)
+                          for i in six.moves.range(n)]
+            args = [(url, part_paths[i], bounds[i], bounds[i + 1], counter)
+                    for i in six.moves.range(n)]
+            if n == 1:
+                _download_range(*args[0])
+            else:
+                workers = pool.ThreadPool(n)
+                try:
+                    workers.map(lambda a: _download_range(*a), args)
+                finally:
+                    workers.close()
+                    workers.join()
+        counter.close()
+
+        h = None if checksum is None else hashlib.new(hash_name)
+        with utils.tempdir(dir=cache_root) as temp_root:
+            temp_path = os.path.join(temp_root, 'dl')
+            with open(temp_path, 'wb') as out:
+                for part_path in part_paths:
+                    with open(part_path, 'rb') as f:
+                        while True:
+                            data = f.read(_read_size)
+                            if not data:
+                                break
+                            if h is not None:
+                                h.update(data)
+                            out.write(data)
+            # The parts are removed also on mismatch, since the corrupted
+            # data must not be resumed.
+            for name in os.listdir(cache_root):
+                if name.startswith(urlhash + '.part'):
+                    os.remove(os.path.join(cache_root, name))
+            if h is not None and h.hexdigest() != checksum.lower():
+                raise IOError(
+                    'checksum mismatch of the file downloaded from {}: '
+                    'expected {}, actual {}'.format(
+                        url, checksum, h.hexdigest()))
             shutil.move(temp_path, cache_path)
 
     return cache_path
@@ -155,3 +325,59 @@ def cache_or_load_file(path, creator, loader):
                 shutil.move(temp_path, path)
 
     return content
+
+
+def _param_str(value):
+    if isinstance(value, type) or isinstance(value, numpy.dtype):
+        return numpy.dtype(value).name
+    return repr(value)
+
+
+def cache_or_load_arrays(root, name, params, creator, mmap_mode='c'):
+    """Caches arrays uncompressed, or loads them memory-mapped otherwise.
+
+    This is a utility function used in dataset loading routines to cache
+    preprocessed arrays. The ``creator`` creates a dictionary of arrays,
+    which is saved to a directory of uncompressed ``.npy`` files under
+    ``root``. The name of the directory is made of ``name`` and ``params``,
+    which should contain all the arguments of the preprocessing, so that the
+    arrays preprocessed differently are cached separately. If the directory
+    already exists, the arrays are memory-mapped from the files instead, which
+    takes almost no time and lets concurrent processes share the pages.
+
+    Args:
+        root (str): Directory to save the cache in.
+        name (str): Name of the cache.
+        params (dict): Parameters that determine the arrays. Each value is
+            converted to a string by :func:`repr`, or its name if it is a
+            data type.
+        creator: Function to create the dictionary of arrays. It takes no
+            arguments. The keys must be valid file names.
+        mmap_mode (str): Mode to memory-map the cached files, which is passed
+            to :func:`numpy.load`. The default ``'c'`` maps them
+            copy-on-write, so that the loaded arrays can be modified without
+            affecting the cache.
+
+    Returns:
+        dict: Dictionary of arrays returned by the creator or loaded from the
+        cache.
+
+    """
+    key = ','.join('{}={}'.format(k, _param_str(v))
+                   for k, v in sorted(six.iteritems(params)))
+    path = os.path.join(root, '{}.{}.npycache'.format(name, key))
+
+    def create(temp_path):
+        arrays = creator()
+        os.mkdir(temp_path)
+        for k, array in six.iteritems(arrays):
+            numpy.save(os.path.join(temp_path, k + '.npy'), array)
+        return arrays
+
+    def load(path):
+        return {file_name[:-4]: numpy.load(os.path.join(path, file_name),
+                                           mmap_mode=mmap_mode)
+                for file_name in os.listdir(path)
+                if file_name.endswith('.npy')}
+
+    return cache_or_load_file(path, create, load)
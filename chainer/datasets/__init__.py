@@ -1,23 +1,37 @@
-# import classes and functions
-from chainer.datasets.cifar import get_cifar10  # NOQA
-from chainer.datasets.cifar import get_cifar100  # NOQA
-from chainer.datasets.concatenated_dataset import ConcatenatedDataset  # NOQA
-from chainer.datasets.dict_dataset import DictDataset  # NOQA
-from chainer.datasets.fashion_mnist import get_fashion_mnist  # NOQA
-from chainer.datasets.image_dataset import ImageDataset  # NOQA
-from chainer.datasets.image_dataset import LabeledImageDataset  # NOQA
-from chainer.datasets.image_dataset import MultiZippedImageDataset  # NOQA
-from chainer.datasets.image_dataset import ZippedImageDataset  # NOQA
-from chainer.datasets.mnist import get_mnist  # NOQA
-from chainer.datasets.ptb import get_ptb_words  # NOQA
-from chainer.datasets.ptb import get_ptb_words_vocabulary  # NOQA
-from chainer.datasets.sub_dataset import get_cross_validation_datasets  # NOQA
-from chainer.datasets.sub_dataset import get_cross_validation_datasets_random  # NOQA
-from chainer.datasets.sub_dataset import split_dataset  # NOQA
-from chainer.datasets.sub_dataset import split_dataset_n  # NOQA
-from chainer.datasets.sub_dataset import split_dataset_n_random  # NOQA
-from chainer.datasets.sub_dataset import split_dataset_random  # NOQA
-from chainer.datasets.sub_dataset import SubDataset  # NOQA
-from chainer.datasets.svhn import get_svhn  # NOQA
-from chainer.datasets.transform_dataset import TransformDataset  # NOQA
-from chainer.datasets.tuple_dataset import TupleDataset  # NOQA
+from chainer import _lazy_import
+
+
+# Classes and functions are imported from the submodules on their first
+# access.
+_lazy_import.install(__name__, {
+    'Augmentation': 'augmentation',
+    'ColorJitter': 'augmentation',
+    'RandomCrop': 'augmentation',
+    'RandomFlip': 'augmentation',
+    'RandomResizedCrop': 'augmentation',
+    'get_cifar10': 'cifar',
+    'get_cifar100': 'cifar',
+    'ConcatenatedDataset': 'concatenated_dataset',
+    'DictDataset': 'dict_dataset',
+    'get_fashion_mnist': 'fashion_mnist',
+    'ImageDataset': 'image_dataset',
+    'LabeledImageDataset': 'image_dataset',
+    'MultiZippedImageDataset': 'image_dataset',
+    'ZippedImageDataset': 'image_dataset',
+    'get_mnist': 'mnist',
+    'get_ptb_words': 'ptb',
+    'get_ptb_words_vocabulary': 'ptb',
+    'RecordDataset': 'record_dataset',
+    'write_records': 'record_dataset',
+    'SharedMemoryDataset': 'shared_memory_dataset',
+    'get_cross_validation_datasets': 'sub_dataset',
+    'get_cross_validation_datasets_random': 'sub_dataset',
+    'split_dataset': 'sub_dataset',
+    'split_dataset_n': 'sub_dataset',
+    'split_dataset_n_random': 'sub_dataset',
+    'split_dataset_random': 'sub_dataset',
+    'SubDataset': 'sub_dataset',
+    'get_svhn': 'svhn',
+    'TransformDataset': 'transform_dataset',
+    'TupleDataset': 'tuple_dataset',
+})
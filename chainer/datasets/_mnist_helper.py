@@ -35,6 +35,27 @@ def make_npz(path, urls):
 
 def preprocess_mnist(raw, withlabel, ndim, scale, image_dtype, label_dtype,
                      rgb_format):
+    images, labels = _preprocess_mnist_arrays(
+        raw, ndim, scale, image_dtype, label_dtype, rgb_format)
+    return _make_dataset(images, labels, withlabel)
+
+
+def get_preprocessed_mnist(root, name, retrieve, withlabel, ndim, scale,
+                           image_dtype, label_dtype, rgb_format):
+    # Caches the preprocessed arrays in the uncompressed format.
+    def creator():
+        images, labels = _preprocess_mnist_arrays(
+            retrieve(), ndim, scale, image_dtype, label_dtype, rgb_format)
+        return {'x': images, 'y': labels}
+
+    params = {'ndim': ndim, 'scale': scale, 'dtype': image_dtype,
+              'label_dtype': label_dtype, 'rgb_format': rgb_format}
+    arrays = download.cache_or_load_arrays(root, name, params, creator)
+    return _make_dataset(arrays['x'], arrays['y'], withlabel)
+
+
+def _preprocess_mnist_arrays(raw, ndim, scale, image_dtype, label_dtype,
+                             rgb_format):
     images = raw['x']
     if ndim == 2:
         images = images.reshape(-1, 28, 28)
@@ -48,8 +69,12 @@ def preprocess_mnist(raw, withlabel, ndim, scale, image_dtype, label_dtype,
     images = images.astype(image_dtype)
     images *= scale / 255.
 
+    labels = raw['y'].astype(label_dtype)
+    return images, labels
+
+
+def _make_dataset(images, labels, withlabel):
     if withlabel:
-        labels = raw['y'].astype(label_dtype)
         return tuple_dataset.TupleDataset(images, labels)
     else:
         return images
@@ -0,0 +1,250 @@
+from __future__ import division
+
+import math
+
+import numpy
+import six
+
+from chainer.dataset import convert
+from chainer.utils import imgproc
+
+
+def _mix(x):
+    # Finalizer of SplitMix64, which maps an array of 64-bit integers to
+    # pseudo-random 64-bit integers. Overflows wrap around.
+    x = (x ^ (x >> numpy.uint64(30))) * numpy.uint64(0xbf58476d1ce4e5b9)
+    x = (x ^ (x >> numpy.uint64(27))) * numpy.uint64(0x94d049bb133111eb)
+    return x ^ (x >> numpy.uint64(31))
+
+
+_golden_gamma = numpy.uint64(0x9e3779b97f4a7c15)
+
+
+class _ExampleRandom(object):
+
+    # Random number generator that draws a number for each example of a
+    # batch at once. The numbers are determined by the seed, the ID of each
+    # example and the number of draws, so that they do not depend on how the
+    # examples are batched or loaded.
+
+    def __init__(self, seed, ids):
+        seed = _mix(numpy.array([seed], dtype=numpy.uint64))
+        self._keys = _mix(
+            numpy.asarray(ids, dtype=numpy.uint64) * _golden_gamma + seed)
+        self._n_draws = 0
+
+    def random(self):
+        self._n_draws += 1
+        draw = _mix(numpy.array([self._n_draws], dtype=numpy.uint64))
+        x = _mix(self._keys + draw)
+        # Uses the upper 53 bits, which a float64 represents exactly.
+        return (x >> numpy.uint64(11)).astype(numpy.float64) / (1 << 53)
+
+    def uniform(self, low=0., high=1.):
+        return low + (high - low) * self.random()
+
+    def randint(self, high):
+        high = numpy.asarray(high)
+        return (self.random() * high).astype(numpy.intp)
+
+
+class Augmentation(object):
+
+    """Converter that augments batches of images.
+
+    This converter concatenates the examples of a batch into arrays and
+    applies the given transforms to the batch of images, e.g. those of
+    :class:`~chainer.datasets.ImageDataset` with ``dtype=numpy.uint8``. Each
+    transform processes the whole batch by NumPy operations at once, which is
+    much faster than transforming the examples one by one in a
+    :class:`~chainer.datasets.TransformDataset`.
+
+    The random numbers are drawn for each example from a counter-based
+    generator, which is determined by ``seed`` and the position of the example
+    in the sequence of the examples converted by this object. Since the
+    converter is called in the main process, the augmentation is reproducible
+    regardless of the number of worker processes or threads of the iterator.
+    The seed and the number of converted examples are saved by
+    :meth:`serialize`, which
+    :class:`~chainer.training.updaters.StandardUpdater` calls for its
+    converter, so that the augmentation is also reproduced after resuming from
+    a snapshot of the trainer.
+
+    A transform is a callable that takes a batch of images and a random
+    number generator, and returns the transformed batch. The generator has
+    ``random()``, ``uniform(low, high)`` and ``randint(high)`` methods, each
+    of which returns an array of a random number for each image.
+
+    .. admonition:: Example
+
+       A typical augmentation of ImageNet is applied as follows::
+
+          augmentation = Augmentation([
+              RandomResizedCrop((224, 224)),
+              RandomFlip(),
+              ColorJitter(brightness=0.4, contrast=0.4, saturation=0.4),
+          ], seed=0)
+          updater = training.updaters.StandardUpdater(
+              train_iter, optimizer, converter=augmentation)
+
+    Args:
+        transforms (list): Transforms applied to the images in this order.
+        seed (int): Seed of the random numbers. If it is ``None``, it is
+            drawn from :mod:`numpy.random`.
+        key: Key or index of the images in the converted arrays. If the
+            converter returns an array, the array is transformed.
+        converter: Converter to concatenate the examples. The arrays are
+            converted on CPU, transformed and then sent to the device.
+
+    """
+
+    def __init__(self, transforms, seed=None, key=0,
+                 converter=convert.concat_examples):
+        if seed is None:
+            seed = numpy.random.randint(0, 1 << 31)
+        self.transforms = list(transforms)
+        self.seed = seed
+        self.key = key
+        self.converter = converter
+        self.n_examples = 0
+
+    def __call__(self, batch, device=None):
+        arrays = self.converter(batch)
+        if isinstance(arrays, tuple):
+            arrays = list(arrays)
+            arrays[self.key] = self.augment(arrays[self.key])
+            return tuple([convert.to_device(device, x) for x in arrays])
+        elif isinstance(arrays, dict):
+            arrays = dict(arrays)
+            arrays[self.key] = self.augment(arrays[self.key])
+            return {k: convert.to_device(device, x)
+                    for k, x in six.iteritems(arrays)}
+        else:
+            return convert.to_device(device, self.augment(arrays))
+
+    def augment(self, images):
+        """Applies the transforms to a batch of images.
+
+        Args:
+            images (numpy.ndarray): Batch of images in the shape of
+                ``(N, C, H, W)``.
+
+        Returns:
+            numpy.ndarray: Batch of transformed images.
+
+        """
+        n = len(images)
+        ids = numpy.arange(self.n_examples, self.n_examples + n)
+        self.n_examples += n
+        random = _ExampleRandom(self.seed, ids)
+        for transform in self.transforms:
+            images = transform(images, random)
+        return images
+
+    def serialize(self, serializer):
+        self.seed = serializer('seed', self.seed)
+        self.n_examples = serializer('n_examples', self.n_examples)
+
+
+class RandomCrop(object):
+
+    """Transform that crops images at random positions.
+
+    Args:
+        size (tuple of ints): Height and width of the cropped images.
+
+    """
+
+    def __init__(self, size):
+        self.size = size
+
+    def __call__(self, images, random):
+        _, _, h, w = images.shape
+        height, width = self.size
+        top = random.randint(h - height + 1)
+        left = random.randint(w - width + 1)
+        return imgproc.crop(images, top, left, self.size)
+
+
+class RandomFlip(object):
+
+    """Transform that flips images horizontally with a probability.
+
+    Args:
+        p (float): Probability to flip each image.
+
+    """
+
+    def __init__(self, p=0.5):
+        self.p = p
+
+    def __call__(self, images, random):
+        return imgproc.flip(images, random.random() < self.p)
+
+
+class RandomResizedCrop(object):
+
+    """Transform that crops regions of random scales and resizes them.
+
+    The area of each region is a random fraction of the image in the range
+    of ``scale``, and its aspect ratio (width over height) is random in the
+    range of ``ratio`` in the log scale. The region is clipped by the image
+    and resized to ``size`` by the nearest neighbor interpolation.
+
+    Args:
+        size (tuple of ints): Height and width of the output images.
+        scale (tuple of floats): Range of the area of the regions relative to
+            the images.
+        ratio (tuple of floats): Range of the aspect ratio of the regions.
+
+    """
+
+    def __init__(self, size, scale=(0.08, 1.), ratio=(3 / 4, 4 / 3)):
+        self.size = size
+        self.scale = scale
+        self.ratio = ratio
+
+    def __call__(self, images, random):
+        _, _, h, w = images.shape
+        area = h * w * random.uniform(*self.scale)
+        ratio = numpy.exp(random.uniform(
+            math.log(self.ratio[0]), math.log(self.ratio[1])))
+        height = numpy.clip(
+            numpy.rint(numpy.sqrt(area / ratio)), 1, h).astype(numpy.intp)
+        width = numpy.clip(
+            numpy.rint(numpy.sqrt(area * ratio)), 1, w).astype(numpy.intp)
+        top = random.randint(h - height + 1)
+        left = random.randint(w - width + 1)
+        return imgproc.resized_crop(
+            images, top, left, height, width, self.size)
+
+
+class ColorJitter(object):
+
+    """Transform that changes the brightness, contrast and saturation randomly.
+
+    Each factor is drawn uniformly from ``[max(0, 1 - v), 1 + v]`` for each
+    image, where ``v`` is the given strength. See
+    :func:`chainer.utils.imgproc.adjust_color`.
+
+    Args:
+        brightness (float): Strength of the brightness change.
+        contrast (float): Strength of the contrast change.
+        saturation (float): Strength of the saturation change.
+
+    """
+
+    def __init__(self, brightness=0., contrast=0., saturation=0.):
+        self.brightness = brightness
+        self.contrast = contrast
+        self.saturation = saturation
+
+    def __call__(self, images, random):
+        def draw(v):
+            if v == 0:
+                return None
+            return random.uniform(max(0., 1. - v), 1. + v)
+
+        return imgproc.adjust_color(
+            images, brightness=draw(self.brightness),
+            contrast=draw(self.contrast), saturation=draw(self.saturation))
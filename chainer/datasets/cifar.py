@@ -9,7 +9,7 @@ from chainer.dataset import download
 from chainer.datasets import tuple_dataset
 
 
-def get_cifar10(withlabel=True, ndim=3, scale=1.):
+def get_cifar10(withlabel=True, ndim=3, scale=1., cache_preprocessed=False):
     """Gets the CIFAR-10 dataset.
 
     `CIFAR-10 <https://www.cs.toronto.edu/~kriz/cifar.html>`_ is a set of small
@@ -34,6 +34,12 @@ def get_cifar10(withlabel=True, ndim=3, scale=1.):
 
         scale (float): Pixel value scale. If it is 1 (default), pixels are
             scaled to the interval ``[0, 1]``.
+        cache_preprocessed (bool): If ``True``, the preprocessed arrays are
+            cached in an uncompressed format for each combination of ``ndim``
+            and ``scale``, and they are memory-mapped (copy-on-write) from the
+            cache on subsequent calls, which skips decompressing and
+            preprocessing the data. See
+            :func:`~chainer.dataset.cache_or_load_arrays`.
 
     Returns:
         A tuple of two datasets. If ``withlabel`` is ``True``, both datasets
@@ -41,10 +47,10 @@ def get_cifar10(withlabel=True, ndim=3, scale=1.):
         datasets are arrays of images.
 
     """
-    return _get_cifar('cifar-10', withlabel, ndim, scale)
+    return _get_cifar('cifar-10', withlabel, ndim, scale, cache_preprocessed)
 
 
-def get_cifar100(withlabel=True, ndim=3, scale=1.):
+def get_cifar100(withlabel=True, ndim=3, scale=1., cache_preprocessed=False):
     """Gets the CIFAR-100 dataset.
 
     `CIFAR-100 <https://www.cs.toronto.edu/~kriz/cifar.html>`_ is a set of
@@ -69,6 +75,12 @@ def get_cifar100(withlabel=True, ndim=3, scale=1.):
 
         scale (float): Pixel value scale. If it is 1 (default), pixels are
             scaled to the interval ``[0, 1]``.
+        cache_preprocessed (bool): If ``True``, the preprocessed arrays are
+            cached in an uncompressed format for each combination of ``ndim``
+            and ``scale``, and they are memory-mapped (copy-on-write) from the
+            cache on subsequent calls, which skips decompressing and
+            preprocessing the data. See
+            :func:`~chainer.dataset.cache_or_load_arrays`.
 
     Returns:
         A tuple of two datasets. If ``withlabel`` is ``True``, both
@@ -76,12 +88,39 @@ def get_cifar100(withlabel=True, ndim=3, scale=1.):
         datasets are arrays of images.
 
     """
-    return _get_cifar('cifar-100', withlabel, ndim, scale)
+    return _get_cifar('cifar-100', withlabel, ndim, scale,
+                      cache_preprocessed)
 
 
-def _get_cifar(name, withlabel, ndim, scale):
+def _get_cifar(name, withlabel, ndim, scale, cache_preprocessed):
     root = download.get_dataset_directory(os.path.join('pfnet', 'chainer',
                                                        'cifar'))
+    if cache_preprocessed:
+        def create_preprocessed():
+            raw = _retrieve_cifar(name, root)
+            train_x, train_y = _preprocess_cifar_arrays(
+                raw['train_x'], raw['train_y'], ndim, scale)
+            test_x, test_y = _preprocess_cifar_arrays(
+                raw['test_x'], raw['test_y'], ndim, scale)
+            return {'train_x': train_x, 'train_y': train_y,
+                    'test_x': test_x, 'test_y': test_y}
+
+        arrays = download.cache_or_load_arrays(
+            root, name, {'ndim': ndim, 'scale': scale}, create_preprocessed)
+        train = _make_dataset(arrays['train_x'], arrays['train_y'],
+                              withlabel)
+        test = _make_dataset(arrays['test_x'], arrays['test_y'], withlabel)
+        return train, test
+
+    raw = _retrieve_cifar(name, root)
+    train = _preprocess_cifar(raw['train_x'], raw['train_y'], withlabel,
+                              ndim, scale)
+    test = _preprocess_cifar(raw['test_x'], raw['test_y'], withlabel, ndim,
+                             scale)
+    return train, test
+
+
+def _retrieve_cifar(name, root):
     npz_path = os.path.join(root, '{}.npz'.format(name))
     url = 'https://www.cs.toronto.edu/~kriz/{}-python.tar.gz'.format(name)
 
@@ -128,15 +167,15 @@ def _get_cifar(name, withlabel, ndim, scale):
         return {'train_x': train_x, 'train_y': train_y,
                 'test_x': test_x, 'test_y': test_y}
 
-    raw = download.cache_or_load_file(npz_path, creator, numpy.load)
-    train = _preprocess_cifar(raw['train_x'], raw['train_y'], withlabel,
-                              ndim, scale)
-    test = _preprocess_cifar(raw['test_x'], raw['test_y'], withlabel, ndim,
-                             scale)
-    return train, test
+    return download.cache_or_load_file(npz_path, creator, numpy.load)
 
 
 def _preprocess_cifar(images, labels, withlabel, ndim, scale):
+    images, labels = _preprocess_cifar_arrays(images, labels, ndim, scale)
+    return _make_dataset(images, labels, withlabel)
+
+
+def _preprocess_cifar_arrays(images, labels, ndim, scale):
     if ndim == 1:
         images = images.reshape(-1, 3072)
     elif ndim == 3:
@@ -145,9 +184,12 @@ def _preprocess_cifar(images, labels, withlabel, ndim, scale):
         raise ValueError('invalid ndim for CIFAR dataset')
     images = images.astype(numpy.float32)
     images *= scale / 255.
+    labels = labels.astype(numpy.int32)
+    return images, labels
+
 
+def _make_dataset(images, labels, withlabel):
     if withlabel:
-        labels = labels.astype(numpy.int32)
         return tuple_dataset.TupleDataset(images, labels)
     else:
         return images
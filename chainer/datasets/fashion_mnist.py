@@ -3,12 +3,14 @@ import os
 import numpy
 
 from chainer.dataset import download
+from chainer.datasets._mnist_helper import get_preprocessed_mnist
 from chainer.datasets._mnist_helper import make_npz
 from chainer.datasets._mnist_helper import preprocess_mnist
 
 
 def get_fashion_mnist(withlabel=True, ndim=1, scale=1., dtype=numpy.float32,
-                      label_dtype=numpy.int32, rgb_format=False):
+                      label_dtype=numpy.int32, rgb_format=False,
+                      cache_preprocessed=False):
     """Gets the Fashion-MNIST dataset.
 
     `Fashion-MNIST <https://github.com/zalandoresearch/fashion-mnist/>`_ is a
@@ -39,6 +41,12 @@ def get_fashion_mnist(withlabel=True, ndim=1, scale=1., dtype=numpy.float32,
         rgb_format (bool): if ``ndim == 3`` and ``rgb_format`` is ``True``, the
             image will be converted to rgb format by duplicating the channels
             so the image shape is (3, 28, 28). Default is ``False``.
+        cache_preprocessed (bool): If ``True``, the preprocessed arrays are
+            cached in an uncompressed format for each combination of ``ndim``,
+            ``scale``, ``dtype``, ``label_dtype`` and ``rgb_format``, and they
+            are memory-mapped (copy-on-write) from the cache on subsequent
+            calls, which skips decompressing and preprocessing the data.
+            See :func:`~chainer.dataset.cache_or_load_arrays`.
 
     Returns:
         A tuple of two datasets. If ``withlabel`` is ``True``, both datasets
@@ -46,6 +54,16 @@ def get_fashion_mnist(withlabel=True, ndim=1, scale=1., dtype=numpy.float32,
         datasets are arrays of images.
 
     """
+    if cache_preprocessed:
+        root = download.get_dataset_directory('pfnet/chainer/fashion-mnist')
+        train = get_preprocessed_mnist(
+            root, 'train', _retrieve_fashion_mnist_training, withlabel, ndim,
+            scale, dtype, label_dtype, rgb_format)
+        test = get_preprocessed_mnist(
+            root, 'test', _retrieve_fashion_mnist_test, withlabel, ndim,
+            scale, dtype, label_dtype, rgb_format)
+        return train, test
+
     train_raw = _retrieve_fashion_mnist_training()
     train = preprocess_mnist(train_raw, withlabel, ndim, scale, dtype,
                              label_dtype, rgb_format)
@@ -8,6 +8,7 @@ except ImportError as e:
     available = False
     _import_error = e
 import bisect
+import collections
 import io
 import six
 import threading
@@ -16,10 +17,16 @@ import zipfile
 from chainer.dataset import dataset_mixin
 
 
-def _read_image_as_array(path, dtype):
+def _read_image_as_array(path, dtype, draft_size=None):
     f = Image.open(path)
     try:
-        image = numpy.asarray(f, dtype=dtype)
+        if draft_size is not None:
+            # Only JPEG images can be decoded at a reduced scale; the request
+            # is ignored for other formats.
+            f.draft(f.mode, draft_size)
+        # The array shares the read-only buffer of the image if no
+        # conversion is needed, so it is copied to be writable.
+        image = numpy.array(f, dtype=dtype)
     finally:
         # Only pillow >= 3.0 has 'close' method
         if hasattr(f, 'close'):
@@ -34,6 +41,59 @@ def _postprocess_image(image):
     return image.transpose(2, 0, 1)
 
 
+class _LRUCache(object):
+
+    # Thread-safe cache of the decoded images that keeps at most ``size``
+    # recently used entries. The contents are not pickled, so that a dataset
+    # sent to worker processes does not carry them.
+
+    def __init__(self, size):
+        self.size = size
+        self._entries = collections.OrderedDict()
+        self._lock = threading.Lock()
+
+    def __getstate__(self):
+        return {'size': self.size}
+
+    def __setstate__(self, state):
+        self.__init__(state['size'])
+
+    def get(self, key):
+        with self._lock:
+            value = self._entries.pop(key, None)
+            if value is not None:
+                self._entries[key] = value
+        return value
+
+    def put(self, key, value):
+        with self._lock:
+            self._entries.pop(key, None)
+            self._entries[key] = value
+            while len(self._entries) > self.size:
+                self._entries.popitem(last=False)
+
+
+def _get_image(cache, i, read):
+    # Returns the ``i``-th image using the cache if available. A copy of the
+    # cached array is returned, since the caller may modify it in place.
+    if cache is None:
+        return read(i)
+    image = cache.get(i)
+    if image is None:
+        image = read(i)
+        cache.put(i, image)
+    return image.copy()
+
+
+def _make_cache(cache_size):
+    if cache_size < 0:
+        raise ValueError('cache_size must be non-negative. Actual: {}'
+                         .format(cache_size))
+    if cache_size == 0:
+        return None
+    return _LRUCache(cache_size)
+
+
 class ImageDataset(dataset_mixin.DatasetMixin):
 
     """Dataset of images built from a list of paths to image files.
@@ -69,11 +129,24 @@ class ImageDataset(dataset_mixin.DatasetMixin):
             ``i``-th image. In both cases, each path is a relative one from the
             root path given by another argument.
         root (str): Root directory to retrieve images from.
-        dtype: Data type of resulting image arrays.
+        dtype: Data type of resulting image arrays. If it is ``None``, the
+            arrays have the data type of the decoded images (e.g.
+            ``numpy.uint8`` for 8-bit images). It saves the memory traffic of
+            the conversion, which can be deferred to the converter or the
+            model.
+        draft_size (tuple of ints): If it is given as ``(width, height)``,
+            JPEG images are decoded at the smallest scale (one of 1/1, 1/2,
+            1/4 and 1/8) at which they are not smaller than this size, which
+            is much faster than decoding at the full scale. It is ignored for
+            images in other formats.
+        cache_size (int): Maximum number of decoded images kept in an LRU
+            cache in memory. The cache is disabled if it is ``0``. Each
+            process has its own cache, which is not pickled.
 
     """
 
-    def __init__(self, paths, root='.', dtype=numpy.float32):
+    def __init__(self, paths, root='.', dtype=numpy.float32, draft_size=None,
+                 cache_size=0):
         _check_pillow_availability()
         if isinstance(paths, six.string_types):
             with open(paths) as paths_file:
@@ -81,13 +154,18 @@ class ImageDataset(dataset_mixin.DatasetMixin):
         self._paths = paths
         self._root = root
         self._dtype = dtype
+        self._draft_size = draft_size
+        self._cache = _make_cache(cache_size)
 
     def __len__(self):
         return len(self._paths)
 
     def get_example(self, i):
+        return _get_image(self._cache, i, self._read)
+
+    def _read(self, i):
         path = os.path.join(self._root, self._paths[i])
-        image = _read_image_as_array(path, self._dtype)
+        image = _read_image_as_array(path, self._dtype, self._draft_size)
 
         return _postprocess_image(image)
 
@@ -125,13 +203,25 @@ class LabeledImageDataset(dataset_mixin.DatasetMixin):
             each path is a relative one from the root path given by another
             argument.
         root (str): Root directory to retrieve images from.
-        dtype: Data type of resulting image arrays.
+        dtype: Data type of resulting image arrays. If it is ``None``, the
+            arrays have the data type of the decoded images (e.g.
+            ``numpy.uint8`` for 8-bit images). It saves the memory traffic of
+            the conversion, which can be deferred to the converter or the
+            model.
+        draft_size (tuple of ints): If it is given as ``(width, height)``,
+            JPEG images are decoded at the smallest scale (one of 1/1, 1/2,
+            1/4 and 1/8) at which they are not smaller than this size, which
+            is much faster than decoding at the full scale. It is ignored for
+            images in other formats.
+        cache_size (int): Maximum number of decoded images kept in an LRU
+            cache in memory. The cache is disabled if it is ``0``. Each
+            process has its own cache, which is not pickled.
         label_dtype: Data type of the labels.
 
     """
 
     def __init__(self, pairs, root='.', dtype=numpy.float32,
-                 label_dtype=numpy.int32):
+                 label_dtype=numpy.int32, draft_size=None, cache_size=0):
         _check_pillow_availability()
         if isinstance(pairs, six.string_types):
             pairs_path = pairs
@@ -148,17 +238,23 @@ class LabeledImageDataset(dataset_mixin.DatasetMixin):
         self._root = root
         self._dtype = dtype
         self._label_dtype = label_dtype
+        self._draft_size = draft_size
+        self._cache = _make_cache(cache_size)
 
     def __len__(self):
         return len(self._pairs)
 
     def get_example(self, i):
-        path, int_label = self._pairs[i]
-        full_path = os.path.join(self._root, path)
-        image = _read_image_as_array(full_path, self._dtype)
+        image = _get_image(self._cache, i, self._read)
+
+        label = numpy.array(self._pairs[i][1], dtype=self._label_dtype)
+        return image, label
 
-        label = numpy.array(int_label, dtype=self._label_dtype)
-        return _postprocess_image(image), label
+    def _read(self, i):
+        full_path = os.path.join(self._root, self._pairs[i][0])
+        image = _read_image_as_array(full_path, self._dtype, self._draft_size)
+
+        return _postprocess_image(image)
 
 
 class MultiZippedImageDataset(dataset_mixin.DatasetMixin):
@@ -173,10 +269,16 @@ class MultiZippedImageDataset(dataset_mixin.DatasetMixin):
     Args:
         zipfilenames (list of strings): List of zipped archive filename.
         dtype: Data type of resulting image arrays.
+        draft_size (tuple of ints): Size to decode JPEG images at. See
+            :class:`ImageDataset` for details.
+        cache_size (int): Maximum number of decoded images cached for each
+            zipfile. See :class:`ImageDataset` for details.
     """
 
-    def __init__(self, zipfilenames, dtype=numpy.float32):
-        self._zfs = [ZippedImageDataset(fn, dtype) for fn in zipfilenames]
+    def __init__(self, zipfilenames, dtype=numpy.float32, draft_size=None,
+                 cache_size=0):
+        self._zfs = [ZippedImageDataset(fn, dtype, draft_size, cache_size)
+                     for fn in zipfilenames]
         self._zpaths_accumlens = [0]
         zplen = 0
         for zf in self._zfs:
@@ -209,14 +311,21 @@ class ZippedImageDataset(dataset_mixin.DatasetMixin):
     Args:
         zipfilename (str): a string to point zipfile path
         dtype: Data type of resulting image arrays
+        draft_size (tuple of ints): Size to decode JPEG images at. See
+            :class:`ImageDataset` for details.
+        cache_size (int): Maximum number of decoded images cached. See
+            :class:`ImageDataset` for details.
 
     """
 
-    def __init__(self, zipfilename, dtype=numpy.float32):
+    def __init__(self, zipfilename, dtype=numpy.float32, draft_size=None,
+                 cache_size=0):
         self._zipfilename = zipfilename
         self._zf = zipfile.ZipFile(zipfilename)
         self._zf_pid = os.getpid()
         self._dtype = dtype
+        self._draft_size = draft_size
+        self._cache = _make_cache(cache_size)
         self._paths = [x for x in self._zf.namelist() if not x.endswith('/')]
         self._lock = threading.Lock()
 
@@ -234,6 +343,9 @@ class ZippedImageDataset(dataset_mixin.DatasetMixin):
         self._lock = threading.Lock()
 
     def get_example(self, i):
+        return _get_image(self._cache, i, self._read)
+
+    def _read(self, i):
         # PIL may seek() on the file -- zipfile won't support it
         with self._lock:
             if self._zf is None or self._zf_pid != os.getpid():
@@ -241,7 +353,8 @@ class ZippedImageDataset(dataset_mixin.DatasetMixin):
                 self._zf = zipfile.ZipFile(self._zipfilename)
             image_file_mem = self._zf.read(self._paths[i])
         image_file = io.BytesIO(image_file_mem)
-        image = _read_image_as_array(image_file, self._dtype)
+        image = _read_image_as_array(
+            image_file, self._dtype, self._draft_size)
         return _postprocess_image(image)
 
 
@@ -0,0 +1,98 @@
+from multiprocessing import sharedctypes
+
+import numpy
+import six
+
+
+class SharedMemoryDataset(object):
+
+    """Dataset of arrays placed in shared memory.
+
+    This dataset copies the given arrays to shared memory and returns their
+    elements as examples, in the same way as :class:`TupleDataset` of the
+    arrays. It is designed to be used with
+    :class:`~chainer.iterators.MultiprocessIterator`.
+
+    A dataset inherited by forked worker processes is shared copy-on-write,
+    but the pages of many small Python objects are gradually copied to each
+    worker as their reference counts are updated, so that each worker ends up
+    with a copy of the dataset. The arrays of this dataset are kept in a few
+    large shared memory blocks, which are never copied. When the dataset is
+    pickled to start worker processes with the ``'spawn'`` or
+    ``'forkserver'`` start method, only the handles of the shared memory are
+    sent, so that workers are started quickly regardless of the size of the
+    dataset.
+
+    Note that the dataset can be pickled only to be sent to child processes
+    on their creation, e.g. as the dataset of
+    :class:`~chainer.iterators.MultiprocessIterator`. Arrays of objects are
+    not supported.
+
+    Args:
+        arrays: Arrays of the same length. The ``j``-th array is used for the
+            ``j``-th item of each example tuple. If only one array is given,
+            each example is an element of the array instead of a tuple.
+
+    """
+
+    def __init__(self, *arrays):
+        if not arrays:
+            raise ValueError('no arrays are given')
+        arrays = [numpy.asarray(array) for array in arrays]
+        length = len(arrays[0])
+        for i, array in enumerate(arrays):
+            if len(array) != length:
+                raise ValueError(
+                    'array of the index {} has a wrong length'.format(i))
+            if array.dtype.hasobject:
+                raise ValueError(
+                    'array of the index {} has objects'.format(i))
+
+        self._mems = []
+        self._dtypes = []
+        self._shapes = []
+        for array in arrays:
+            mem = sharedctypes.RawArray('b', max(array.nbytes, 1))
+            self._mems.append(mem)
+            self._dtypes.append(array.dtype)
+            self._shapes.append(array.shape)
+        self._length = length
+        self._set_arrays()
+        for shared, array in six.moves.zip(self._arrays, arrays):
+            shared[...] = array
+
+    def __getstate__(self):
+        d = self.__dict__.copy()
+        del d['_arrays']
+        return d
+
+    def __setstate__(self, state):
+        self.__dict__ = state
+        self._set_arrays()
+
+    def __getitem__(self, index):
+        batches = [array[index] for array in self._arrays]
+        if len(batches) == 1:
+            return batches[0]
+        if isinstance(index, slice):
+            length = len(batches[0])
+            return [tuple([batch[i] for batch in batches])
+                    for i in six.moves.range(length)]
+        else:
+            return tuple(batches)
+
+    def __len__(self):
+        return self._length
+
+    @property
+    def arrays(self):
+        """Tuple of the arrays in shared memory."""
+        return tuple(self._arrays)
+
+    def _set_arrays(self):
+        self._arrays = []
+        for mem, dtype, shape in six.moves.zip(
+                self._mems, self._dtypes, self._shapes):
+            size = int(numpy.prod(shape))
+            array = numpy.frombuffer(mem, dtype, size).reshape(shape)
+            self._arrays.append(array)
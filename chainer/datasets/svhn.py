@@ -13,7 +13,8 @@ from chainer.datasets import tuple_dataset
 
 
 def get_svhn(withlabel=True, scale=1., dtype=numpy.float32,
-             label_dtype=numpy.int32, add_extra=False):
+             label_dtype=numpy.int32, add_extra=False,
+             cache_preprocessed=False):
     """Gets the SVHN dataset.
 
     `The Street View House Numbers (SVHN) dataset <http://ufldl.stanford.edu/housenumbers/>`_
@@ -35,6 +36,13 @@ def get_svhn(withlabel=True, scale=1., dtype=numpy.float32,
         dtype: Data type of resulting image arrays.
         label_dtype: Data type of the labels.
         add_extra: Use extra training set.
+        cache_preprocessed (bool): If ``True``, the preprocessed arrays are
+            cached in an uncompressed format for each combination of
+            ``scale``, ``dtype`` and ``label_dtype``, and they are
+            memory-mapped (copy-on-write) from the cache on subsequent calls,
+            which skips decompressing and preprocessing the data. See
+            :func:`~chainer.dataset.cache_or_load_arrays`. Note that the cache
+            of the extra training set is large (about 6.5 GB in float32).
 
     Returns:
         If ``add_extra`` is ``False``, a tuple of two datasets (train and test). Otherwise,
@@ -46,22 +54,46 @@ def get_svhn(withlabel=True, scale=1., dtype=numpy.float32,
     if not _scipy_available:
         raise RuntimeError('SciPy is not available: %s' % _error)
 
-    train_raw = _retrieve_svhn_training()
-    train = _preprocess_svhn(train_raw, withlabel, scale, dtype,
-                             label_dtype)
-    test_raw = _retrieve_svhn_test()
-    test = _preprocess_svhn(test_raw, withlabel, scale, dtype,
-                            label_dtype)
+    if cache_preprocessed:
+        def get(name, retrieve):
+            return _get_preprocessed_svhn(name, retrieve, withlabel, scale,
+                                          dtype, label_dtype)
+    else:
+        def get(name, retrieve):
+            return _preprocess_svhn(retrieve(), withlabel, scale, dtype,
+                                    label_dtype)
+
+    train = get('train', _retrieve_svhn_training)
+    test = get('test', _retrieve_svhn_test)
     if add_extra:
-        extra_raw = _retrieve_svhn_extra()
-        extra = _preprocess_svhn(extra_raw, withlabel, scale, dtype,
-                                 label_dtype)
+        extra = get('extra', _retrieve_svhn_extra)
         return train, test, extra
     else:
         return train, test
 
 
 def _preprocess_svhn(raw, withlabel, scale, image_dtype, label_dtype):
+    images, labels = _preprocess_svhn_arrays(
+        raw, scale, image_dtype, label_dtype)
+    return _make_dataset(images, labels, withlabel)
+
+
+def _get_preprocessed_svhn(name, retrieve, withlabel, scale, image_dtype,
+                           label_dtype):
+    # Caches the preprocessed arrays in the uncompressed format.
+    def creator():
+        images, labels = _preprocess_svhn_arrays(
+            retrieve(), scale, image_dtype, label_dtype)
+        return {'x': images, 'y': labels}
+
+    root = download.get_dataset_directory('pfnet/chainer/svhn')
+    params = {'scale': scale, 'dtype': image_dtype,
+              'label_dtype': label_dtype}
+    arrays = download.cache_or_load_arrays(root, name, params, creator)
+    return _make_dataset(arrays['x'], arrays['y'], withlabel)
+
+
+def _preprocess_svhn_arrays(raw, scale, image_dtype, label_dtype):
     images = raw["x"].transpose(3, 2, 0, 1)
     images = images.astype(image_dtype)
     images *= scale / 255.
@@ -70,7 +102,10 @@ def _preprocess_svhn(raw, withlabel, scale, image_dtype, label_dtype):
     # labels go from 1-10, with the digit "0" having label 10.
     # Set "0" to be label 0 to restore expected ordering
     labels[labels == 10] = 0
+    return images, labels
+
 
+def _make_dataset(images, labels, withlabel):
     if withlabel:
         return tuple_dataset.TupleDataset(images, labels)
     else:
@@ -1,3 +1,4 @@
+import contextlib
 import warnings
 import weakref
 
@@ -70,6 +71,43 @@ def force_backprop_mode():
     return configuration.using_config('enable_backprop', True)
 
 
+@contextlib.contextmanager
+def inference_mode():
+    """Make a context manager which enables the inference mode.
+
+    In this context, back-propagation is disabled as :func:`no_backprop_mode`,
+    and in addition, :meth:`FunctionNode.apply` skips the bookkeeping needed
+    only for computational graphs and debugging: it does not check input
+    types even if ``chainer.config.type_check`` is ``True``, it does not
+    validate array types of inputs and outputs, and it directly calls
+    :meth:`FunctionNode.forward` on the raw arrays. This reduces the Python
+    overhead of each function application, which dominates the latency of
+    small mini-batch inference.
+
+    If function hooks are registered or the debug mode is enabled, functions
+    are applied in the usual way. :func:`force_backprop_mode` also disables
+    the inference mode in its context.
+
+    Note that this context does not change ``chainer.config.train``. Use
+    ``chainer.using_config('train', False)`` together if needed.
+
+    >>> x = chainer.Variable(np.array([1,], np.float32))
+    >>> with chainer.inference_mode():
+    ...     y = F.relu(x + 1)
+    >>> y.creator is None
+    True
+
+    .. seealso::
+
+       See :func:`no_backprop_mode` for details on disabled back-propagation
+       mode.
+
+    """
+    with configuration.using_config('enable_backprop', False), \
+            configuration.using_config('inference', True):
+        yield
+
+
 class FunctionAdapter(function_node.FunctionNode):
 
     """Adapter class to wrap Function with FunctionNode.
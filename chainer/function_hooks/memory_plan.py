@@ -0,0 +1,442 @@
+import weakref
+
+import numpy
+import six
+
+import chainer
+from chainer.backends import cuda
+from chainer.backends import intel64
+from chainer import configuration
+from chainer import function_hook
+from chainer.functions.activation import leaky_relu
+from chainer.functions.activation import relu
+from chainer.functions.activation import sigmoid
+from chainer.functions.activation import tanh
+from chainer.functions.math import basic_math
+from chainer.functions.noise import dropout
+
+
+def _relu(function, inputs, index):
+    x, = inputs
+    xp = cuda.get_array_module(x)
+    if xp is numpy:
+        if intel64.should_use_ideep('>=auto'):
+            return None
+        numpy.maximum(x, 0, out=x)
+    else:
+        if chainer.should_use_cudnn('==always') and x.flags.c_contiguous:
+            # cuDNN retains the input.
+            return None
+        xp.maximum(x, 0, out=x)
+    function.retain_outputs((0,))
+    return x,
+
+
+def _relu_grad(function, inputs, index):
+    gy, = inputs
+    xp = cuda.get_array_module(gy)
+    if xp is numpy:
+        numpy.multiply(gy, function.b > 0, out=gy)
+    else:
+        cuda.elementwise(
+            'T y', 'T gx',
+            'gx = y > 0 ? gx : (T)0',
+            'relu_bwd_inplace')(function.b, gy)
+    return gy,
+
+
+def _leaky_relu(function, inputs, index):
+    x, = inputs
+    if function.slope < 0:
+        # The input is retained in this case.
+        return None
+    x[x < 0] *= function.slope
+    function.retain_outputs((0,))
+    return x,
+
+
+def _sigmoid(function, inputs, index):
+    x, = inputs
+    xp = cuda.get_array_module(x)
+    if (xp is not numpy and chainer.should_use_cudnn('==always') and
+            x.flags.c_contiguous):
+        return None
+    half = x.dtype.type(0.5)
+    x *= half
+    xp.tanh(x, out=x)
+    x *= half
+    x += half
+    function.retain_outputs((0,))
+    function._use_cudnn = False
+    return x,
+
+
+def _tanh(function, inputs, index):
+    x, = inputs
+    xp = cuda.get_array_module(x)
+    if (xp is not numpy and chainer.should_use_cudnn('==always') and
+            x.flags.c_contiguous):
+        return None
+    xp.tanh(x, out=x)
+    function.retain_outputs((0,))
+    function._use_cudnn = False
+    return x,
+
+
+def _dropout(function, inputs, index):
+    x, = inputs
+    if (function.mask is not None or not isinstance(x, numpy.ndarray) or
+            intel64.should_use_ideep('>=auto')):
+        return None
+    scale = x.dtype.type(1. / (1 - function.dropout_ratio))
+    flag = numpy.random.rand(*x.shape) >= function.dropout_ratio
+    function.mask = scale * flag
+    x *= function.mask
+    return x,
+
+
+def _add(function, inputs, index):
+    x = inputs[index]
+    x += inputs[1 - index]
+    return x,
+
+
+def _add_constant(function, inputs, index):
+    x, = inputs
+    x += basic_math._preprocess_const(x, function.value)
+    return x,
+
+
+def _mul_constant(function, inputs, index):
+    x, = inputs
+    x *= basic_math._preprocess_const(x, function.value)
+    return x,
+
+
+# Forward implementations which overwrite the ``index``-th input with the
+# output. They must have the same side effects as the original ones (e.g.
+# retaining the outputs), and return ``None`` to fall back to the original
+# implementation.
+_inplace_forwards = {
+    relu.ReLU: _relu,
+    relu.ReLUGrad2: _relu_grad,
+    leaky_relu.LeakyReLU: _leaky_relu,
+    sigmoid.Sigmoid: _sigmoid,
+    tanh.Tanh: _tanh,
+    dropout.Dropout: _dropout,
+    basic_math.Add: _add,
+    basic_math.AddConstant: _add_constant,
+    basic_math.MulConstant: _mul_constant,
+}
+
+
+def _buffer_owner(x):
+    # Returns the array owning the memory of a writable array.
+    if not isinstance(x, (numpy.ndarray, cuda.ndarray)):
+        return None
+    if isinstance(x, numpy.ndarray) and not x.flags.writeable:
+        return None
+    while x.base is not None:
+        x = x.base
+        if not isinstance(x, (numpy.ndarray, cuda.ndarray)):
+            return None
+    return x
+
+
+def _signature(in_data):
+    return tuple([(getattr(x, 'shape', None), getattr(x, 'dtype', None))
+                  for x in in_data])
+
+
+class _Call(object):
+
+    __slots__ = ('type', 'signature', 'inputs', 'end', 'index', 'producer')
+
+    def __init__(self, function, in_data):
+        self.type = type(function)
+        self.signature = _signature(in_data)
+        # Weak references to the arrays which can be overwritten.
+        self.inputs = None
+        # The number of calls started when this call finishes.
+        self.end = None
+        # The input overwritten by the output and its producer.
+        self.index = None
+        self.producer = None
+
+
+class MemoryPlanHook(function_hook.FunctionHook):
+    """Function hook to plan the memory usage from the liveness of arrays.
+
+    Functions like :func:`~chainer.functions.relu` and
+    :func:`~chainer.functions.add` always allocate new arrays for their
+    outputs, although their inputs are often released right after they are
+    called, e.g., the output of a batch normalization followed by a ReLU.
+    On the other hand, the arrays retained by functions for the backward
+    computation are kept alive until the whole graph is released, although
+    each of them is not needed after the backward computation of the
+    functions retaining it. This hook reduces the peak memory usage of
+    training by managing the lifetime of arrays in the two ways.
+
+    **Buffer reuse.** The first computation under the hook (i.e., the first
+    ``with`` statement) runs as usual and captures the sequence of function
+    calls. At the end of the computation, the liveness of each input array is
+    determined from the time it was released: an input of an element-wise
+    function is overwritten in place by its output if the input is the
+    output of another function in the same computation, it does not share
+    memory with other arrays, and it was released before any other function
+    was called after the element-wise function. An input retained for the
+    backward computation or referenced by the user code is never released in
+    such a timing, so it is not overwritten. The following computations under
+    the hook reuse the buffers according to the plan as long as the same
+    sequence of functions is called with the same shapes and dtypes; once the
+    sequence diverges from the captured one, the rest of the computation runs
+    without reuse. The captured computation should include the backward
+    computation, so that the arrays used in the backward computation are
+    found alive.
+
+    **Release of retained arrays.** If ``release_retained`` is ``True``, the
+    arrays retained by the functions called under the hook are released from
+    the graph right after the backward computation of the last function
+    retaining them, which runs under the hook as well. Note that the
+    backward computation cannot be repeated on the same graph in this case.
+    It is not applied when ``enable_double_backprop`` is on, and the arrays
+    of variables without creators (e.g. parameters) are not released.
+
+    .. warning::
+
+       The plan assumes that each computation under the hook runs the same
+       code. An array which is not used by any function after an
+       overwriting function must not be accessed by the user code in the
+       following computations, even if it was accessed before the next
+       function was called in the captured one.
+
+    Example:
+        Code example::
+
+            from chainer.function_hooks import MemoryPlanHook
+            hook = MemoryPlanHook()
+            for batch in batches:
+                with hook:
+                    loss = model(*batch)
+                    model.cleargrads()
+                    loss.backward()
+                optimizer.update()
+
+    Args:
+        release_retained (bool): If ``True``, the retained arrays are
+            released after the backward computation.
+
+    Attributes:
+        n_reused (int): The number of buffers reused in the last
+            computation.
+        n_released (int): The number of retained arrays released in the last
+            computation.
+
+    """
+
+    name = 'MemoryPlanHook'
+
+    def __init__(self, release_retained=True):
+        self.release_retained = release_retained
+        self._plan = None
+        self._calls = None
+        self._stack = []
+        self._n_calls = 0
+        self._diverged = False
+        self._outputs = {}
+        self._retainers = {}
+        self.n_reused = 0
+        self.n_released = 0
+
+    @property
+    def planned(self):
+        """``True`` if the plan is made from a captured computation."""
+        return self._plan is not None
+
+    def reset(self):
+        """Discards the plan to capture the next computation again."""
+        self._plan = None
+
+    def added(self, function=None):
+        if function is not None:
+            raise TypeError('MemoryPlanHook cannot be added to a function')
+        self._n_calls = 0
+        self._diverged = False
+        self._outputs = {}
+        self._retainers = {}
+        self._stack = []
+        self.n_reused = 0
+        self.n_released = 0
+        if self._plan is None:
+            self._calls = []
+
+    def deleted(self, function=None):
+        if self._plan is None:
+            self._plan = self._make_plan(self._calls)
+        self._calls = None
+        self._outputs = {}
+        self._retainers = {}
+
+    def _make_plan(self, calls):
+        for call in calls:
+            if call.inputs is not None:
+                for index, (refs, producer, released) in enumerate(
+                        call.inputs):
+                    # The array and its base should be released together.
+                    if (refs is not None and
+                            all([ref() is None for ref in refs]) and
+                            released == [call.end] * len(refs)):
+                        call.index = index
+                        call.producer = producer
+                        break
+            call.inputs = None
+        return calls
+
+    def _record(self, function, in_data):
+        call = _Call(function, in_data)
+        if type(function) in _inplace_forwards:
+            inputs = []
+            for x in in_data:
+                producer = self._find_producer(x, in_data)
+                if producer is None:
+                    inputs.append((None, None, None))
+                    continue
+                arrays = [x]
+                owner = _buffer_owner(x)
+                if owner is not x:
+                    arrays.append(owner)
+                released = []
+
+                def callback(_, released=released):
+                    released.append(self._n_calls)
+
+                try:
+                    refs = [weakref.ref(a, callback) for a in arrays]
+                except TypeError:
+                    refs = None
+                inputs.append((refs, producer, released))
+            call.inputs = inputs
+        self._calls.append(call)
+        return call
+
+    def _find_producer(self, x, in_data):
+        owner = _buffer_owner(x)
+        if owner is None:
+            return None
+        # The other inputs must not share the memory.
+        for y in in_data:
+            if y is not x and y is not None and (
+                    y is owner or getattr(y, 'base', None) is not None and
+                    _buffer_owner(y) is owner):
+                return None
+        if sum([y is x for y in in_data]) != 1:
+            return None
+        entry = self._outputs.get(id(x))
+        if entry is None or entry[0]() is not x:
+            return None
+        return entry[1]
+
+    def _planned_index(self, function, in_data, index):
+        if self._diverged:
+            return None
+        plan = self._plan
+        if index >= len(plan):
+            self._diverged = True
+            return None
+        call = plan[index]
+        if (call.type is not type(function) or
+                call.signature != _signature(in_data)):
+            self._diverged = True
+            return None
+        if call.index is None:
+            return None
+        if self._find_producer(in_data[call.index], in_data) != call.producer:
+            return None
+        return call.index
+
+    def forward_preprocess(self, function, in_data):
+        index = self._n_calls
+        self._n_calls += 1
+        if self._plan is None:
+            call = self._record(function, in_data)
+            inplace_index = None
+        else:
+            call = None
+            inplace_index = self._planned_index(function, in_data, index)
+        entry = [call, ()]
+        self._stack.append(entry)
+
+        outputs = self._outputs
+        original = type(function).forward
+        inplace = _inplace_forwards.get(type(function))
+
+        def forward(inputs):
+            # Restores the original method to avoid a reference cycle.
+            del function.forward
+            outs = None
+            if inplace_index is not None:
+                outs = inplace(function, inputs, inplace_index)
+                if outs is not None:
+                    self.n_reused += 1
+            if outs is None:
+                outs = original(function, inputs)
+            if isinstance(outs, tuple):
+                for i, y in enumerate(outs):
+                    try:
+                        outputs[id(y)] = weakref.ref(y), (index, i)
+                    except TypeError:
+                        pass
+                entry[1] = outs
+            return outs
+
+        function.forward = forward
+
+    def forward_postprocess(self, function, in_data):
+        call, outs = self._stack.pop()
+        if call is not None:
+            call.end = self._n_calls
+        if self.release_retained and configuration.config.enable_backprop:
+            # The arrays are retained after this method is called.
+            retained = []
+            if function._input_indexes_to_retain is not None:
+                retained += [in_data[i]
+                             for i in function._input_indexes_to_retain]
+            if function._output_indexes_to_retain is not None:
+                retained += [outs[i]
+                             for i in function._output_indexes_to_retain]
+            retainers = self._retainers
+            for x in retained:
+                key = id(x)
+                retainers[key] = retainers.get(key, 0) + 1
+
+    def _release(self, x):
+        # Returns True if no other function retains the array.
+        key = id(x)
+        count = self._retainers.get(key)
+        if count is None:
+            return False
+        if count > 1:
+            self._retainers[key] = count - 1
+            return False
+        del self._retainers[key]
+        self.n_released += 1
+        return True
+
+    def backward_postprocess(self, function, in_data, out_grad):
+        if not self.release_retained or configuration.config.enable_backprop:
+            return
+        if function._input_indexes_to_retain is not None:
+            for i in function._input_indexes_to_retain:
+                node = function.inputs[i]
+                x = in_data[i]
+                if (x is not None and node.creator_node is not None and
+                        self._release(x)):
+                    node._data = None
+        retained_data = function._retained_output_data
+        if retained_data is not None:
+            function._retained_output_data = None
+            for i, x in six.moves.zip(function._output_indexes_to_retain,
+                                      retained_data):
+                node = function.outputs[i]()
+                if self._release(x) and node is not None:
+                    node._data = None
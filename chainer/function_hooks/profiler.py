@@ -0,0 +1,416 @@
+import collections
+import json
+import sys
+import time
+import weakref
+
+import six
+
+from chainer.backends import cuda
+from chainer import function_hook
+
+try:
+    import tracemalloc
+    _tracemalloc_available = True
+except ImportError:
+    _tracemalloc_available = False
+
+
+if hasattr(time, 'perf_counter_ns'):
+    _clock = time.perf_counter_ns
+elif hasattr(time, 'perf_counter'):
+    def _clock():
+        return int(time.perf_counter() * 1e9)
+else:
+    def _clock():
+        return int(time.time() * 1e9)
+
+
+class _Record(object):
+
+    __slots__ = ('occurrence', 'elapsed_time', 'self_time', 'max_time',
+                 'memory_samples', 'peak_memory', 'total_peak_memory')
+
+    def __init__(self):
+        self.occurrence = 0
+        self.elapsed_time = 0
+        self.self_time = 0
+        self.max_time = 0
+        self.memory_samples = 0
+        self.peak_memory = 0
+        self.total_peak_memory = 0
+
+
+def _open(file):
+    if isinstance(file, six.string_types):
+        return open(file, 'w')
+    return None
+
+
+class ProfilerHook(function_hook.FunctionHook):
+    """Function hook for profiling functions by links.
+
+    This hook measures the elapsed time of forward and backward computation
+    of each function with a high resolution clock and attributes it to the
+    link which calls the function, e.g., ``predictor/res3/a/conv1``. The
+    measurements are aggregated in place for each combination of the link
+    path, the function name and the phase (``'forward'`` or
+    ``'backward'``), so the memory consumption does not grow with the number
+    of calls. It is suitable for profiling long training runs.
+
+    A function taking a parameter of ``link`` or its descendant links is
+    attributed to the link which has the parameter. A function without
+    parameters (e.g. an activation function) is attributed to the parent of
+    the link which most recently ran a function with parameters, and its
+    backward computation is attributed to the same link as its forward
+    computation. Functions called in the computation of another function
+    without parameters are attributed to the same link as the caller, and
+    those called in the backward computation are recorded as the backward
+    phase.
+
+    Optionally, the hook samples host memory allocations of top-level
+    function calls with :mod:`tracemalloc`, and records the most recent
+    calls to be exported as a Chrome trace.
+
+    Example:
+        Code example::
+
+            from chainer.function_hooks import ProfilerHook
+            hook = ProfilerHook(model, trace_size=10000)
+            with hook:
+                trainer.run()
+            hook.print_report(depth=2)
+            hook.export_chrome_trace('trace.json')
+
+        Output example::
+
+                          Link     Forward    Backward  Occurrence
+                        (root)      3.46sec     6.42sec       52000
+                     predictor      3.21sec     6.13sec       50000
+                predictor/res2    704.15ms      1.37sec       11000
+                ...
+
+        where *Forward* and *Backward* are the elapsed times of functions
+        attributed to the link and its descendants, and *Occurrence* is the
+        number of calls.
+
+    Args:
+        link (~chainer.Link): The root link whose descendants are the
+            targets of the attribution. If it is ``None``, all functions
+            are attributed to the root.
+        trace_size (int): The maximum number of the most recent calls
+            recorded for :meth:`export_chrome_trace`. If it is ``0``, no
+            call is recorded.
+        memory_sampling_interval (int): If it is positive, host memory
+            allocations are traced with :mod:`tracemalloc` in every
+            ``memory_sampling_interval``-th top-level function call. Note
+            that the sampled calls run slower while tracing.
+        sync (bool): If ``True``, the GPU device is synchronized before and
+            after each function so that the elapsed time of GPU computation
+            is measured. Otherwise, only the time to launch kernels is
+            measured for GPU arrays.
+
+    """
+
+    name = 'ProfilerHook'
+
+    def __init__(self, link=None, trace_size=0, memory_sampling_interval=0,
+                 sync=False):
+        if memory_sampling_interval > 0 and not _tracemalloc_available:
+            raise RuntimeError(
+                'tracemalloc is required for memory sampling')
+        self.link = link
+        self.trace_size = trace_size
+        self.memory_sampling_interval = memory_sampling_interval
+        self.sync = sync
+
+        self._records = {}
+        self._stack = []
+        self._paths = weakref.WeakKeyDictionary()
+        self._current_path = ''
+        self._backward_depth = 0
+        self._param_paths = None
+        self._uninitialized_params = []
+        self._sample_param = None
+        self._n_calls = 0
+        self._total_time = 0
+        self._origin = _clock()
+        self._trace = collections.deque(maxlen=trace_size)
+
+    def _update_param_paths(self):
+        param_paths = {}
+        uninitialized = []
+        for name, param in self.link.namedparams():
+            path = name[1:].rpartition('/')[0]
+            if param.array is None:
+                uninitialized.append(param)
+            else:
+                param_paths[id(param.array)] = (path, param)
+        self._param_paths = param_paths
+        # Lazily initialized parameters are registered after initialization.
+        self._uninitialized_params = uninitialized
+        # Parameters are sent to another device all at once, which is
+        # detected by the array of one of them.
+        self._sample_param = None
+        for _, param in six.itervalues(param_paths):
+            self._sample_param = (param, param.array)
+            break
+
+    def _param_paths_outdated(self):
+        for param in self._uninitialized_params:
+            if param.array is not None:
+                return True
+        sample = self._sample_param
+        return sample is not None and sample[0].array is not sample[1]
+
+    def _lookup_link_path(self, arrays):
+        param_paths = self._param_paths
+        for x in arrays:
+            entry = param_paths.get(id(x))
+            if entry is not None and entry[1].array is x:
+                return entry[0]
+        return None
+
+    def _find_link_path(self, arrays):
+        if self.link is None:
+            return None
+        if self._param_paths is None:
+            self._update_param_paths()
+        path = self._lookup_link_path(arrays)
+        # The map is rebuilt only if it misses parameters initialized or
+        # sent to another device after it is built.
+        if path is None and self._param_paths_outdated():
+            self._update_param_paths()
+            path = self._lookup_link_path(arrays)
+        return path
+
+    def _synchronize(self, arrays):
+        for x in arrays:
+            if isinstance(x, cuda.ndarray):
+                x.device.synchronize()
+                return
+
+    def _begin(self, function, path, phase, arrays):
+        sampled = False
+        if not self._stack and self.memory_sampling_interval > 0:
+            self._n_calls += 1
+            if (self._n_calls % self.memory_sampling_interval == 0 and
+                    not tracemalloc.is_tracing()):
+                tracemalloc.start()
+                sampled = True
+        if self.sync:
+            self._synchronize(arrays)
+        self._stack.append(
+            [(path, function._impl_name, phase), _clock(), 0, sampled])
+
+    def _end(self, arrays):
+        if self.sync:
+            self._synchronize(arrays)
+        end = _clock()
+        key, start, child_time, sampled = self._stack.pop()
+        elapsed_time = end - start
+
+        record = self._records.get(key)
+        if record is None:
+            record = self._records[key] = _Record()
+        record.occurrence += 1
+        record.elapsed_time += elapsed_time
+        record.self_time += elapsed_time - child_time
+        if elapsed_time > record.max_time:
+            record.max_time = elapsed_time
+        if sampled:
+            peak = tracemalloc.get_traced_memory()[1]
+            tracemalloc.stop()
+            record.memory_samples += 1
+            record.total_peak_memory += peak
+            if peak > record.peak_memory:
+                record.peak_memory = peak
+
+        if self._stack:
+            self._stack[-1][2] += elapsed_time
+        else:
+            self._total_time += elapsed_time
+        if self.trace_size > 0:
+            self._trace.append(
+                (key, start - self._origin, elapsed_time, len(self._stack)))
+
+    def forward_preprocess(self, function, in_data):
+        path = self._find_link_path(in_data)
+        if path is None:
+            if self._stack:
+                # Nested calls are attributed to the calling function.
+                path = self._stack[-1][0][0]
+            else:
+                path = self._current_path
+        elif self._backward_depth == 0:
+            self._current_path = path.rpartition('/')[0]
+        phase = 'backward' if self._backward_depth > 0 else 'forward'
+        self._paths[function] = path
+        self._begin(function, path, phase, in_data)
+
+    def forward_postprocess(self, function, in_data):
+        self._end(in_data)
+
+    def backward_preprocess(self, function, in_data, out_grad):
+        path = self._paths.get(function)
+        if path is None:
+            path = self._find_link_path(in_data) or ''
+        self._backward_depth += 1
+        self._begin(function, path, 'backward', in_data + out_grad)
+
+    def backward_postprocess(self, function, in_data, out_grad):
+        self._backward_depth -= 1
+        self._end(in_data + out_grad)
+
+    def total_time(self):
+        """Returns total elapsed time in seconds."""
+        return self._total_time * 1e-9
+
+    def summary(self):
+        """Returns a summary of the profile of each function.
+
+        Returns:
+            A dictionary whose keys are tuples of the link path, the function
+            name and the phase, and values are dictionaries of
+            ``elapsed_time``, ``self_time`` (the elapsed time excluding
+            nested function calls), ``max_time`` (in seconds) and
+            ``occurrence``. If memory sampling is enabled, the values also
+            contain ``memory_samples``, ``peak_memory`` and
+            ``mean_peak_memory``, which are the number of sampled calls and
+            the maximum and the mean of the peak sizes of the host memory
+            allocated in the sampled calls in bytes.
+
+        """
+        summary = {}
+        for key, record in six.iteritems(self._records):
+            entry = {
+                'elapsed_time': record.elapsed_time * 1e-9,
+                'self_time': record.self_time * 1e-9,
+                'max_time': record.max_time * 1e-9,
+                'occurrence': record.occurrence,
+            }
+            if self.memory_sampling_interval > 0:
+                entry['memory_samples'] = record.memory_samples
+                entry['peak_memory'] = record.peak_memory
+                entry['mean_peak_memory'] = (
+                    record.total_peak_memory / record.memory_samples
+                    if record.memory_samples else 0)
+            summary[key] = entry
+        return summary
+
+    def link_summary(self, depth=None):
+        """Returns a hierarchical summary of the profile of each link.
+
+        The elapsed time of each function (excluding nested function calls)
+        is accumulated to the link it is attributed to and all the ancestors
+        of the link. The root link is represented by an empty path.
+
+        Args:
+            depth (int): If it is given, links deeper than ``depth`` are
+                merged to their ancestors.
+
+        Returns:
+            A dictionary whose keys are link paths and values are
+            dictionaries of ``forward`` and ``backward`` (elapsed times in
+            seconds) and ``occurrence``.
+
+        """
+        summary = {}
+        for (path, _, phase), record in six.iteritems(self._records):
+            names = path.split('/') if path else []
+            if depth is not None:
+                names = names[:depth]
+            for i in six.moves.range(len(names) + 1):
+                prefix = '/'.join(names[:i])
+                entry = summary.get(prefix)
+                if entry is None:
+                    entry = summary[prefix] = {
+                        'forward': 0., 'backward': 0., 'occurrence': 0}
+                entry[phase] += record.self_time * 1e-9
+                entry['occurrence'] += record.occurrence
+        return summary
+
+    def _humanized_time(self, second):
+        """Returns a human readable time."""
+        for unit in ['sec', 'ms', 'us']:
+            if second >= 1:
+                return '%3.2f%s' % (second, unit)
+            second *= 1000.0
+        return '%.2f%s' % (second, 'ns')
+
+    def print_report(self, file=sys.stdout, depth=None):
+        """Prints a hierarchical report of the profile of links.
+
+        Args:
+            file: Output file.
+            depth (int): If it is given, links deeper than ``depth`` are
+                merged to their ancestors.
+
+        """
+        entries = [['Link', 'Forward', 'Backward', 'Occurrence']]
+        for path, record in sorted(self.link_summary(depth).items()):
+            entries.append([
+                path or '(root)',
+                self._humanized_time(record['forward']),
+                self._humanized_time(record['backward']),
+                str(record['occurrence'])])
+        entry_widths = [max(len(e[i]) for e in entries) for i in range(4)]
+        template = '  '.join('{:>%d}' % w for w in entry_widths)
+        for entry in entries:
+            file.write(template.format(*entry))
+            file.write('\n')
+        file.flush()
+
+    def export_chrome_trace(self, file):
+        """Exports the recorded calls in the Chrome trace event format.
+
+        The output can be loaded by ``chrome://tracing``. Only the most
+        recent ``trace_size`` calls are exported.
+
+        Args:
+            file: A file name or a file object to write.
+
+        """
+        events = []
+        for (path, name, phase), start, elapsed_time, depth in self._trace:
+            events.append({
+                'name': name,
+                'cat': phase,
+                'ph': 'X',
+                'ts': start / 1000.,
+                'dur': elapsed_time / 1000.,
+                'pid': 0,
+                'tid': 0,
+                'args': {'link': path, 'depth': depth},
+            })
+        f = _open(file)
+        try:
+            json.dump({'traceEvents': events}, f or file)
+        finally:
+            if f is not None:
+                f.close()
+
+    def export_flamegraph(self, file):
+        """Exports the profile in the folded stack format.
+
+        Each line consists of the link path and the function name separated
+        by semicolons, followed by the elapsed time (excluding nested
+        function calls) in microseconds. The output can be rendered by
+        ``flamegraph.pl`` or compatible tools.
+
+        Args:
+            file: A file name or a file object to write.
+
+        """
+        lines = []
+        for (path, name, phase), record in six.iteritems(self._records):
+            stack = ['(root)'] + (path.split('/') if path else [])
+            stack.append('%s (%s)' % (name, phase))
+            lines.append('%s %d\n' % (';'.join(stack),
+                                      record.self_time // 1000))
+        f = _open(file)
+        try:
+            (f or file).writelines(sorted(lines))
+        finally:
+            if f is not None:
+                f.close()
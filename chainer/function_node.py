@@ -221,6 +221,9 @@ Use apply() method instead.\
             A tuple of output :class:`~chainer.Variable` objects.
 
         """
+        if configuration.config.inference and self._can_apply_inference():
+            return self._apply_inference(inputs)
+
         input_vars = [chainer.as_variable(x) for x in inputs]
         in_data = tuple([x.data for x in input_vars])
         requires_grad = any([x.requires_grad for x in input_vars])
@@ -313,15 +316,45 @@ Use apply() method instead.\
 
         return ret
 
+    def _can_apply_inference(self):
+        # The inference path is used only if nothing observes the function
+        # application, i.e., no graph is built and no hooks are registered.
+        config = configuration.config
+        return not (config.enable_backprop or config.debug or
+                    self._n_local_function_hooks > 0 or
+                    chainer.get_function_hooks())
+
+    def _apply_inference(self, inputs):
+        # Light-weight version of apply used in the inference mode. It skips
+        # the type check, function hooks and array type validation, and
+        # directly calls forward on raw arrays.
+        in_data = tuple([x.data if isinstance(x, variable.Variable) else x
+                         for x in inputs])
+        with cuda.get_device_from_array(*in_data):
+            self._input_indexes_to_retain = None
+            self._output_indexes_to_retain = None
+            outputs = self.forward(in_data)
+
+        if not isinstance(outputs, tuple):
+            raise TypeError(
+                'forward output must be a tuple ({})\n'
+                'Actual: {}'.format(self.label, type(outputs)))
+        return tuple([variable.Variable(y, requires_grad=False)
+                      for y in outputs])
+
     def _check_data_type_forward(self, in_data):
-        in_type = type_check.get_light_types(in_data)
+        in_type = type_check.LightTypeInfoTuple(in_data)
+        # Equivalent to ``with type_check.light_mode``, inlined as this is
+        # called on every function application.
+        type_check._thread_local.light_mode = True
         try:
-            with type_check.light_mode:
-                self.check_type_forward(in_type)
+            self.check_type_forward(in_type)
             return
         except type_check.InvalidType:
             # Ignore errors on first run
             pass
+        finally:
+            type_check._thread_local.light_mode = False
 
         in_type = type_check.get_types(in_data, 'in_types', False)
         with type_check.get_function_check_context(self):
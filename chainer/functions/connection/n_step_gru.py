@@ -316,11 +316,19 @@ def n_step_gru_base(n_layers, dropout_ratio, hx, ws, bs, xs,
 
 
 def _gru(x, h, c, w, b):
+    return _gru_cell(x, h, c, _gru_weight(w, b))
+
+
+def _gru_weight(w, b):
     xw = concat.concat([w[0], w[1], w[2]], axis=0)
     hw = concat.concat([w[3], w[4], w[5]], axis=0)
     xb = concat.concat([b[0], b[1], b[2]], axis=0)
     hb = concat.concat([b[3], b[4], b[5]], axis=0)
+    return xw, hw, xb, hb
+
 
+def _gru_cell(x, h, c, weight):
+    xw, hw, xb, hb = weight
     gru_x = linear.linear(x, xw, xb)
     gru_h = linear.linear(h, hw, hb)
 
@@ -447,10 +447,19 @@ def n_step_lstm_base(
 
 
 def _lstm(x, h, c, w, b):
+    return _lstm_cell(x, h, c, _lstm_weight(w, b))
+
+
+def _lstm_weight(w, b):
     xw = _stack_weight([w[2], w[0], w[1], w[3]])
     hw = _stack_weight([w[6], w[4], w[5], w[7]])
     xb = _stack_weight([b[2], b[0], b[1], b[3]])
     hb = _stack_weight([b[6], b[4], b[5], b[7]])
+    return xw, hw, xb, hb
+
+
+def _lstm_cell(x, h, c, weight):
+    xw, hw, xb, hb = weight
     lstm_in = linear.linear(x, xw, xb) + linear.linear(h, hw, hb)
     c_bar, h_bar = lstm.lstm(c, lstm_in)
     return h_bar, c_bar
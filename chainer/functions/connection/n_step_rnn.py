@@ -867,13 +867,7 @@ def n_step_rnn_base(n_layers, dropout_ratio, hx, ws, bs, xs,
     else:
 
         def f(x, h, c, w, b):
-            xw, hw = w
-            xb, hb = b
-            rnn_in = linear.linear(x, xw, xb) + linear.linear(h, hw, hb)
-            if activation == 'tanh':
-                return tanh.tanh(rnn_in), None
-            elif activation == 'relu':
-                return relu.relu(rnn_in), None
+            return _rnn_cell(x, h, c, _rnn_weight(w, b), activation)
 
         hy, _, ys = n_step_rnn_impl(
             f, n_layers, dropout_ratio, hx, None, ws, bs, xs, use_bi_direction)
@@ -934,6 +928,21 @@ def n_step_rnn_impl(
     return hy, cy, tuple(ys)
 
 
+def _rnn_weight(w, b):
+    xw, hw = w
+    xb, hb = b
+    return xw, hw, xb, hb
+
+
+def _rnn_cell(x, h, c, weight, activation):
+    xw, hw, xb, hb = weight
+    rnn_in = linear.linear(x, xw, xb) + linear.linear(h, hw, hb)
+    if activation == 'tanh':
+        return tanh.tanh(rnn_in), None
+    elif activation == 'relu':
+        return relu.relu(rnn_in), None
+
+
 def _one_directional_loop(f, xs, h, c, w, b):
     h_list = []
     for x in xs:
@@ -0,0 +1,446 @@
+import functools
+
+import numpy
+import six
+
+import chainer
+from chainer import function
+from chainer.functions.activation import relu
+from chainer.functions.activation import sigmoid
+from chainer.functions.activation import tanh
+from chainer.functions.math import basic_math
+from chainer.functions.math import exponential
+from chainer.functions.math import sqrt
+from chainer.functions.math import square
+from chainer import variable
+
+
+# Each elementwise operation is described by a tuple of
+# ``(n_inputs, needs, forward, backward)``.
+#
+# ``needs`` is a string containing ``'x'`` and/or ``'y'`` and tells which
+# of the inputs and the output are used in ``backward``.
+#
+# ``forward(xs, c, out)`` writes the result to ``out``, which may be one of
+# ``xs``. ``c`` is the scalar constant of the operation cast to the dtype of
+# the input.
+#
+# ``backward(xs, y, c, gy, owned)`` returns a list of ``(gx, owned)`` pairs.
+# ``owned`` tells whether the array is a temporary of the fused backward
+# which can be overwritten. ``gy`` may be overwritten only if it is owned.
+
+def _unary(ufunc):
+    def forward(xs, c, out):
+        ufunc(xs[0], out=out)
+    return forward
+
+
+def _binary(ufunc):
+    def forward(xs, c, out):
+        ufunc(xs[0], xs[1], out=out)
+    return forward
+
+
+def _scale(gy, owned, c):
+    if owned:
+        gy *= c
+        return gy
+    return gy * c
+
+
+def _sigmoid_forward(xs, c, out):
+    half = out.dtype.type(0.5)
+    numpy.multiply(xs[0], half, out=out)
+    numpy.tanh(out, out=out)
+    out *= half
+    out += half
+
+
+def _div_backward(xs, y, c, gy, owned):
+    gx0 = numpy.divide(gy, xs[1], out=gy if owned else None)
+    gx1 = gx0 * xs[0]
+    gx1 /= xs[1]
+    numpy.negative(gx1, out=gx1)
+    return [(gx0, True), (gx1, True)]
+
+
+def _div_from_constant_backward(xs, y, c, gy, owned):
+    gx = numpy.divide(gy, xs[0], out=gy if owned else None)
+    gx /= xs[0]
+    gx *= -c
+    return [(gx, True)]
+
+
+def _pow_backward(xs, y, c, gy, owned):
+    gx = xs[0] ** (c - 1)
+    gx *= c
+    gx *= gy
+    return [(gx, True)]
+
+
+def _sigmoid_backward(xs, y, c, gy, owned):
+    gx = 1 - y
+    gx *= y
+    gx *= gy
+    return [(gx, True)]
+
+
+def _tanh_backward(xs, y, c, gy, owned):
+    gx = y * y
+    numpy.subtract(1, gx, out=gx)
+    gx *= gy
+    return [(gx, True)]
+
+
+def _sqrt_backward(xs, y, c, gy, owned):
+    gx = y * 2
+    numpy.divide(gy, gx, out=gx)
+    return [(gx, True)]
+
+
+def _square_backward(xs, y, c, gy, owned):
+    gx = xs[0] * 2
+    gx *= gy
+    return [(gx, True)]
+
+
+_ops = {
+    basic_math.Neg: (
+        1, '', _unary(numpy.negative),
+        lambda xs, y, c, gy, owned: [
+            (numpy.negative(gy, out=gy if owned else None), True)]),
+    basic_math.Add: (
+        2, '', _binary(numpy.add),
+        lambda xs, y, c, gy, owned: [(gy, False), (gy, False)]),
+    basic_math.AddConstant: (
+        1, '', lambda xs, c, out: numpy.add(xs[0], c, out=out),
+        lambda xs, y, c, gy, owned: [(gy, owned)]),
+    basic_math.Sub: (
+        2, '', _binary(numpy.subtract),
+        lambda xs, y, c, gy, owned: [(gy, False), (-gy, True)]),
+    basic_math.SubFromConstant: (
+        1, '', lambda xs, c, out: numpy.subtract(c, xs[0], out=out),
+        lambda xs, y, c, gy, owned: [
+            (numpy.negative(gy, out=gy if owned else None), True)]),
+    basic_math.Mul: (
+        2, 'x', _binary(numpy.multiply),
+        lambda xs, y, c, gy, owned: [
+            (gy * xs[1], True),
+            (numpy.multiply(gy, xs[0], out=gy if owned else None), True)]),
+    basic_math.MulConstant: (
+        1, '', lambda xs, c, out: numpy.multiply(xs[0], c, out=out),
+        lambda xs, y, c, gy, owned: [(_scale(gy, owned, c), True)]),
+    basic_math.Div: (
+        2, 'x', _binary(numpy.divide), _div_backward),
+    basic_math.DivFromConstant: (
+        1, 'x', lambda xs, c, out: numpy.divide(c, xs[0], out=out),
+        _div_from_constant_backward),
+    basic_math.PowVarConst: (
+        1, 'x', lambda xs, c, out: numpy.power(xs[0], c, out=out),
+        _pow_backward),
+    relu.ReLU: (
+        1, 'y', lambda xs, c, out: numpy.maximum(xs[0], 0, out=out),
+        lambda xs, y, c, gy, owned: [
+            (numpy.multiply(gy, y > 0, out=gy if owned else None), True)]),
+    sigmoid.Sigmoid: (
+        1, 'y', _sigmoid_forward, _sigmoid_backward),
+    tanh.Tanh: (
+        1, 'y', _unary(numpy.tanh), _tanh_backward),
+    exponential.Exp: (
+        1, 'y', _unary(numpy.exp),
+        lambda xs, y, c, gy, owned: [
+            (numpy.multiply(gy, y, out=gy if owned else None), True)]),
+    exponential.Log: (
+        1, 'x', _unary(numpy.log),
+        lambda xs, y, c, gy, owned: [
+            (numpy.divide(gy, xs[0], out=gy if owned else None), True)]),
+    sqrt.Sqrt: (
+        1, 'y', _unary(numpy.sqrt), _sqrt_backward),
+    square.Square: (
+        1, 'x', _unary(numpy.square), _square_backward),
+}
+
+
+class _Program(object):
+
+    """Straight-line program of elementwise operations.
+
+    Slots ``0, ..., n_in - 1`` hold the inputs and slot ``n_in + i`` holds
+    the output of the ``i``-th operation.
+
+    """
+
+    def __init__(self, n_in, ops, outputs):
+        self.n_in = n_in
+        self.ops = ops
+        self.outputs = outputs
+        self._plans = {}
+
+    def plan(self, retain):
+        """Computes the slots to release before each operation.
+
+        The buffer of a released slot is reused by the following operations,
+        so that an operation whose input dies there is computed in-place.
+
+        """
+        if retain in self._plans:
+            return self._plans[retain]
+        n_slots = self.n_in + len(self.ops)
+        last_use = [None] * n_slots
+        for i, (op, in_slots, _) in enumerate(self.ops):
+            for s in in_slots:
+                last_use[s] = i
+        keep = set(six.moves.range(self.n_in))
+        keep.update(self.outputs)
+        if retain:
+            for i, (op, in_slots, _) in enumerate(self.ops):
+                needs = _ops[op][1]
+                if 'x' in needs:
+                    keep.update(in_slots)
+                if 'y' in needs:
+                    keep.add(self.n_in + i)
+        release = [[] for _ in self.ops]
+        for s in six.moves.range(n_slots):
+            if s in keep:
+                continue
+            if last_use[s] is None:
+                # Unused intermediate; it can be reused right after it is
+                # computed.
+                if s + 1 - self.n_in < len(self.ops):
+                    release[s + 1 - self.n_in].append(s)
+            else:
+                release[last_use[s]].append(s)
+        self._plans[retain] = release
+        return release
+
+    def forward(self, inputs, retain):
+        release = self.plan(retain)
+        values = list(inputs) + [None] * len(self.ops)
+        pool = []
+        for i, (op, in_slots, c) in enumerate(self.ops):
+            xs = [values[s] for s in in_slots]
+            for s in release[i]:
+                pool.append(values[s])
+                values[s] = None
+            x = xs[0]
+            out = None
+            for j, buf in enumerate(pool):
+                if buf.shape == x.shape and buf.dtype == x.dtype:
+                    out = pool.pop(j)
+                    break
+            if out is None:
+                out = numpy.empty_like(x)
+            if c is not None:
+                c = x.dtype.type(c)
+            _ops[op][2](xs, c, out)
+            values[self.n_in + i] = out
+        return values
+
+    def backward(self, values, grad_outputs):
+        n_in = self.n_in
+        grads = [None] * (n_in + len(self.ops))
+        owned = [False] * len(grads)
+
+        def accumulate(s, g, g_owned):
+            if grads[s] is None:
+                grads[s] = g
+                owned[s] = g_owned
+            elif owned[s]:
+                grads[s] += g
+            else:
+                grads[s] = grads[s] + g
+                owned[s] = True
+
+        for s, gy in six.moves.zip(self.outputs, grad_outputs):
+            if gy is not None:
+                accumulate(s, gy, False)
+        for i in six.moves.range(len(self.ops) - 1, -1, -1):
+            op, in_slots, c = self.ops[i]
+            gy = grads[n_in + i]
+            if gy is None:
+                continue
+            grads[n_in + i] = None
+            xs = [values[s] for s in in_slots]
+            if c is not None:
+                c = gy.dtype.type(c)
+            gxs = _ops[op][3](xs, values[n_in + i], c, gy, owned[n_in + i])
+            for s, (gx, gx_owned) in six.moves.zip(in_slots, gxs):
+                accumulate(s, gx, gx_owned)
+        return grads[:n_in]
+
+
+class FusedElementwise(function.Function):
+
+    """Function computing a fused chain of elementwise operations on CPU."""
+
+    def __init__(self, program):
+        self.program = program
+
+    def forward_cpu(self, inputs):
+        retain = chainer.config.enable_backprop
+        values = self.program.forward(inputs, retain)
+        if retain:
+            self._values = values
+        outputs = []
+        for s in self.program.outputs:
+            y = values[s]
+            if s < self.program.n_in or any(y is o for o in outputs):
+                y = y.copy()
+            outputs.append(y)
+        return tuple(outputs)
+
+    def backward_cpu(self, inputs, grad_outputs):
+        return tuple(self.program.backward(self._values, grad_outputs))
+
+
+def _as_array(x):
+    if isinstance(x, variable.Variable):
+        return x.array
+    return x
+
+
+def _trace(func, args):
+    """Runs ``func`` once and compiles its graph into a program.
+
+    It returns a tuple of the program, the variables captured by ``func``
+    (e.g. parameters of links), and whether ``func`` returns a tuple. The
+    program is ``None`` if the graph contains unsupported operations.
+
+    """
+    xs = [variable.Variable(_as_array(a)) for a in args]
+    with chainer.force_backprop_mode():
+        ys = func(*xs)
+    return_tuple = isinstance(ys, tuple)
+    if not return_tuple:
+        ys = ys,
+    if not all(isinstance(y, variable.Variable) for y in ys):
+        return None, (), return_tuple
+
+    slots = {id(x.node): i for i, x in enumerate(xs)}
+    captured = []
+    ops = []
+    # Leaf variables are assigned slots on the first visit and functions in
+    # post-order, which is a topological order of the graph.
+    node_slots = {}
+    leaves = []
+
+    def visit(node):
+        key = id(node)
+        if key in slots or key in node_slots:
+            return True
+        creator = node.creator_node
+        if creator is None:
+            var = node.get_variable_or_none()
+            if var is None:
+                return False
+            leaves.append((key, var))
+            return True
+        op = type(creator)
+        if op not in _ops or len(creator.inputs) != _ops[op][0]:
+            return False
+        c = getattr(creator, 'value', None)
+        if c is not None and not numpy.isscalar(c):
+            return False
+        for x in creator.inputs:
+            if not visit(x):
+                return False
+        node_slots[key] = (op, creator, c)
+        ops.append(key)
+        return True
+
+    for y in ys:
+        if not visit(y.node):
+            return None, (), return_tuple
+
+    for key, var in leaves:
+        slots[key] = len(slots)
+        captured.append(var)
+    n_in = len(slots)
+    program_ops = []
+    for key in ops:
+        op, creator, c = node_slots[key]
+        in_slots = [slots[id(x)] for x in creator.inputs]
+        slots[key] = n_in + len(program_ops)
+        program_ops.append((op, in_slots, c))
+    outputs = [slots[id(y.node)] for y in ys]
+    program = _Program(n_in, program_ops, outputs)
+    return program, tuple(captured), return_tuple
+
+
+def fuse(func):
+    """Decorator fusing a chain of elementwise functions on CPU.
+
+    The decorated function is traced at the first call for each combination
+    of the shapes and dtypes of the arguments, and the elementwise
+    operations in its computational graph are compiled into a single
+    function node. The fused node computes the operations with in-place
+    NumPy ufuncs, reusing the buffers of dead intermediate results, and runs
+    one combined backward computation. Intermediate results required by
+    the backward computation are kept only when
+    ``chainer.config.enable_backprop`` is ``True``.
+
+    The following operations can be fused: arithmetic operators with
+    variables or scalars, :func:`~chainer.functions.relu`,
+    :func:`~chainer.functions.sigmoid`, :func:`~chainer.functions.tanh`,
+    :func:`~chainer.functions.exp`, :func:`~chainer.functions.log`,
+    :func:`~chainer.functions.sqrt` and :func:`~chainer.functions.square`.
+    Variables not given as arguments, e.g. parameters of links, are
+    captured as additional inputs of the fused node.
+
+    If the graph contains other operations, or the arguments are not NumPy
+    arrays, the function is called as is. Use
+    :func:`chainer.backends.cuda.fuse` for the fusion on GPU.
+
+    .. admonition:: Example
+
+       >>> @F.fuse
+       ... def f(x, a, b):
+       ...     return F.relu(x * a + b)
+       >>> x = chainer.Variable(np.arange(-3, 3, dtype=np.float32))
+       >>> a = np.full(6, 2, dtype=np.float32)
+       >>> b = np.ones(6, dtype=np.float32)
+       >>> y = f(x, a, b)
+       >>> y.array
+       array([0., 0., 0., 1., 3., 5.], dtype=float32)
+       >>> y.creator.label
+       'FusedElementwise'
+
+    .. note::
+
+        Like :func:`cupy.fuse`, the traced graph is reused for arguments of
+        the same shapes and dtypes. ``func`` must not change its operations
+        or scalar constants between calls.
+
+    Args:
+        func (callable): A function that takes :class:`~chainer.Variable`
+            objects and returns a :class:`~chainer.Variable` or a tuple of
+            them.
+
+    Returns:
+        callable: The fused function.
+
+    """
+    programs = {}
+
+    @functools.wraps(func)
+    def wrapper(*args):
+        arrays = [_as_array(a) for a in args]
+        if not arrays or not all(
+                isinstance(a, numpy.ndarray) for a in arrays):
+            return func(*args)
+        key = tuple((a.shape, a.dtype) for a in arrays)
+        entry = programs.get(key)
+        if entry is None:
+            entry = programs[key] = _trace(func, args)
+        program, captured, return_tuple = entry
+        if program is None or any(
+                not isinstance(v.array, numpy.ndarray) for v in captured):
+            return func(*args)
+        ys = FusedElementwise(program)(*(args + captured))
+        if not isinstance(ys, tuple):
+            ys = ys,
+        if return_tuple:
+            return ys
+        return ys[0]
+
+    return wrapper
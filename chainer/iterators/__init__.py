@@ -1,4 +1,5 @@
 # import classes and functions
+from chainer.iterators.chunk_shuffle_iterator import ChunkShuffleIterator  # NOQA
 from chainer.iterators.multiprocess_iterator import MultiprocessIterator  # NOQA
 from chainer.iterators.multithread_iterator import MultithreadIterator  # NOQA
 from chainer.iterators.serial_iterator import SerialIterator  # NOQA
@@ -0,0 +1,191 @@
+from __future__ import division
+
+import numpy
+import six
+
+from chainer.dataset import iterator
+from chainer import serializer as serializer_module
+
+
+class ChunkShuffleIterator(iterator.Iterator):
+
+    """Dataset iterator that shuffles examples by chunks for sequential reads.
+
+    This is an implementation of :class:`~chainer.dataset.Iterator` for
+    datasets stored on slow storage like HDDs and network file systems, where
+    reading the examples in a fully random order is much slower than reading
+    them sequentially.
+
+    The dataset is divided into chunks of ``chunk_size`` contiguous examples.
+    In each epoch, the chunks are read in a shuffled order, each by one slice
+    of the dataset (e.g. a single read for
+    :class:`~chainer.datasets.RecordDataset`), and the examples are drawn at
+    random from a buffer of at most ``buffer_size`` examples, to which the
+    examples of each chunk are added. Larger buffers and smaller chunks make
+    the order closer to a uniform shuffle, while larger chunks make the reads
+    more sequential. The examples in the buffer are kept in memory.
+
+    The order of examples in each epoch is determined at its beginning, and
+    it is saved in snapshots, so that the iteration is resumed exactly; the
+    buffer is refilled by reading the chunks that are not consumed yet.
+
+    Args:
+        dataset: Dataset to iterate.
+        batch_size (int): Number of examples within each batch.
+        repeat (bool): If ``True``, it infinitely loops over the dataset.
+            Otherwise, it stops iteration at the end of the first epoch.
+        shuffle (bool): If ``True``, the order of examples is shuffled by
+            chunks at the beginning of each epoch. Otherwise, examples are
+            extracted in the order of indexes.
+        chunk_size (int): Number of contiguous examples read at once.
+        buffer_size (int): Number of examples to shuffle in memory.
+
+    """
+
+    def __init__(self, dataset, batch_size, repeat=True, shuffle=True,
+                 chunk_size=256, buffer_size=4096):
+        if chunk_size < 1:
+            raise ValueError('chunk_size must be at least 1. Actual: {}'
+                             .format(chunk_size))
+        if buffer_size < 1:
+            raise ValueError('buffer_size must be at least 1. Actual: {}'
+                             .format(buffer_size))
+        self.dataset = dataset
+        self.batch_size = batch_size
+        self.chunk_size = chunk_size
+        self.buffer_size = buffer_size
+        self._repeat = repeat
+        self._shuffle = shuffle
+
+        self.reset()
+
+    def __next__(self):
+        if not self._repeat and self.epoch > 0:
+            raise StopIteration
+
+        self._previous_epoch_detail = self.epoch_detail
+
+        i = self.current_position
+        i_end = i + self.batch_size
+        N = len(self.dataset)
+
+        batch = self._read(i, min(i_end, N))
+
+        if i_end >= N:
+            if self._repeat:
+                rest = i_end - N
+                if self._order is not None:
+                    self._set_order(*self._shuffle_order())
+                if rest > 0:
+                    batch.extend(self._read(0, rest))
+                self.current_position = rest
+            else:
+                self.current_position = 0
+
+            self.epoch += 1
+            self.is_new_epoch = True
+        else:
+            self.is_new_epoch = False
+            self.current_position = i_end
+
+        return batch
+
+    next = __next__
+
+    @property
+    def epoch_detail(self):
+        return self.epoch + self.current_position / len(self.dataset)
+
+    @property
+    def previous_epoch_detail(self):
+        if self._previous_epoch_detail < 0:
+            return None
+        return self._previous_epoch_detail
+
+    def serialize(self, serializer):
+        self.current_position = serializer('current_position',
+                                           self.current_position)
+        self.epoch = serializer('epoch', self.epoch)
+        self.is_new_epoch = serializer('is_new_epoch', self.is_new_epoch)
+        if self._order is not None:
+            serializer('order', self._order)
+            serializer('chunk_order', self._chunk_order)
+            if isinstance(serializer, serializer_module.Deserializer):
+                # The buffer is refilled from the restored position.
+                self._set_order(self._order, self._chunk_order)
+        self._previous_epoch_detail = serializer(
+            'previous_epoch_detail', self._previous_epoch_detail)
+
+    def reset(self):
+        if self._shuffle:
+            self._set_order(*self._shuffle_order())
+        else:
+            self._order = None
+
+        self.current_position = 0
+        self.epoch = 0
+        self.is_new_epoch = False
+
+        # use -1 instead of None internally.
+        self._previous_epoch_detail = -1.
+
+    def _shuffle_order(self):
+        # Simulates the buffer on the indexes to determine the order of
+        # examples in an epoch.
+        N = len(self.dataset)
+        chunk_size = self.chunk_size
+        chunk_order = numpy.random.permutation(-(-N // chunk_size))
+        order = numpy.empty(N, dtype=numpy.int64)
+        buffer = numpy.empty(0, dtype=numpy.int64)
+        n_drawn = 0
+        for chunk in chunk_order:
+            start = chunk * chunk_size
+            stop = min(start + chunk_size, N)
+            # Draws examples to make room for the chunk.
+            n = min(len(buffer) + stop - start - self.buffer_size, len(buffer))
+            if n > 0:
+                perm = numpy.random.permutation(len(buffer))
+                order[n_drawn:n_drawn + n] = buffer[perm[:n]]
+                buffer = buffer[perm[n:]]
+                n_drawn += n
+            buffer = numpy.concatenate(
+                (buffer, numpy.arange(start, stop, dtype=numpy.int64)))
+        order[n_drawn:] = numpy.random.permutation(buffer)
+        return order, chunk_order
+
+    def _set_order(self, order, chunk_order):
+        self._order = order
+        self._chunk_order = chunk_order
+        self._ranks = numpy.empty_like(order)
+        self._ranks[order] = numpy.arange(len(order))
+        self._buffer = {}
+        self._next_chunk = 0
+
+    def _read(self, start, stop):
+        if self._order is None:
+            return list(self.dataset[start:stop])
+        return [self._fetch(position)
+                for position in six.moves.range(start, stop)]
+
+    def _fetch(self, position):
+        index = int(self._order[position])
+        buffer = self._buffer
+        while index not in buffer:
+            self._load_chunk(position)
+        return buffer.pop(index)
+
+    def _load_chunk(self, position):
+        chunk = self._chunk_order[self._next_chunk]
+        self._next_chunk += 1
+        start = int(chunk) * self.chunk_size
+        stop = min(start + self.chunk_size, len(self.dataset))
+        ranks = self._ranks[start:stop]
+        if ranks.max() < position:
+            # All the examples of the chunk were consumed before the iterator
+            # was restored from a snapshot.
+            return
+        examples = self.dataset[start:stop]
+        buffer = self._buffer
+        for i, example in enumerate(examples):
+            if ranks[i] >= position:
+                buffer[start + i] = example
@@ -2,6 +2,7 @@ from __future__ import division
 from collections import namedtuple
 import multiprocessing
 from multiprocessing import sharedctypes
+import os
 import signal
 import sys
 import threading
@@ -12,6 +13,12 @@ import six
 
 from chainer.dataset import iterator
 
+try:
+    import resource
+    _resource_available = True
+except ImportError:
+    _resource_available = False
+
 
 _response_time = 1.
 _short_time = 0.001
@@ -29,6 +36,18 @@ class MultiprocessIterator(iterator.Iterator):
     module to parallelize the loading. The dataset is sent to the worker
     processes in the standard way using pickle.
 
+    The worker processes are started by the default start method of
+    :mod:`multiprocessing` unless ``start_method`` is given. Forked workers
+    share the dataset copy-on-write, but the pages of Python objects are
+    copied to each worker as their reference counts are updated, so that
+    the memory usage of each worker may grow up to the size of the dataset.
+    It can be avoided by keeping the dataset in shared memory with
+    :class:`~chainer.datasets.SharedMemoryDataset`, which is sent to the
+    workers as the handles of the shared memory even with the ``'spawn'``
+    and ``'forkserver'`` start methods. Workers can also be replaced
+    periodically by ``maxtasksperchild``, and the peak memory usage of each
+    worker is given by :meth:`get_worker_rss`.
+
     Note that this iterator effectively prefetches the examples for the next
     batch asynchronously after the current batch is returned.
 
@@ -48,6 +67,16 @@ class MultiprocessIterator(iterator.Iterator):
         n_prefetch (int): Number of prefetch batches.
         shared_mem (int): The size of using shared memory per data.
             If ``None``, size is adjusted automatically.
+        start_method (str): Start method of the worker processes, i.e.
+            ``'fork'``, ``'spawn'`` or ``'forkserver'``. See
+            :func:`multiprocessing.get_context`. If ``None``, the default
+            start method is used. It is not supported in Python 2. Note that
+            the main module must be importable without side effects (e.g.
+            guarded by ``if __name__ == '__main__'``) unless the workers are
+            forked.
+        maxtasksperchild (int): Number of tasks, i.e. examples, after which
+            each worker process is replaced with a new one to release its
+            memory. If ``None``, the workers live as long as the iterator.
 
     """
 
@@ -57,7 +86,18 @@ class MultiprocessIterator(iterator.Iterator):
     _thread = None
 
     def __init__(self, dataset, batch_size, repeat=True, shuffle=True,
-                 n_processes=None, n_prefetch=1, shared_mem=None):
+                 n_processes=None, n_prefetch=1, shared_mem=None,
+                 start_method=None, maxtasksperchild=None):
+        if start_method is not None:
+            if not hasattr(multiprocessing, 'get_context'):
+                raise ValueError(
+                    'start_method is not supported in this version of '
+                    'Python')
+            # Raises ValueError for unknown start methods.
+            multiprocessing.get_context(start_method)
+        if maxtasksperchild is not None and maxtasksperchild < 1:
+            raise ValueError('maxtasksperchild must be at least 1. Actual: {}'
+                             .format(maxtasksperchild))
         self.dataset = dataset
         self.batch_size = batch_size
         self.repeat = repeat
@@ -66,13 +106,17 @@ class MultiprocessIterator(iterator.Iterator):
         self.n_processes = n_processes or multiprocessing.cpu_count()
         self.n_prefetch = max(n_prefetch, 1)
         self.shared_mem = shared_mem
+        self.start_method = start_method
+        self.maxtasksperchild = maxtasksperchild
 
         self._comm = _Communicator(self.n_prefetch)
+        self._worker_rss = {}
         self.reset()
 
         self._prefetch_loop = _PrefetchLoop(
             self.dataset, self.batch_size, self.repeat, self.shuffle,
             self.n_processes, self.n_prefetch, self.shared_mem, self._comm,
+            self.start_method, self.maxtasksperchild, self._worker_rss,
             self._interruption_testing)
         # defer launching prefetch thread until creating the worker pool,
         # not to leave a background thread in forked processes.
@@ -125,7 +169,8 @@ class MultiprocessIterator(iterator.Iterator):
     def __copy__(self):
         other = MultiprocessIterator(
             self.dataset, self.batch_size, self.repeat, self.shuffle,
-            self.n_processes, self.n_prefetch, self.shared_mem)
+            self.n_processes, self.n_prefetch, self.shared_mem,
+            self.start_method, self.maxtasksperchild)
 
         other.current_position = self.current_position
         other.epoch = self.epoch
@@ -146,6 +191,21 @@ class MultiprocessIterator(iterator.Iterator):
             return None
         return self._previous_epoch_detail
 
+    def get_worker_rss(self):
+        """Returns the peak memory usage of the worker processes.
+
+        The peak resident set size of each worker process is recorded each
+        time it loads an example. The workers that have exited, e.g. by
+        ``maxtasksperchild``, are also included.
+
+        Returns:
+            dict: Dictionary mapping the process ID of each worker process to
+            its peak resident set size in bytes. It is empty if the usage is
+            not available on the platform.
+
+        """
+        return dict(self._worker_rss)
+
     def serialize(self, serializer):
         self.current_position = serializer('current_position',
                                            self.current_position)
@@ -267,6 +327,7 @@ class _PrefetchLoop(object):
 
     def __init__(self, dataset, batch_size, repeat, shuffle,
                  n_processes, n_prefetch, mem_size, comm,
+                 start_method, maxtasksperchild, worker_rss,
                  _interruption_testing):
         self.dataset = dataset
         self.batch_size = batch_size
@@ -275,6 +336,9 @@ class _PrefetchLoop(object):
         self.n_processes = n_processes
         self.mem_size = mem_size
         self.comm = comm
+        self.start_method = start_method
+        self.maxtasksperchild = maxtasksperchild
+        self.worker_rss = worker_rss
 
         self._allocate_shared_memory()
         self._pool = None
@@ -315,10 +379,15 @@ class _PrefetchLoop(object):
                 sharedctypes.RawArray('b', self.batch_size * self.mem_size)
 
     def launch_thread(self):
-        self._pool = multiprocessing.Pool(
+        if self.start_method is None:
+            context = multiprocessing
+        else:
+            context = multiprocessing.get_context(self.start_method)
+        self._pool = context.Pool(
             processes=self.n_processes,
             initializer=_fetch_setup,
-            initargs=(self.dataset, self.mem_size, self.mem_bulk))
+            initargs=(self.dataset, self.mem_size, self.mem_bulk),
+            maxtasksperchild=self.maxtasksperchild)
         if self._interruption_testing:
             pids = self._pool.map(_report_pid, range(self.n_processes))
             print(' '.join(map(str, pids)))
@@ -359,7 +428,11 @@ class _PrefetchLoop(object):
                 else:
                     break
 
-            batch = [_unpack(data, self.mem_bulk) for data in data_all]
+            batch = []
+            for data, pid, rss in data_all:
+                batch.append(_unpack(data, self.mem_bulk))
+                if rss is not None:
+                    self.worker_rss[pid] = rss
 
         self.comm.put(batch, self.prefetch_state, reset_count)
         return True
@@ -430,7 +503,17 @@ def _fetch_run(inputs):
         offset = i * _fetch_mem_size
         limit = offset + _fetch_mem_size
         data = _pack(data, _fetch_mem_bulk, offset, limit)
-    return data
+    return data, os.getpid(), _get_max_rss()
+
+
+def _get_max_rss():
+    if not _resource_available:
+        return None
+    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    if sys.platform != 'darwin':
+        # ru_maxrss is in kilobytes except on macOS.
+        rss *= 1024
+    return rss
 
 
 def _report_pid(_):  # for testing
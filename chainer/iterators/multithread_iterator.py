@@ -1,4 +1,6 @@
 from __future__ import division
+import collections
+import multiprocessing
 from multiprocessing import pool
 
 import numpy
@@ -16,7 +18,10 @@ class MultithreadIterator(iterator.Iterator):
     module to parallelize the loading.
 
     Note that this iterator effectively prefetches the examples for the next
-    batch asynchronously after the current batch is returned.
+    ``n_prefetch`` batches asynchronously after the current batch is returned.
+    The examples are fetched one by one, so that a slow example occupies only
+    one thread, and the threads keep loading the following batches while the
+    current one is being processed.
 
     This iterator saves ``-1`` instead of ``None`` in snapshots since some
     serializers do not support ``None``.
@@ -30,11 +35,20 @@ class MultithreadIterator(iterator.Iterator):
             beginning of each epoch. Otherwise, examples are extracted in the
             order of indexes.
         n_threads (int): Number of worker threads.
+        n_prefetch (int): Number of batches to prefetch.
+        ordered (bool): If ``False``, the examples in each batch are arranged
+            in the order of completion of loading instead of the order of
+            indexes. The set of examples in each batch does not change, so
+            the iteration and serialization are still exact except for the
+            order within batches.
 
     """
 
     def __init__(self, dataset, batch_size, repeat=True, shuffle=True,
-                 n_threads=1):
+                 n_threads=1, n_prefetch=1, ordered=True):
+        if n_prefetch < 1:
+            raise ValueError('n_prefetch must be at least 1. Actual: {}'
+                             .format(n_prefetch))
         self.dataset = dataset
         self.batch_size = batch_size
         self._repeat = repeat
@@ -44,6 +58,8 @@ class MultithreadIterator(iterator.Iterator):
         self.epoch = 0
 
         self.n_threads = n_threads
+        self.n_prefetch = n_prefetch
+        self.ordered = ordered
         self._pool = None
 
         self.reset()
@@ -58,7 +74,7 @@ class MultithreadIterator(iterator.Iterator):
             self._order = None
 
         # reset internal state
-        self._next = None
+        self._prefetched = collections.deque()
         self._previous_epoch_detail = None
 
     def __enter__(self):
@@ -70,7 +86,7 @@ class MultithreadIterator(iterator.Iterator):
     def finalize(self):
         pool = self._pool
 
-        self._next = None
+        self._prefetched = collections.deque()
         self._pool = None
         if pool is not None:
             pool.terminate()
@@ -81,12 +97,9 @@ class MultithreadIterator(iterator.Iterator):
 
         self._previous_epoch_detail = self.epoch_detail
 
-        if self._next is None:
-            # load for the first iteration
-            self._invoke_prefetch()
-
+        self._invoke_prefetch()  # load for the first iteration
         batch = self._get()
-        self._invoke_prefetch()  # prefetch for the next iteration
+        self._invoke_prefetch()  # prefetch for the next iterations
         return batch
 
     next = __next__
@@ -107,7 +120,7 @@ class MultithreadIterator(iterator.Iterator):
         self._order = serializer('_order', self._order)
         self._previous_epoch_detail = serializer(
             'previous_epoch_detail', self._previous_epoch_detail)
-        self._next = None
+        self._prefetched = collections.deque()
 
     @staticmethod
     def _read(args):
@@ -115,18 +128,25 @@ class MultithreadIterator(iterator.Iterator):
         return dataset[index]
 
     def _invoke_prefetch(self):
-        assert self._next is None
-        if not self._repeat and self.epoch > 0:
-            return
         if self._pool is None:
             self._pool = pool.ThreadPool(self.n_threads)
+        prefetched = self._prefetched
+        while len(prefetched) < self.n_prefetch:
+            if prefetched:
+                i, epoch, _, order = prefetched[-1][1]
+            else:
+                i, epoch = self.current_position, self.epoch
+                order = self._order
+            if not self._repeat and epoch > 0:
+                return
+            prefetched.append(self._prefetch_batch(i, epoch, order))
+
+    def _prefetch_batch(self, i, epoch, order):
+        # Queues the examples of the batch starting at the position ``i`` and
+        # returns the result iterator with the state after the batch.
         n = len(self.dataset)
-        i = self.current_position
-
-        order = self._order
         args = []
         dataset = self.dataset
-        epoch = self.epoch
         is_new_epoch = False
         for _ in six.moves.range(self.batch_size):
             index = i if order is None else order[i]
@@ -146,17 +166,25 @@ class MultithreadIterator(iterator.Iterator):
                     order = order.copy()
                     numpy.random.shuffle(order)
 
-        self._next = self._pool.map_async(MultithreadIterator._read, args)
-        self._next_state = (i, epoch, is_new_epoch, order)
+        if self.ordered:
+            imap = self._pool.imap
+        else:
+            imap = self._pool.imap_unordered
+        return imap(MultithreadIterator._read, args), (
+            i, epoch, is_new_epoch, order)
 
     def _get(self):
-        next = self._next
-        while not next.ready():
-            next.wait(0.5)  # To avoid interruption bug in Python2
-
-        batch = [data for data in next.get()]
-        self._next = None
+        next, state = self._prefetched.popleft()
+        batch = []
+        while True:
+            try:
+                # Waits with timeout to avoid interruption bug in Python2
+                batch.append(next.next(0.5))
+            except multiprocessing.TimeoutError:
+                continue
+            except StopIteration:
+                break
 
         (self.current_position, self.epoch,
-         self.is_new_epoch, self._order) = self._next_state
+         self.is_new_epoch, self._order) = state
         return batch
@@ -1,56 +1,65 @@
 """Collection of :class:`~chainer.Link` implementations."""
 
-from chainer.links.activation.maxout import Maxout  # NOQA
-from chainer.links.activation.prelu import PReLU  # NOQA
-from chainer.links.activation.simplified_dropconnect import SimplifiedDropconnect  # NOQA
-from chainer.links.activation.swish import Swish  # NOQA
-from chainer.links.connection.bias import Bias  # NOQA
-from chainer.links.connection.bilinear import Bilinear  # NOQA
-from chainer.links.connection.convolution_2d import Convolution2D  # NOQA
-from chainer.links.connection.convolution_nd import ConvolutionND  # NOQA
-from chainer.links.connection.deconvolution_2d import Deconvolution2D  # NOQA
-from chainer.links.connection.deconvolution_nd import DeconvolutionND  # NOQA
-from chainer.links.connection.depthwise_convolution_2d import DepthwiseConvolution2D  # NOQA
-from chainer.links.connection.dilated_convolution_2d import DilatedConvolution2D  # NOQA
-from chainer.links.connection.embed_id import EmbedID  # NOQA
-from chainer.links.connection.gru import GRU  # NOQA
-from chainer.links.connection.gru import StatefulGRU  # NOQA
-from chainer.links.connection.gru import StatelessGRU  # NOQA
-from chainer.links.connection.highway import Highway  # NOQA
-from chainer.links.connection.inception import Inception  # NOQA
-from chainer.links.connection.inceptionbn import InceptionBN  # NOQA
-from chainer.links.connection.linear import Linear  # NOQA
-from chainer.links.connection.local_convolution_2d import LocalConvolution2D  # NOQA
-from chainer.links.connection.lstm import LSTM  # NOQA
-from chainer.links.connection.lstm import StatelessLSTM  # NOQA
-from chainer.links.connection.mgu import StatefulMGU  # NOQA
-from chainer.links.connection.mgu import StatelessMGU  # NOQA
-from chainer.links.connection.mlp_convolution_2d import MLPConvolution2D  # NOQA
-from chainer.links.connection.n_step_gru import NStepBiGRU  # NOQA
-from chainer.links.connection.n_step_gru import NStepGRU  # NOQA
-from chainer.links.connection.n_step_lstm import NStepBiLSTM  # NOQA
-from chainer.links.connection.n_step_lstm import NStepLSTM  # NOQA
-from chainer.links.connection.n_step_rnn import NStepBiRNNReLU  # NOQA
-from chainer.links.connection.n_step_rnn import NStepBiRNNTanh  # NOQA
-from chainer.links.connection.n_step_rnn import NStepRNNReLU  # NOQA
-from chainer.links.connection.n_step_rnn import NStepRNNTanh  # NOQA
-from chainer.links.connection.parameter import Parameter  # NOQA
-from chainer.links.connection.peephole import StatefulPeepholeLSTM  # NOQA
-from chainer.links.connection.scale import Scale  # NOQA
-from chainer.links.connection.tree_lstm import ChildSumTreeLSTM  # NOQA
-from chainer.links.connection.tree_lstm import NaryTreeLSTM  # NOQA
-from chainer.links.connection.zoneoutlstm import StatefulZoneoutLSTM  # NOQA
-from chainer.links.loss.black_out import BlackOut  # NOQA
-from chainer.links.loss.crf1d import CRF1d  # NOQA
-from chainer.links.loss.hierarchical_softmax import BinaryHierarchicalSoftmax  # NOQA
-from chainer.links.loss.negative_sampling import NegativeSampling  # NOQA
-from chainer.links.model.classifier import Classifier  # NOQA
-from chainer.links.model.vision.googlenet import GoogLeNet  # NOQA
-from chainer.links.model.vision.resnet import ResNet101Layers  # NOQA
-from chainer.links.model.vision.resnet import ResNet152Layers  # NOQA
-from chainer.links.model.vision.resnet import ResNet50Layers  # NOQA
-from chainer.links.model.vision.vgg import VGG16Layers  # NOQA
-from chainer.links.normalization.batch_normalization import BatchNormalization  # NOQA
-from chainer.links.normalization.batch_renormalization import BatchRenormalization  # NOQA
-from chainer.links.normalization.layer_normalization import LayerNormalization  # NOQA
-from chainer.links.theano.theano_function import TheanoFunction  # NOQA
+from chainer import _lazy_import
+
+
+# Classes and functions are imported from the submodules on their first
+# access.
+_lazy_import.install(__name__, {
+    'Maxout': 'activation.maxout',
+    'PReLU': 'activation.prelu',
+    'SimplifiedDropconnect': 'activation.simplified_dropconnect',
+    'Swish': 'activation.swish',
+    'Bias': 'connection.bias',
+    'Bilinear': 'connection.bilinear',
+    'Convolution2D': 'connection.convolution_2d',
+    'ConvolutionND': 'connection.convolution_nd',
+    'Deconvolution2D': 'connection.deconvolution_2d',
+    'DeconvolutionND': 'connection.deconvolution_nd',
+    'DepthwiseConvolution2D': 'connection.depthwise_convolution_2d',
+    'DilatedConvolution2D': 'connection.dilated_convolution_2d',
+    'EmbedID': 'connection.embed_id',
+    'GRU': 'connection.gru',
+    'StatefulGRU': 'connection.gru',
+    'StatelessGRU': 'connection.gru',
+    'Highway': 'connection.highway',
+    'Inception': 'connection.inception',
+    'InceptionBN': 'connection.inceptionbn',
+    'Linear': 'connection.linear',
+    'LocalConvolution2D': 'connection.local_convolution_2d',
+    'LSTM': 'connection.lstm',
+    'StatelessLSTM': 'connection.lstm',
+    'StatefulMGU': 'connection.mgu',
+    'StatelessMGU': 'connection.mgu',
+    'MLPConvolution2D': 'connection.mlp_convolution_2d',
+    'NStepBiGRU': 'connection.n_step_gru',
+    'NStepGRU': 'connection.n_step_gru',
+    'NStepBiLSTM': 'connection.n_step_lstm',
+    'NStepLSTM': 'connection.n_step_lstm',
+    'NStepBiRNNReLU': 'connection.n_step_rnn',
+    'NStepBiRNNTanh': 'connection.n_step_rnn',
+    'NStepRNNDecoder': 'connection.n_step_rnn',
+    'NStepRNNReLU': 'connection.n_step_rnn',
+    'NStepRNNTanh': 'connection.n_step_rnn',
+    'Parameter': 'connection.parameter',
+    'StatefulPeepholeLSTM': 'connection.peephole',
+    'Scale': 'connection.scale',
+    'ChildSumTreeLSTM': 'connection.tree_lstm',
+    'NaryTreeLSTM': 'connection.tree_lstm',
+    'StatefulZoneoutLSTM': 'connection.zoneoutlstm',
+    'BlackOut': 'loss.black_out',
+    'CRF1d': 'loss.crf1d',
+    'BinaryHierarchicalSoftmax': 'loss.hierarchical_softmax',
+    'NegativeSampling': 'loss.negative_sampling',
+    'Classifier': 'model.classifier',
+    'fold_batch_normalization': 'model.folding',
+    'GoogLeNet': 'model.vision.googlenet',
+    'ResNet101Layers': 'model.vision.resnet',
+    'ResNet152Layers': 'model.vision.resnet',
+    'ResNet50Layers': 'model.vision.resnet',
+    'VGG16Layers': 'model.vision.vgg',
+    'BatchNormalization': 'normalization.batch_normalization',
+    'BatchRenormalization': 'normalization.batch_renormalization',
+    'LayerNormalization': 'normalization.layer_normalization',
+    'TheanoFunction': 'theano.theano_function',
+})
@@ -33,6 +33,12 @@ class NStepGRUBase(n_step_rnn.NStepRNNBase):
 
     n_weights = 6
 
+    def step_weight(self, w, b):
+        return rnn._gru_weight(w, b)
+
+    def step_cell(self, x, h, c, weight):
+        return rnn._gru_cell(x, h, c, weight)
+
 
 class NStepGRU(NStepGRUBase):
 
@@ -76,6 +76,50 @@ class NStepLSTMBase(n_step_rnn.NStepRNNBase):
         (hy, cy), ys = self._call([hx, cx], xs, **kwargs)
         return hy, cy, ys
 
+    def step_weight(self, w, b):
+        return rnn._lstm_weight(w, b)
+
+    def step_cell(self, x, h, c, weight):
+        return rnn._lstm_cell(x, h, c, weight)
+
+    def decoder(self, hx=None, cx=None, batch_size=None):
+        """Creates a step-wise decoder sharing parameters with this link.
+
+        The decoder caches packed weights and keeps hidden and cell states
+        across calls of :meth:`~chainer.links.NStepRNNDecoder.step`, which
+        makes autoregressive decoding cheaper than calling this link once
+        per time step with length-1 sequences.
+
+        .. admonition:: Example
+
+           >>> lstm = L.NStepLSTM(2, 3, 4, 0.)
+           >>> x = np.ones((5, 3), dtype=np.float32)
+           >>> with chainer.no_backprop_mode():
+           ...     dec = lstm.decoder(batch_size=5)
+           ...     y = dec.step(x)
+           ...     dec.reorder(np.array([0, 0, 2, 3, 3]))
+           >>> y.shape
+           (5, 4)
+           >>> [s.shape for s in dec.states]
+           [(2, 5, 4), (2, 5, 4)]
+
+        Args:
+            hx (~chainer.Variable or None): Initial hidden states. Its shape
+                is ``(S, B, N)``. If ``None`` is specified zero-vector is
+                used, and ``batch_size`` is required.
+            cx (~chainer.Variable or None): Initial cell states. It has the
+                same shape as ``hx``. If ``None`` is specified zero-vector is
+                used, and ``batch_size`` is required.
+            batch_size (int or None): Mini-batch size ``B`` used to create
+                the initial states given as ``None``.
+
+        Returns:
+            ~chainer.links.NStepRNNDecoder: A decoder object. Its ``states``
+            property returns a tuple of ``(hy, cy)``.
+
+        """
+        return n_step_rnn.NStepRNNDecoder(self, [hx, cx], batch_size)
+
 
 class NStepLSTM(NStepLSTMBase):
     """__init__(self, n_layers, in_size, out_size, dropout)
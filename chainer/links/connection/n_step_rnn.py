@@ -2,9 +2,13 @@ import numpy
 import six
 
 from chainer.backends import cuda
+from chainer.functions.array import get_item
 from chainer.functions.array import permutate
+from chainer.functions.array import separate
+from chainer.functions.array import stack
 from chainer.functions.array import transpose_sequence
 from chainer.functions.connection import n_step_rnn as rnn
+from chainer.functions.noise import dropout
 from chainer.initializers import normal
 from chainer import link
 from chainer.utils import argument
@@ -116,6 +120,38 @@ class NStepRNNBase(link.ChainList):
         """
         raise NotImplementedError
 
+    def step_weight(self, w, b):
+        """Packs weights of one layer for step-wise computation.
+
+        This function must be implemented in a child class to support
+        :meth:`decoder`.
+        """
+        raise NotImplementedError
+
+    def step_cell(self, x, h, c, weight):
+        """Calculates one time step of one layer.
+
+        This function must be implemented in a child class to support
+        :meth:`decoder`.
+        """
+        raise NotImplementedError
+
+    def decoder(self, hx=None, batch_size=None):
+        """Creates a step-wise decoder sharing parameters with this link.
+
+        Args:
+            hx (~chainer.Variable or None): Initial hidden states. Its shape
+                is ``(S, B, N)``. If ``None`` is specified zero-vector is
+                used, and ``batch_size`` is required.
+            batch_size (int or None): Mini-batch size ``B`` used to create
+                the initial states when ``hx`` is ``None``.
+
+        Returns:
+            ~chainer.links.NStepRNNDecoder: A decoder object.
+
+        """
+        return NStepRNNDecoder(self, [hx], batch_size)
+
     @property
     def n_cells(self):
         """Returns the number of cells.
@@ -211,6 +247,103 @@ class NStepRNNBase(link.ChainList):
         return hys, ys
 
 
+class NStepRNNDecoder(object):
+
+    """Step-wise decoder for uni-directional N-step RNN links.
+
+    Calling an N-step RNN link once per output token with length-1
+    sequences repeats sorting, transposition and weight packing at every
+    step. This object packs the weights of the link once on construction
+    and keeps hidden (and cell) states of every layer as separate arrays,
+    so that each call of :meth:`step` only runs the cell computation.
+
+    Since the packed weights are cached, the parameters of the link must
+    not be updated while the decoder is used. It is mainly intended to be
+    used for inference, e.g., under :func:`chainer.no_backprop_mode`.
+
+    Decoders should be created via ``decoder`` methods of links such as
+    :meth:`chainer.links.NStepLSTM.decoder`.
+
+    Args:
+        link (~chainer.links.connection.n_step_rnn.NStepRNNBase): A
+            uni-directional N-step RNN link.
+        hs (list of ~chainer.Variable or None): Initial states. Its length
+            is ``link.n_cells``. ``None`` means zero-vectors.
+        batch_size (int or None): Mini-batch size used for states given as
+            ``None``.
+
+    """
+
+    def __init__(self, link, hs, batch_size=None):
+        if link.use_bi_direction:
+            raise ValueError(
+                'Step-wise decoding is not supported for bi-directional '
+                'RNN links')
+        self.link = link
+        self.weights = [link.step_weight(w, b)
+                        for w, b in six.moves.zip(link.ws, link.bs)]
+
+        states = []
+        for h in hs:
+            if h is None:
+                if batch_size is None:
+                    raise ValueError(
+                        'batch_size is required when initial states are not '
+                        'given')
+                shape = (link.n_layers, batch_size, link.out_size)
+                with cuda.get_device_from_id(link._device_id):
+                    h = variable.Variable(
+                        link.xp.zeros(shape, dtype=link.ws[0][0].dtype))
+            states.append(list(separate.separate(h)))
+        self._states = states
+
+    @property
+    def states(self):
+        """Tuple of stacked states with shapes ``(S, B, N)``."""
+        return tuple(stack.stack(s) for s in self._states)
+
+    def step(self, x):
+        """Calculates one time step of all layers.
+
+        Args:
+            x (~chainer.Variable): Input of the current step. Its shape is
+                ``(B, I)``.
+
+        Returns:
+            ~chainer.Variable: Hidden states of the last layer whose shape is
+            ``(B, N)``.
+
+        """
+        link = self.link
+        use_cell = len(self._states) > 1
+        for layer in six.moves.range(link.n_layers):
+            if layer > 0:
+                x = dropout.dropout(x, ratio=link.dropout)
+            h = self._states[0][layer]
+            c = self._states[1][layer] if use_cell else None
+            h, c = link.step_cell(x, h, c, self.weights[layer])
+            self._states[0][layer] = h
+            if use_cell:
+                self._states[1][layer] = c
+            x = h
+        return x
+
+    def reorder(self, indices):
+        """Reorders states along the mini-batch axis.
+
+        This is used to select surviving hypotheses in beam search, where
+        ``indices[i]`` is the index of the previous state from which the
+        ``i``-th new state is derived. The mini-batch size may change.
+
+        Args:
+            indices (numpy.ndarray or cupy.ndarray): Integer array of
+                indices.
+
+        """
+        self._states = [[get_item.get_item(h, indices) for h in s]
+                        for s in self._states]
+
+
 class NStepRNNTanh(NStepRNNBase):
     """__init__(self, n_layers, in_size, out_size, dropout)
 
@@ -249,6 +382,12 @@ class NStepRNNTanh(NStepRNNBase):
     def rnn(self, *args):
         return rnn.n_step_rnn(*args, activation='tanh')
 
+    def step_weight(self, w, b):
+        return rnn._rnn_weight(w, b)
+
+    def step_cell(self, x, h, c, weight):
+        return rnn._rnn_cell(x, h, c, weight, 'tanh')
+
     @property
     def n_cells(self):
         return 1
@@ -292,6 +431,12 @@ class NStepRNNReLU(NStepRNNBase):
     def rnn(self, *args):
         return rnn.n_step_rnn(*args, activation='relu')
 
+    def step_weight(self, w, b):
+        return rnn._rnn_weight(w, b)
+
+    def step_cell(self, x, h, c, weight):
+        return rnn._rnn_cell(x, h, c, weight, 'relu')
+
     @property
     def n_cells(self):
         return 1
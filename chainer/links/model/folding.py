@@ -0,0 +1,248 @@
+import collections
+import copy
+
+import six
+
+import chainer
+from chainer.functions.array import broadcast
+from chainer.functions.array import reshape
+from chainer.functions.connection import convolution_2d
+from chainer.functions.connection import linear
+from chainer.functions.math import basic_math
+from chainer.functions.normalization import batch_normalization
+from chainer import link
+from chainer.links.connection import convolution_2d as convolution_2d_link
+from chainer.links.connection import linear as linear_link
+from chainer.links.connection import scale as scale_link
+from chainer.links.normalization import batch_normalization as bn_link
+from chainer import sequential
+from chainer import variable
+
+
+def _identity(x, **kwargs):
+    return x
+
+
+def _collect_variables(outputs):
+    if isinstance(outputs, variable.Variable):
+        return [outputs]
+    if isinstance(outputs, dict):
+        outputs = list(six.itervalues(outputs))
+    if isinstance(outputs, (list, tuple)):
+        return [v for o in outputs for v in _collect_variables(o)]
+    return []
+
+
+def _trace(model, args):
+    """Runs the model and returns its outputs, function nodes and a map from
+    the ID of each variable node to the function nodes consuming it."""
+    with chainer.using_config('train', False), \
+            chainer.force_backprop_mode():
+        outputs = _collect_variables(model(*args))
+    funcs = []
+    consumers = collections.defaultdict(list)
+    seen = set()
+    stack = [y.node for y in outputs]
+    while stack:
+        creator = stack.pop().creator_node
+        if creator is None or id(creator) in seen:
+            continue
+        seen.add(id(creator))
+        funcs.append(creator)
+        for x in creator.inputs:
+            consumers[id(x)].append(creator)
+            stack.append(x)
+    return outputs, funcs, consumers
+
+
+def _creator_of(node, func_type):
+    creator = node.creator_node
+    if isinstance(creator, func_type):
+        return creator
+    return None
+
+
+def _find_folds(model, args):
+    """Finds pairs of a connection link and the following affine link.
+
+    It returns a list of tuples ``(connection, affine)``, where
+    ``connection`` is a :class:`~chainer.links.Convolution2D` or
+    :class:`~chainer.links.Linear` and ``affine`` is a
+    :class:`~chainer.links.BatchNormalization` or a
+    :class:`~chainer.links.Scale` applied to the output of ``connection``
+    along the channel axis.
+
+    """
+    params = {}
+    bns = {}
+    for child in model.links():
+        for name in child._params:
+            params[id(getattr(child, name).node)] = child
+        if isinstance(child, bn_link.BatchNormalization):
+            bns[id(child.avg_mean)] = child
+
+    # Keep the outputs alive while the graph is inspected.
+    outputs, funcs, consumers = _trace(model, args)
+    output_nodes = set(id(y.node) for y in outputs)
+    bn_calls = collections.Counter(
+        id(f.inputs[3].data) for f in funcs
+        if isinstance(f, batch_normalization.FixedBatchNormalization))
+
+    def used_once(param):
+        return len(consumers[id(param.node)]) == 1
+
+    folds = []
+    for func in funcs:
+        if not isinstance(func, (convolution_2d.Convolution2DFunction,
+                                 linear.LinearFunction)):
+            continue
+        conn = params.get(id(func.inputs[1]))
+        if not isinstance(conn, (convolution_2d_link.Convolution2D,
+                                 linear_link.Linear)):
+            continue
+        if func.inputs[1] is not conn.W.node or not used_once(conn.W):
+            continue
+        h = func.outputs[0]()
+        if h is None or id(h) in output_nodes or len(consumers[id(h)]) != 1:
+            continue
+        next_func, = consumers[id(h)]
+        n_channels = conn.W.shape[0]
+
+        affine = None
+        if isinstance(next_func, batch_normalization.FixedBatchNormalization):
+            mean = next_func.inputs[3].data
+            bn = bns.get(id(mean))
+            if (bn is not None and next_func.inputs[0] is h and
+                    bn.axis is None and mean.shape == (n_channels,) and
+                    bn_calls[id(mean)] == 1):
+                affine = bn
+        elif isinstance(next_func, basic_math.Mul):
+            x0, x1 = next_func.inputs
+            w = x1 if x0 is h else x0
+            b = _creator_of(w, broadcast.BroadcastTo)
+            r = b and _creator_of(b.inputs[0], reshape.Reshape)
+            s = r and params.get(id(r.inputs[0]))
+            if (isinstance(s, scale_link.Scale) and hasattr(s, 'W') and
+                    r.inputs[0] is s.W.node and s.axis == 1 and
+                    s.W.shape == (n_channels,) and used_once(s.W)):
+                affine = s
+        if affine is not None:
+            folds.append((conn, affine))
+    return folds
+
+
+def _fold(conn, affine):
+    xp = conn.xp
+    W = conn.W.array
+    if isinstance(affine, bn_link.BatchNormalization):
+        gamma = getattr(affine, 'gamma', None)
+        beta = getattr(affine, 'beta', None)
+        mult = 1 / xp.sqrt(affine.avg_var + affine.eps)
+        if gamma is not None:
+            mult *= gamma.array
+        shift = -affine.avg_mean * mult
+        if beta is not None:
+            shift += beta.array
+    else:
+        mult = affine.W.array.copy()
+        if hasattr(affine, 'bias'):
+            shift = affine.bias.b.array.copy()
+        else:
+            shift = xp.zeros_like(mult)
+
+    mult = mult.astype(W.dtype)
+    shift = shift.astype(W.dtype)
+    W *= mult.reshape((-1,) + (1,) * (W.ndim - 1))
+    if conn.b is None:
+        with conn.init_scope():
+            conn.b = variable.Parameter(shift)
+    else:
+        conn.b.array *= mult
+        conn.b.array += shift
+
+
+def _remove_link(model, target):
+    for parent in model.links():
+        if isinstance(parent, sequential.Sequential):
+            for child in parent:
+                if child is target:
+                    parent.remove(child)
+                    return True
+        elif isinstance(parent, link.Chain):
+            for name in parent._children:
+                if getattr(parent, name) is target:
+                    delattr(parent, name)
+                    # The parent calls the removed link by its name.
+                    setattr(parent, name, _identity)
+                    return True
+    return False
+
+
+def fold_batch_normalization(model, *args):
+    """Folds batch normalization and scale layers into connection layers.
+
+    This function makes a copy of ``model`` for inference, in which each
+    :class:`~chainer.links.BatchNormalization` and
+    :class:`~chainer.links.Scale` link applied right after a
+    :class:`~chainer.links.Convolution2D` or :class:`~chainer.links.Linear`
+    link is merged into the weight and the bias of the connection link.
+    In the test mode, batch normalization computes
+
+    .. math::
+
+       y = \\gamma \\frac{x - \\mu}{\\sqrt{\\sigma^2 + \\epsilon}} + \\beta,
+
+    which is an affine transformation of each channel, so the connection
+    link followed by it is equivalent to the connection link with scaled
+    weights and a shifted bias. The merged links are removed from the copy,
+    which saves one pass over every output of the connection links.
+
+    The pairs of links are found by running ``model`` with ``args`` in the
+    test mode and inspecting its computational graph. A pair is folded only
+    if the output of the connection link is consumed by the following link
+    alone, and each of the links is called once. The folded links are
+    replaced by the identity function in the parent :class:`~chainer.Chain`,
+    or removed from the parent :class:`~chainer.Sequential`.
+
+    .. admonition:: Example
+
+       >>> model = chainer.Sequential(
+       ...     L.Convolution2D(3, 8, 3, nobias=True),
+       ...     L.BatchNormalization(8),
+       ...     F.relu)
+       >>> x = np.random.uniform(size=(1, 3, 16, 16)).astype(np.float32)
+       >>> folded = L.fold_batch_normalization(model, x)
+       >>> len(model), len(folded)
+       (3, 2)
+       >>> with chainer.using_config('train', False):
+       ...     np.allclose(model(x).array, folded(x).array, atol=1e-5)
+       True
+
+    .. note::
+
+       The folded model computes the same function as the original one only
+       in the test mode, i.e., ``chainer.config.train`` is ``False``. Since
+       links are removed and biases are added, the parameters of the folded
+       model cannot be loaded into the original model and vice versa.
+
+    Args:
+        model (~chainer.Link): Model to be folded. It is not modified.
+        args: Sample inputs of ``model``. They are used to trace the
+            computational graph.
+
+    Returns:
+        ~chainer.Link: The folded copy of ``model``.
+
+    """
+    model = copy.deepcopy(model)
+    while True:
+        folds = _find_folds(model, args)
+        folded = False
+        for conn, affine in folds:
+            if _remove_link(model, affine):
+                _fold(conn, affine)
+                folded = True
+        # A batch normalization without parameters followed by a scale link
+        # (as in models converted from Caffe) is folded in two passes.
+        if not folded:
+            return model
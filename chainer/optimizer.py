@@ -12,6 +12,40 @@ from chainer import serializer as serializer_module
 from chainer import variable
 
 
+def _all_finite(arrays):
+    """Checks if all the elements of the arrays are finite.
+
+    Each array is reduced to a scalar on its device, and the scalars are
+    checked at once, so that the device is synchronized only once.
+
+    """
+    flags = collections.defaultdict(list)
+    for x in arrays:
+        if isinstance(x, cuda.ndarray):
+            with x.device:
+                flags[x.device.id].append(_get_all_finite_kernel()(x))
+        else:
+            # The sum of finite values never overflows in float64 unless the
+            # values are float64, and it is nan or inf otherwise.
+            flags[-1].append(x.sum(dtype=numpy.float64))
+    for device_id, values in six.iteritems(flags):
+        if device_id < 0:
+            if not numpy.isfinite(values).all():
+                return False
+        else:
+            with cuda.get_device_from_id(device_id):
+                if not cuda.cupy.stack(values).all():
+                    return False
+    return True
+
+
+@cuda.memoize()
+def _get_all_finite_kernel():
+    return cuda.reduce(
+        'T x', 'bool y', 'isfinite(x)', 'a && b', 'y = a', 'true',
+        'all_finite')
+
+
 class Hyperparameter(object):
 
     """Set of hyperparameter entries of an optimizer.
@@ -371,6 +405,8 @@ class Optimizer(object):
             :meth:`update` method.
         ~Optimizer.epoch: Current epoch. It is incremented by the
             :meth:`new_epoch` method.
+        ~Optimizer.n_skipped_updates: Number of updates skipped by the
+            dynamic loss scaling. See :meth:`loss_scaling`.
 
     """
 
@@ -380,6 +416,9 @@ class Optimizer(object):
     _pre_update_hooks = None
     _post_update_hooks = None
     _loss_scale = None
+    _loss_scaling_interval = None
+    _loss_scaling_steps = 0
+    n_skipped_updates = 0
 
     def setup(self, link):
         """Sets a target link and initializes the optimizer states.
@@ -543,14 +582,96 @@ class Optimizer(object):
         """
         self.t = serializer('t', self.t)
         self.epoch = serializer('epoch', self.epoch)
+        if self._loss_scaling_interval is not None:
+            self._loss_scale = serializer('loss_scale', self._loss_scale)
+            self._loss_scaling_steps = serializer(
+                'loss_scaling_steps', self._loss_scaling_steps)
+            self.n_skipped_updates = serializer(
+                'n_skipped_updates', self.n_skipped_updates)
         for name, param in self.target.namedparams():
             rule = getattr(param, 'update_rule', None)
             if rule is not None:
                 rule.serialize(serializer[name])
 
+    @property
+    def loss_scale(self):
+        """Current loss scaling factor, or ``None`` if it is not used."""
+        return self._loss_scale
+
     def set_loss_scale(self, loss_scale):
         """Sets loss scaling factor."""
         self._loss_scale = loss_scale
+        self._loss_scaling_interval = None
+
+    def loss_scaling(self, interval=1000, scale=None,
+                     initial_scale=2. ** 15):
+        """Configures the loss scaling.
+
+        Loss scaling multiplies the gradient of the loss by a factor before
+        the backward computation, so that small gradients do not underflow
+        in low precision data types like float16. The gradients of the
+        parameters are divided by the factor before the update.
+
+        If ``scale`` is given, the factor is fixed to it. Otherwise, the
+        factor is adjusted dynamically: the gradients of all the parameters
+        are checked for inf and nan before each update; if any of them is
+        found, the factor is halved and the update is skipped (see
+        :attr:`n_skipped_updates`), and if there is no overflow in
+        ``interval`` consecutive updates, the factor is doubled. The current
+        factor is available as :attr:`loss_scale`, and it is serialized with
+        the optimizer.
+
+        The dynamic loss scaling is done by :meth:`GradientMethod.update`,
+        so the gradients must be computed by the loss scaled with
+        :attr:`loss_scale`, e.g., ``loss.backward(loss_scale=
+        optimizer.loss_scale)``. :meth:`update` with ``lossfun`` and
+        :class:`~chainer.training.updaters.StandardUpdater` do it
+        automatically.
+
+        Args:
+            interval (int): Number of consecutive updates without overflow
+                after which the dynamic loss scaling factor is doubled.
+            scale (float): Fixed loss scaling factor. If it is ``None``, the
+                dynamic loss scaling is used.
+            initial_scale (float): Initial factor of the dynamic loss
+                scaling.
+
+        """
+        if scale is not None:
+            if scale <= 0:
+                raise ValueError('loss scale must be positive. Actual: {}'
+                                 .format(scale))
+            self.set_loss_scale(scale)
+            return
+        if interval < 1:
+            raise ValueError('interval must be at least 1. Actual: {}'
+                             .format(interval))
+        if initial_scale < 1:
+            raise ValueError('initial_scale must be at least 1. Actual: {}'
+                             .format(initial_scale))
+        self._loss_scale = float(initial_scale)
+        self._loss_scaling_interval = interval
+        self._loss_scaling_steps = 0
+
+    def _update_loss_scale(self):
+        """Updates the dynamic loss scaling factor.
+
+        Returns ``True`` if the gradients are finite and the parameters can
+        be updated.
+
+        """
+        grads = [param.grad for param in self.target.params()
+                 if param.grad is not None]
+        if not _all_finite(grads):
+            self._loss_scale = max(self._loss_scale / 2, 1.)
+            self._loss_scaling_steps = 0
+            self.n_skipped_updates += 1
+            return False
+        self._loss_scaling_steps += 1
+        if self._loss_scaling_steps >= self._loss_scaling_interval:
+            self._loss_scale *= 2
+            self._loss_scaling_steps = 0
+        return True
 
 
 class GradientMethod(Optimizer):
@@ -634,19 +755,22 @@ class GradientMethod(Optimizer):
         The actual update routines are defined by the update rule of each
         parameter.
 
+        If the dynamic loss scaling is enabled by :meth:`loss_scaling`, the
+        update is skipped when the gradients contain inf or nan.
+
         """
         if lossfun is not None:
-            use_cleargrads = getattr(self, '_use_cleargrads', True)
             loss = lossfun(*args, **kwds)
-            if use_cleargrads:
-                self.target.cleargrads()
-            else:
-                self.target.zerograds()
-            loss.backward(loss_scale=self._loss_scale)
+            self._backward(loss)
             del loss
 
         self.reallocate_cleared_grads()
 
+        if (self._loss_scaling_interval is not None and
+                not self._update_loss_scale()):
+            # Skips the update with overflowed gradients.
+            return
+
         self.call_hooks('pre')
 
         self.t += 1
@@ -657,6 +781,17 @@ class GradientMethod(Optimizer):
 
         self.call_hooks('post')
 
+    def _clear_grads(self):
+        if getattr(self, '_use_cleargrads', True):
+            self.target.cleargrads()
+        else:
+            self.target.zerograds()
+
+    def _backward(self, loss):
+        # Replaces the gradients of the target with those of the loss.
+        self._clear_grads()
+        loss.backward(loss_scale=self._loss_scale)
+
     def use_cleargrads(self, use=True):
         """Enables or disables use of :func:`~chainer.Link.cleargrads` in `update`.
 
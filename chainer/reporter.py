@@ -1,4 +1,3 @@
-import collections
 import contextlib
 import copy
 import json
@@ -13,12 +12,6 @@ from chainer import serializer as serializer_module
 from chainer import variable
 
 
-def _copy_variable(value):
-    if isinstance(value, variable.Variable):
-        return copy.copy(value)
-    return value
-
-
 class Reporter(object):
 
     """Object to which observed values are reported.
@@ -151,20 +144,21 @@ class Reporter(object):
                 name of the observed value.
 
         """
-        if not configuration.config.keep_graph_on_report:
-            values = {k: _copy_variable(v) for k, v in six.iteritems(values)}
-
+        keep_graph = configuration.config.keep_graph_on_report
         if observer is not None:
-            observer_id = id(observer)
-            if observer_id not in self._observer_names:
+            observer_name = self._observer_names.get(id(observer))
+            if observer_name is None:
                 raise KeyError(
                     'Given observer is not registered to the reporter.')
-            observer_name = self._observer_names[observer_id]
-            for key, value in six.iteritems(values):
-                name = '%s/%s' % (observer_name, key)
-                self.observation[name] = value
+            prefix = observer_name + '/'
         else:
-            self.observation.update(values)
+            prefix = ''
+
+        observation = self.observation
+        for key, value in six.iteritems(values):
+            if not keep_graph and isinstance(value, variable.Variable):
+                value = copy.copy(value)
+            observation[prefix + key] = value
 
 
 _reporters = []
@@ -307,6 +301,103 @@ class Summary(object):
             warnings.warn('The previous statistics are not saved.')
 
 
+class _SummaryGroup(object):
+
+    """Accumulators of the scalars of a :class:`DictSummary` on a device.
+
+    The sums of the values and their squares are stored in preallocated
+    arrays on the device, one slot per name, and the numbers of the values in
+    an array on the host. The scalars added at once are stacked into a vector
+    and accumulated with a few vector operations, so that the accumulation
+    does not synchronize the device with the host.
+
+    """
+
+    def __init__(self, device_id):
+        if device_id < 0:
+            self.device = cuda.DummyDevice
+            self.xp = numpy
+        else:
+            self.device = cuda.Device(device_id)
+            self.xp = cuda.cupy
+        self.names = []
+        self.slots = {}
+        self._indices = {}
+        self._allocate(8)
+
+    def _allocate(self, capacity):
+        xp = self.xp
+        size = len(self.names)
+        with self.device:
+            x = xp.zeros(capacity, numpy.float64)
+            x2 = xp.zeros(capacity, numpy.float64)
+        n = numpy.zeros(capacity, numpy.int64)
+        if size:
+            x[:size] = self.x[:size]
+            x2[:size] = self.x2[:size]
+            n[:size] = self.n[:size]
+        self.x, self.x2, self.n = x, x2, n
+        self._buffer = numpy.empty(capacity, numpy.float64)
+
+    def new_slot(self, name, x=0, x2=0, n=0):
+        slot = len(self.names)
+        if slot == len(self.n):
+            self._allocate(2 * slot)
+        self.names.append(name)
+        self.slots[name] = slot
+        self.x[slot] = x
+        self.x2[slot] = x2
+        self.n[slot] = n
+        return slot
+
+    def remove_slot(self, name):
+        slot = self.slots.pop(name)
+        self.names[slot] = None
+        self.n[slot] = 0
+        self._indices.clear()
+        return self.x[slot], self.x2[slot]
+
+    def _get_index(self, names):
+        # Returns the indices of the slots on the host and on the device. The
+        # names are usually added in the same order at every iteration, so
+        # the indices are cached for each sequence of names.
+        key = tuple(names)
+        indices = self._indices.get(key)
+        if indices is None:
+            slots = [self.slots[name] for name in names]
+            start = slots[0]
+            if slots == list(six.moves.range(start, start + len(slots))):
+                index = device_index = slice(start, start + len(slots))
+            else:
+                index = numpy.array(slots, numpy.intp)
+                with self.device:
+                    device_index = self.xp.asarray(index)
+            indices = self._indices[key] = index, device_index
+        return indices
+
+    def add(self, names, values):
+        index, device_index = self._get_index(names)
+        with self.device:
+            if self.xp is numpy:
+                v = self._buffer[:len(values)]
+                v[...] = values
+            else:
+                v = self.xp.stack(values).astype(numpy.float64)
+            self.x[device_index] += v
+            v *= v
+            self.x2[device_index] += v
+        self.n[index] += 1
+
+    def items(self):
+        """Returns the names and the statistics on the host."""
+        size = len(self.names)
+        x = cuda.to_cpu(self.x[:size])
+        x2 = cuda.to_cpu(self.x2[:size])
+        for slot, name in enumerate(self.names):
+            if name is not None:
+                yield name, x[slot], x2[slot], self.n[slot]
+
+
 class DictSummary(object):
 
     """Online summarization of a sequence of dictionaries.
@@ -315,10 +406,31 @@ class DictSummary(object):
     It only computes the statistics for scalar values and variables of scalar
     values in the dictionaries.
 
+    The values are accumulated in double precision on the device where they
+    reside, and they are not transferred to the host until the statistics are
+    computed. The statistics of all entries on a device are transferred at
+    once, so that computing them requires only one synchronization per
+    device.
+
     """
 
     def __init__(self):
-        self._summaries = collections.defaultdict(Summary)
+        self._groups = {}
+        self._devices = {}
+
+    def _get_group(self, device_id):
+        group = self._groups.get(device_id)
+        if group is None:
+            group = self._groups[device_id] = _SummaryGroup(device_id)
+        return group
+
+    def _move(self, name, device_id):
+        # A value of an existing entry is added from another device.
+        group = self._groups[self._devices[name]]
+        n = group.n[group.slots[name]]
+        x, x2 = group.remove_slot(name)
+        self._get_group(device_id).new_slot(name, float(x), float(x2), n)
+        self._devices[name] = device_id
 
     def add(self, d):
         """Adds a dictionary of scalars.
@@ -329,12 +441,41 @@ class DictSummary(object):
                zero-dimensional arrays are accumulated.
 
         """
-        summaries = self._summaries
+        batches = {}
+        devices = self._devices
         for k, v in six.iteritems(d):
             if isinstance(v, variable.Variable):
                 v = v.array
-            if numpy.isscalar(v) or getattr(v, 'ndim', -1) == 0:
-                summaries[k].add(v)
+            if numpy.isscalar(v):
+                device_id = -1
+            elif getattr(v, 'ndim', -1) == 0:
+                if isinstance(v, cuda.ndarray):
+                    device_id = v.device.id
+                else:
+                    device_id = -1
+            else:
+                continue
+
+            current = devices.get(k)
+            if current is None:
+                self._get_group(device_id).new_slot(k)
+                devices[k] = device_id
+            elif current != device_id:
+                self._move(k, device_id)
+
+            batch = batches.get(device_id)
+            if batch is None:
+                batch = batches[device_id] = ([], [])
+            batch[0].append(k)
+            batch[1].append(v)
+
+        for device_id, (names, values) in six.iteritems(batches):
+            self._groups[device_id].add(names, values)
+
+    def _items(self):
+        for group in six.itervalues(self._groups):
+            for item in group.items():
+                yield item
 
     def compute_mean(self):
         """Creates a dictionary of mean values.
@@ -346,8 +487,7 @@ class DictSummary(object):
             dict: Dictionary of mean values.
 
         """
-        return {name: summary.compute_mean()
-                for name, summary in six.iteritems(self._summaries)}
+        return {name: x / n for name, x, _, n in self._items()}
 
     def make_statistics(self):
         """Creates a dictionary of statistics.
@@ -362,27 +502,42 @@ class DictSummary(object):
 
         """
         stats = {}
-        for name, summary in six.iteritems(self._summaries):
-            mean, std = summary.make_statistics()
+        for name, x, x2, n in self._items():
+            mean = x / n
             stats[name] = mean
-            stats[name + '.std'] = std
-
+            stats[name + '.std'] = numpy.sqrt(x2 / n - mean * mean)
         return stats
 
     def serialize(self, serializer):
         if isinstance(serializer, serializer_module.Serializer):
-            names = list(self._summaries.keys())
-            serializer('_names', json.dumps(names))
-            for index, name in enumerate(names):
-                self._summaries[name].serialize(
-                    serializer['_summaries'][str(index)])
+            items = list(self._items())
+            serializer('_names', json.dumps([item[0] for item in items]))
+            for index, (_, x, x2, n) in enumerate(items):
+                s = serializer['_summaries'][str(index)]
+                s('_x', x)
+                s('_x2', x2)
+                s('_n', n)
         else:
-            self._summaries.clear()
+            self._groups.clear()
+            self._devices.clear()
             try:
                 names = json.loads(serializer('_names', ''))
             except KeyError:
                 warnings.warn('The names of statistics are not saved.')
                 return
+            # The loaded statistics are placed on the host, and moved to
+            # another device when a value is added from the device.
+            group = self._get_group(-1)
             for index, name in enumerate(names):
-                self._summaries[name].serialize(
-                    serializer['_summaries'][str(index)])
+                s = serializer['_summaries'][str(index)]
+                try:
+                    x = s('_x', None)
+                    x2 = s('_x2', None)
+                    n = s('_n', None)
+                except KeyError:
+                    x = None
+                if x is None or x2 is None or n is None:
+                    warnings.warn('The previous statistics are not saved.')
+                    continue
+                group.new_slot(name, float(x), float(x2), int(n))
+                self._devices[name] = -1
@@ -1,17 +1,24 @@
-# import classes and functions
-from chainer.training.extensions._snapshot import snapshot  # NOQA
-from chainer.training.extensions._snapshot import snapshot_object  # NOQA
-from chainer.training.extensions.computational_graph import dump_graph  # NOQA
-from chainer.training.extensions.evaluator import Evaluator  # NOQA
-from chainer.training.extensions.exponential_shift import ExponentialShift  # NOQA
-from chainer.training.extensions.fail_on_nonnumber import FailOnNonNumber  # NOQA
-from chainer.training.extensions.linear_shift import LinearShift  # NOQA
-from chainer.training.extensions.log_report import LogReport  # NOQA
-from chainer.training.extensions.micro_average import MicroAverage  # NOQA
-from chainer.training.extensions.parameter_statistics import ParameterStatistics  # NOQA
-from chainer.training.extensions.plot_report import PlotReport  # NOQA
-from chainer.training.extensions.print_report import PrintReport  # NOQA
-from chainer.training.extensions.progress_bar import ProgressBar  # NOQA
-from chainer.training.extensions.value_observation import observe_lr  # NOQA
-from chainer.training.extensions.value_observation import observe_value  # NOQA
-from chainer.training.extensions.variable_statistics_plot import VariableStatisticsPlot  # NOQA
+from chainer import _lazy_import
+
+
+# Classes and functions are imported from the submodules on their first
+# access.
+_lazy_import.install(__name__, {
+    'snapshot': '_snapshot',
+    'snapshot_object': '_snapshot',
+    'dump_graph': 'computational_graph',
+    'Evaluator': 'evaluator',
+    'ExponentialShift': 'exponential_shift',
+    'FailOnNonNumber': 'fail_on_nonnumber',
+    'LinearShift': 'linear_shift',
+    'LogReport': 'log_report',
+    'MicroAverage': 'micro_average',
+    'ParameterStatistics': 'parameter_statistics',
+    'PlotReport': 'plot_report',
+    'PrintReport': 'print_report',
+    'ProgressBar': 'progress_bar',
+    'StepTimeReport': 'step_time_report',
+    'observe_lr': 'value_observation',
+    'observe_value': 'value_observation',
+    'VariableStatisticsPlot': 'variable_statistics_plot',
+})
@@ -0,0 +1,75 @@
+import multiprocessing
+
+
+def _init_worker():
+    try:
+        import matplotlib
+    except ImportError:
+        return
+    matplotlib.use('Agg')
+
+
+class BackgroundRenderer(object):
+
+    """Runs functions rendering figures in a background process.
+
+    Each function renders a whole figure from the data given as its
+    arguments, so a request submitted while the process is busy supersedes
+    the previous pending request. The process is started at the first
+    request.
+
+    A request can also be submitted as a function making the function and
+    the arguments to render, which is called only when the request is sent
+    to the process. It is useful to send only the data updated since the
+    previous request, since superseded requests are never made.
+
+    """
+
+    def __init__(self):
+        self._pool = None
+        self._result = None
+        self._pending = None
+
+    def submit(self, func, *args):
+        self.submit_lazy(lambda: (func, args))
+
+    def submit_lazy(self, make_request):
+        if self._pool is None:
+            if hasattr(multiprocessing, 'get_context'):
+                # Forking a process which uses CUDA is unsafe.
+                context = multiprocessing.get_context('spawn')
+            else:
+                context = multiprocessing
+            self._pool = context.Pool(1, initializer=_init_worker)
+        self._pending = make_request
+        self.poll()
+
+    def poll(self):
+        """Submits the pending request if the process is idle."""
+        if self._result is not None:
+            if not self._result.ready():
+                return
+            result, self._result = self._result, None
+            # Raises the error in the process if any.
+            result.get()
+        if self._pending is not None:
+            func, args = self._pending()
+            self._pending = None
+            self._result = self._pool.apply_async(func, args)
+
+    def flush(self):
+        """Waits until all the requests are rendered."""
+        while self._result is not None:
+            self._result.wait()
+            self.poll()
+
+    def close(self):
+        if self._pool is None:
+            return
+        try:
+            self.flush()
+        finally:
+            self._pool.close()
+            self._pool.join()
+            self._pool = None
+            self._pending = None
@@ -1,6 +1,9 @@
 import json
 import os
+import re
 import shutil
+import threading
+import time
 import warnings
 
 import six
@@ -12,6 +15,135 @@ from chainer.training import trigger as trigger_module
 from chainer import utils
 
 
+def _log_files(path):
+    # Returns the paths of the rotated log files in order, followed by the
+    # path of the current log file.
+    dirname, basename = os.path.split(path)
+    pattern = re.compile(re.escape(basename) + r'\.(\d+)$')
+    rotated = []
+    if os.path.isdir(dirname or '.'):
+        for name in os.listdir(dirname or '.'):
+            match = pattern.match(name)
+            if match:
+                rotated.append((int(match.group(1)), name))
+    files = [os.path.join(dirname, name) for _, name in sorted(rotated)]
+    if os.path.exists(path):
+        files.append(path)
+    return files
+
+
+def _read_log(path, n_entries):
+    """Reads the first ``n_entries`` entries of a JSON-lines log."""
+    log = []
+    for file in _log_files(path):
+        with open(file) as f:
+            for line in f:
+                if len(log) == n_entries:
+                    return log
+                log.append(json.loads(line))
+    return log
+
+
+def _truncate_log(path, n_entries):
+    """Discards the entries of a JSON-lines log after ``n_entries``.
+
+    The entries are written after the last snapshot, e.g., by a training
+    process which was stopped after taking the snapshot.
+
+    """
+    count = 0
+    for file in _log_files(path):
+        if count == n_entries:
+            os.remove(file)
+            continue
+        with open(file) as f:
+            lines = f.readlines()
+        if count + len(lines) > n_entries:
+            lines = lines[:n_entries - count]
+            dirname, basename = os.path.split(file)
+            with utils.tempdir(prefix=basename, dir=dirname or '.') as tempd:
+                temp_path = os.path.join(tempd, 'log.jsonl')
+                with open(temp_path, 'w') as f:
+                    f.writelines(lines)
+                shutil.move(temp_path, file)
+        count += len(lines)
+
+
+class _LogWriter(object):
+
+    """Appends lines to a log file in a background thread.
+
+    The log file is rotated when its size exceeds ``rotate_size`` bytes or it
+    has been written for ``rotate_interval`` seconds. The rotated files are
+    renamed with suffixes ``.1``, ``.2``, ... in the order of rotation.
+
+    """
+
+    def __init__(self, path, rotate_size=None, rotate_interval=None):
+        self.path = path
+        self.rotate_size = rotate_size
+        self.rotate_interval = rotate_interval
+        self._error = None
+        self._queue = six.moves.queue.Queue()
+        self._thread = threading.Thread(
+            target=self._run, name='log_writer')
+        self._thread.daemon = True
+        self._thread.start()
+
+    def write(self, line):
+        self._check_error()
+        self._queue.put(line)
+
+    def flush(self):
+        """Waits until all the lines are written."""
+        self._queue.join()
+        self._check_error()
+
+    def close(self):
+        self._queue.put(None)
+        self._thread.join()
+        self._check_error()
+
+    def _check_error(self):
+        if self._error is not None:
+            error, self._error = self._error, None
+            raise error
+
+    def _run(self):
+        f = None
+        try:
+            while True:
+                line = self._queue.get()
+                try:
+                    if line is None:
+                        return
+                    f = self._write(f, line)
+                except Exception as e:
+                    self._error = e
+                finally:
+                    self._queue.task_done()
+        finally:
+            if f is not None:
+                f.close()
+
+    def _write(self, f, line):
+        if f is not None and f.tell() > 0 and (
+                self.rotate_size is not None and
+                f.tell() + len(line) > self.rotate_size or
+                self.rotate_interval is not None and
+                time.time() - self._opened_at >= self.rotate_interval):
+            f.close()
+            f = None
+            n_rotated = len(_log_files(self.path)) - 1
+            os.rename(self.path, '%s.%d' % (self.path, n_rotated + 1))
+        if f is None:
+            f = open(self.path, 'a')
+            self._opened_at = time.time()
+        f.write(line)
+        f.flush()
+        return f
+
+
 class LogReport(extension.Extension):
 
     """Trainer extension to output the accumulated results to a log file.
@@ -51,20 +183,61 @@ class LogReport(extension.Extension):
             be a format string: the last result dictionary is passed for the
             formatting. For example, users can use '{iteration}' to separate
             the log files for different iterations. If the log name is None, it
-            does not output the log to any file.
+            does not output the log to any file. In the JSON-lines format,
+            the log name is not formatted.
+        format (str): Format of the log file. If it is ``'json'``, the whole
+            list of the result dictionaries is written to the log file at
+            every output. If it is ``'json-lines'``, each result dictionary is
+            appended to the log file as a line of JSON by a background thread,
+            so that the cost of the output does not grow with the length of
+            the training.
+        rotate_size (int): Maximum size of a log file in bytes in the
+            JSON-lines format. When the log file exceeds this size, it is
+            renamed with a suffix of a serial number (e.g., ``log.1``) and a
+            new log file is started.
+        rotate_interval (float): Maximum period in seconds to write a log file
+            in the JSON-lines format, after which the log file is rotated as
+            ``rotate_size``.
+
+    In the JSON-lines format, snapshots of this extension only hold the
+    number of the result dictionaries instead of the dictionaries themselves.
+    After resuming the training from a snapshot, :attr:`log` is read from the
+    log files on demand, and the results written after the snapshot are
+    discarded from the log files.
 
     """
 
     def __init__(self, keys=None, trigger=(1, 'epoch'), postprocess=None,
-                 log_name='log'):
+                 log_name='log', format='json', rotate_size=None,
+                 rotate_interval=None):
+        if format not in ('json', 'json-lines'):
+            raise ValueError('unsupported log format: %s' % format)
+        if format != 'json-lines' and (rotate_size is not None or
+                                       rotate_interval is not None):
+            raise ValueError(
+                'rotation is only supported in the json-lines format')
         self._keys = keys
         self._trigger = trigger_module.get_trigger(trigger)
         self._postprocess = postprocess
         self._log_name = log_name
+        self._format = format
+        self._rotate_size = rotate_size
+        self._rotate_interval = rotate_interval
         self._log = []
+        self._n_entries = 0
+        self._path = None
+        self._writer = None
 
         self._init_summary()
 
+    @property
+    def _streaming(self):
+        return self._format == 'json-lines' and self._log_name is not None
+
+    def initialize(self, trainer):
+        if self._streaming:
+            self._path = os.path.join(trainer.out, self._log_name)
+
     def __call__(self, trainer):
         # accumulate the observations
         keys = self._keys
@@ -91,10 +264,16 @@ class LogReport(extension.Extension):
             if self._postprocess is not None:
                 self._postprocess(stats_cpu)
 
-            self._log.append(stats_cpu)
+            if self._streaming:
+                writer = self._get_writer(trainer)
+            self._n_entries += 1
+            if self._log is not None:
+                self._log.append(stats_cpu)
 
             # write to the log file
-            if self._log_name is not None:
+            if self._streaming:
+                writer.write(json.dumps(stats_cpu) + '\n')
+            elif self._log_name is not None:
                 log_name = self._log_name.format(**stats_cpu)
                 with utils.tempdir(prefix=log_name, dir=trainer.out) as tempd:
                     path = os.path.join(tempd, 'log.json')
@@ -107,11 +286,37 @@ class LogReport(extension.Extension):
             # reset the summary for the next output
             self._init_summary()
 
+    def _get_writer(self, trainer):
+        if self._writer is None:
+            if self._path is None:
+                self._path = os.path.join(trainer.out, self._log_name)
+            # Discard the stale entries of the previous runs.
+            _truncate_log(self._path, self._n_entries)
+            self._writer = _LogWriter(
+                self._path, self._rotate_size, self._rotate_interval)
+        return self._writer
+
+    def _close_writer(self):
+        if self._writer is not None:
+            writer, self._writer = self._writer, None
+            writer.close()
+
     @property
     def log(self):
         """The current list of observation dictionaries."""
+        if self._log is None:
+            if self._writer is not None:
+                self._writer.flush()
+            if self._path is None:
+                raise RuntimeError(
+                    'the log cannot be read before the extension is '
+                    'initialized by the trainer')
+            self._log = _read_log(self._path, self._n_entries)
         return self._log
 
+    def finalize(self):
+        self._close_writer()
+
     def serialize(self, serializer):
         if hasattr(self._trigger, 'serialize'):
             self._trigger.serialize(serializer['_trigger'])
@@ -121,6 +326,18 @@ class LogReport(extension.Extension):
         except KeyError:
             warnings.warn('The statistics are not saved.')
 
+        if self._streaming:
+            # The log is read from the log files after resuming.
+            if isinstance(serializer, serializer_module.Serializer):
+                if self._writer is not None:
+                    self._writer.flush()
+                serializer('_n_entries', self._n_entries)
+            else:
+                self._close_writer()
+                self._n_entries = serializer('_n_entries', 0)
+                self._log = None
+            return
+
         # Note that this serialization may lose some information of small
         # numerical differences.
         if isinstance(serializer, serializer_module.Serializer):
@@ -129,6 +346,7 @@ class LogReport(extension.Extension):
         else:
             log = serializer('_log', '')
             self._log = json.loads(log)
+            self._n_entries = len(self._log)
 
     def _init_summary(self):
         self._summary = reporter.DictSummary()
@@ -1,3 +1,5 @@
+from multiprocessing import pool
+
 import numpy
 import six
 
@@ -6,6 +8,74 @@ from chainer.backends import cuda
 from chainer import reporter
 from chainer.training import extension
 from chainer.training import trigger as trigger_module
+from chainer.training import util
+
+
+_get_time = util.get_time
+
+
+_chunk_size = 1 << 16
+
+
+def _moments(x):
+    """Computes the mean, std, min and max of a one-dimensional array.
+
+    On CPU, the array is processed in chunks small enough to stay in the
+    cache, so that it is read from the memory only once. On GPU, each
+    statistic is computed by a reduction kernel without allocating
+    temporary arrays, and the results are kept on the device.
+
+    """
+    size = x.size
+    if size == 0:
+        return {'mean': numpy.nan, 'std': numpy.nan,
+                'min': numpy.nan, 'max': numpy.nan}
+
+    if isinstance(x, numpy.ndarray):
+        s = s2 = 0.
+        lo = numpy.inf
+        hi = -numpy.inf
+        buf = numpy.empty(min(size, _chunk_size), numpy.float64)
+        for i in six.moves.range(0, size, _chunk_size):
+            chunk = x[i:i + _chunk_size]
+            c = buf[:len(chunk)]
+            c[...] = chunk
+            s += c.sum()
+            s2 += c.dot(c)
+            # NumPy functions propagate NaN unlike the built-in ones.
+            lo = numpy.minimum(lo, c.min())
+            hi = numpy.maximum(hi, c.max())
+        mean = s / size
+        std = numpy.sqrt(numpy.maximum(s2 / size - mean * mean, 0.))
+        return {'mean': mean, 'std': std, 'min': lo, 'max': hi}
+
+    xp = cuda.cupy
+    s = x.sum(dtype=numpy.float64)
+    s2 = cuda.reduce(
+        'T x', 'float64 y', 'x * x', 'a + b', 'y = a', '0',
+        'parameter_statistics_sum_of_squares')(x)
+    mean = s / size
+    std = xp.sqrt(xp.maximum(s2 / size - mean * mean, 0.))
+    return {'mean': mean, 'std': std, 'min': x.min(), 'max': x.max()}
+
+
+_moment_names = ('mean', 'std', 'min', 'max')
+
+
+def _choice(random, n, size):
+    """Chooses sorted distinct integers in ``[0, n)`` at random.
+
+    Unlike ``random.choice(n, size, replace=False)``, it does not permute all
+    the integers unless ``size`` is comparable to ``n``.
+
+    """
+    if size * 2 > n:
+        return numpy.sort(random.permutation(n)[:size])
+    index = numpy.unique(random.randint(0, n, size))
+    while len(index) < size:
+        index = numpy.unique(numpy.concatenate(
+            (index, random.randint(0, n, size - len(index)))))
+    return index
 
 
 class ParameterStatistics(extension.Extension):
@@ -44,6 +114,30 @@ class ParameterStatistics(extension.Extension):
             parameters including NaNs and a single NaN value is immediately
             reported instead. Otherwise, this extension will simply try to
             compute the statistics without performing any checks for NaNs.
+        sample_size (int): If it is given, the statistics of each parameter
+            are computed from at most this number of its elements, which
+            bounds the cost for huge models. Note that the statistics
+            depending on the number of elements such as ``zeros`` are also
+            computed from the sampled elements.
+        sampling (str): The method to sample the elements. If it is
+            ``'random'``, a random subset of the elements, which is chosen
+            without replacement at the first call and fixed afterwards, is
+            used. If it is ``'stride'``, the elements at a regular interval
+            are used, which does not copy the parameter.
+        n_threads (int): If it is positive, the statistics of parameters on
+            CPU are computed in parallel by this number of threads. The
+            statistics functions must be thread-safe.
+        max_overhead (float): If it is given, the computation is skipped at
+            some calls so that the time spent by this extension does not
+            exceed this fraction of the elapsed time of the training. The
+            statistics are always computed at least once for each report.
+        seed (int): Seed of the random numbers to sample the elements. The
+            global random state of NumPy is not used.
+
+    The mean, the standard deviation, the minimum and the maximum in
+    :attr:`default_statistics` are computed together in a single pass over
+    each parameter.
+
     """
     default_name = 'parameter_statistics'
     priority = extension.PRIORITY_WRITER
@@ -64,7 +158,11 @@ class ParameterStatistics(extension.Extension):
 
     def __init__(self, links, statistics=default_statistics,
                  report_params=True, report_grads=True, prefix=None,
-                 trigger=(1, 'epoch'), skip_nan_params=False):
+                 trigger=(1, 'epoch'), skip_nan_params=False,
+                 sample_size=None, sampling='random', n_threads=0,
+                 max_overhead=None, seed=None):
+        if sampling not in ('random', 'stride'):
+            raise ValueError('unsupported sampling method: %s' % sampling)
 
         if not isinstance(links, (list, tuple)):
             links = links,
@@ -85,6 +183,16 @@ class ParameterStatistics(extension.Extension):
         self._trigger = trigger_module.get_trigger(trigger)
         self._summary = reporter.DictSummary()
         self._skip_nan_params = skip_nan_params
+        self._sample_size = sample_size
+        self._sampling = sampling
+        self._sample_indices = {}
+        self._random = numpy.random.RandomState(seed)
+        self._n_threads = n_threads
+        self._pool = None
+        self._max_overhead = max_overhead
+        self._start_at = None
+        self._cost = 0.
+        self._n_computed = 0
 
     def __call__(self, trainer):
         """Execute the statistics extension.
@@ -99,45 +207,117 @@ class ParameterStatistics(extension.Extension):
             trainer (~chainer.training.Trainer): Associated trainer that
                 invoked this extension.
         """
-        statistics = {}
+        fire = self._trigger(trainer)
+        now = _get_time()
+        if self._start_at is None:
+            self._start_at = now
+        if fire and self._n_computed == 0 or not self._skip(now):
+            self._summary.add(self._compute_statistics())
+            self._cost += _get_time() - now
+            self._n_computed += 1
+
+        if fire:
+            reporter.report(self._summary.compute_mean())
+            self._summary = reporter.DictSummary()  # Clear summary
+            self._n_computed = 0
+
+    def finalize(self):
+        if self._pool is not None:
+            self._pool.close()
+            self._pool.join()
+            self._pool = None
+
+    def _skip(self, now):
+        if self._max_overhead is None:
+            return False
+        return self._cost > self._max_overhead * (now - self._start_at)
 
+    def _compute_statistics(self):
+        prefix = self._prefix + '/' if self._prefix else ''
+        keys = []
+        arrays = []
         for link in self._links:
             link_name = getattr(link, 'name', 'None')
             for param_name, param in link.namedparams():
                 for attr_name in self._attrs:
-                    for function_name, function in \
-                            six.iteritems(self._statistics):
-                        # Get parameters as a flattend one-dimensional array
-                        # since the statistics function should make no
-                        # assumption about the axes
-                        params = getattr(param, attr_name).ravel()
-                        if (self._skip_nan_params
-                            and (cuda.get_array_module(params).isnan(params)
-                                 .any())):
-                            value = numpy.nan
-                        else:
-                            value = function(params)
-                        key = self.report_key_template.format(
-                            prefix=self._prefix + '/' if self._prefix else '',
-                            link_name=link_name,
-                            param_name=param_name,
-                            attr_name=attr_name,
-                            function_name=function_name
-                        )
-                        if (isinstance(value, chainer.get_array_types())
-                                and value.size > 1):
-                            # Append integer indices to the keys if the
-                            # statistic function return multiple values
-                            statistics.update({'{}/{}'.format(key, i): v for
-                                               i, v in enumerate(value)})
-                        else:
-                            statistics[key] = value
-
-        self._summary.add(statistics)
-
-        if self._trigger(trainer):
-            reporter.report(self._summary.compute_mean())
-            self._summary = reporter.DictSummary()  # Clear summary
+                    key = {
+                        'prefix': prefix,
+                        'link_name': link_name,
+                        'param_name': param_name,
+                        'attr_name': attr_name,
+                    }
+                    keys.append(key)
+                    # Get parameters as a flattend one-dimensional array
+                    # since the statistics function should make no
+                    # assumption about the axes
+                    arrays.append(self._sample(
+                        (link_name, param_name, attr_name),
+                        getattr(param, attr_name).ravel()))
+
+        if self._n_threads > 0:
+            if self._pool is None:
+                self._pool = pool.ThreadPool(self._n_threads)
+            cpu = [i for i, x in enumerate(arrays)
+                   if isinstance(x, numpy.ndarray)]
+            values = [None] * len(arrays)
+            cpu_values = self._pool.map(
+                self._compute, [arrays[i] for i in cpu])
+            for i, v in zip(cpu, cpu_values):
+                values[i] = v
+            for i, x in enumerate(arrays):
+                if values[i] is None:
+                    values[i] = self._compute(x)
+        else:
+            values = [self._compute(x) for x in arrays]
+
+        statistics = {}
+        for key, stats in zip(keys, values):
+            for function_name, value in stats:
+                name = self.report_key_template.format(
+                    function_name=function_name, **key)
+                if (isinstance(value, chainer.get_array_types())
+                        and value.size > 1):
+                    # Append integer indices to the keys if the
+                    # statistic function return multiple values
+                    statistics.update({'{}/{}'.format(name, i): v for
+                                       i, v in enumerate(value)})
+                else:
+                    statistics[name] = value
+        return statistics
+
+    def _sample(self, key, x):
+        size = self._sample_size
+        if size is None or x.size <= size:
+            return x
+        if self._sampling == 'stride':
+            return x[::x.size // size][:size]
+        indices = self._sample_indices.get(key)
+        if indices is None or indices[0] != x.size:
+            index = _choice(self._random, x.size, size)
+            with cuda.get_device_from_array(x):
+                index = cuda.get_array_module(x).asarray(index)
+            indices = self._sample_indices[key] = x.size, index
+        return x[indices[1]]
+
+    def _compute(self, x):
+        # Returns a list of pairs of the name and the value of statistics.
+        statistics = self._statistics
+        if (self._skip_nan_params
+                and cuda.get_array_module(x).isnan(x).any()):
+            return [(name, numpy.nan) for name in statistics]
+
+        moments = None
+        default = self.default_statistics
+        values = []
+        for name, function in six.iteritems(statistics):
+            if name in _moment_names and function is default.get(name):
+                if moments is None:
+                    moments = _moments(x)
+                value = moments[name]
+            else:
+                value = function(x)
+            values.append((name, value))
+        return values
 
     def register_statistics(self, name, function):
         """Register a function to compute a certain statistic.
@@ -1,3 +1,4 @@
+import functools
 import json
 from os import path
 import warnings
@@ -8,6 +9,7 @@ import six
 from chainer import reporter
 from chainer import serializer as serializer_module
 from chainer.training import extension
+from chainer.training.extensions import _renderer
 from chainer.training import trigger as trigger_module
 
 
@@ -28,6 +30,48 @@ def _check_available():
                       '  $ pip install matplotlib\n')
 
 
+def _plot(plt, file_path, data, x_key, marker, grid, postprocess=None,
+          summary=None):
+    f = plt.figure()
+    a = f.add_subplot(111)
+    a.set_xlabel(x_key)
+    if grid:
+        a.grid()
+
+    for k, xy in data:
+        if len(xy) == 0:
+            continue
+
+        xy = numpy.array(xy)
+        a.plot(xy[:, 0], xy[:, 1], marker=marker, label=k)
+
+    if a.has_data():
+        if postprocess is not None:
+            postprocess(f, a, summary)
+        legend = a.legend(
+            bbox_to_anchor=(1.05, 1), loc=2, borderaxespad=0.)
+        f.savefig(file_path, bbox_extra_artists=(legend,),
+                  bbox_inches='tight')
+
+    plt.close()
+
+
+# Points of the plots accumulated in the background process.
+_rendered_data = {}
+
+
+def _render(file_path, new_data, reset, *args):
+    # Renders a plot in the background process, which receives only the
+    # points added since the previous rendering.
+    import matplotlib.pyplot as plt
+    if reset:
+        _rendered_data[file_path] = {}
+    data = _rendered_data.setdefault(file_path, {})
+    for k, points in new_data:
+        data.setdefault(k, []).extend(points)
+    _plot(plt, file_path, [(k, data[k]) for k, _ in new_data], *args)
+
+
 class PlotReport(extension.Extension):
 
     """Trainer extension to output plots.
@@ -65,7 +109,8 @@ class PlotReport(extension.Extension):
             trainer.run()
 
         Then, once one of instances of this extension is called,
-        ``matplotlib.use`` will have no effect.
+        ``matplotlib.use`` will have no effect. Plots rendered in the
+        background always use the ``Agg`` backend.
 
     For the details, please see here:
     https://matplotlib.org/faq/usage_faq.html#what-is-a-backend
@@ -87,12 +132,22 @@ class PlotReport(extension.Extension):
         marker (str): The marker used to plot the graph. Default is ``'x'``. If
             ``None`` is given, it draws with no markers.
         grid (bool): Set the axis grid on if True. Default is True.
+        background (bool): If ``True``, the plot is rendered in a background
+            process, so that the training is not blocked by rendering. Only
+            the points added since the previous rendering are sent to the
+            process, which keeps the whole data of the plot. If a plot is
+            requested while the previous one is being rendered, only the
+            latest request is rendered after it. The rendering is completed
+            when the training finishes. ``postprocess`` must be picklable in
+            this mode. Note that the background process is started with the
+            ``spawn`` method (on Python 3), which imports the main module of
+            the training script again.
 
     """
 
     def __init__(self, y_keys, x_key='iteration', trigger=(1, 'epoch'),
                  postprocess=None, file_name='plot.png', marker='x',
-                 grid=True):
+                 grid=True, background=False):
 
         _check_available()
 
@@ -108,6 +163,10 @@ class PlotReport(extension.Extension):
         self._postprocess = postprocess
         self._init_summary()
         self._data = {k: [] for k in y_keys}
+        # Number of the points of each key sent to the background process.
+        # It is None if the process does not have the data yet.
+        self._n_sent = None
+        self._renderer = _renderer.BackgroundRenderer() if background else None
 
     @staticmethod
     def available():
@@ -115,12 +174,10 @@ class PlotReport(extension.Extension):
         return _available
 
     def __call__(self, trainer):
-        if _available:
-            # Dynamically import pyplot to call matplotlib.use()
-            # after importing chainer.training.extensions
-            import matplotlib.pyplot as plt
-        else:
+        if not _available:
             return
+        if self._renderer is not None:
+            self._renderer.poll()
 
         keys = self._y_keys
         observation = trainer.observation
@@ -147,30 +204,40 @@ class PlotReport(extension.Extension):
                 if k in stats_cpu:
                     data[k].append((x, stats_cpu[k]))
 
-            f = plt.figure()
-            a = f.add_subplot(111)
-            a.set_xlabel(self._x_key)
-            if self._grid:
-                a.grid()
-
-            for k in keys:
-                xy = data[k]
-                if len(xy) == 0:
-                    continue
-
-                xy = numpy.array(xy)
-                a.plot(xy[:, 0], xy[:, 1], marker=self._marker, label=k)
+            file_path = path.join(trainer.out, self._file_name)
+            if self._renderer is not None:
+                # The summary is only needed by the postprocess.
+                if self._postprocess is None:
+                    summary = None
+                self._renderer.submit_lazy(
+                    functools.partial(self._make_request, file_path, summary))
+            else:
+                # Dynamically import pyplot to call matplotlib.use()
+                # after importing chainer.training.extensions
+                import matplotlib.pyplot as plt
+                _plot(plt, file_path, [(k, data[k]) for k in keys],
+                      self._x_key, self._marker, self._grid,
+                      self._postprocess, summary)
 
-            if a.has_data():
-                if self._postprocess is not None:
-                    self._postprocess(f, a, summary)
-                l = a.legend(bbox_to_anchor=(1.05, 1), loc=2, borderaxespad=0.)
-                f.savefig(path.join(trainer.out, self._file_name),
-                          bbox_extra_artists=(l,), bbox_inches='tight')
-
-            plt.close()
             self._init_summary()
 
+    def _make_request(self, file_path, summary):
+        # Called when the request is sent to the background process.
+        reset = self._n_sent is None
+        if reset:
+            self._n_sent = {}
+        new_data = []
+        for k in self._y_keys:
+            points = self._data.get(k, [])
+            new_data.append((k, points[self._n_sent.get(k, 0):]))
+            self._n_sent[k] = len(points)
+        return _render, (file_path, new_data, reset, self._x_key,
+                         self._marker, self._grid, self._postprocess, summary)
+
+    def finalize(self):
+        if self._renderer is not None:
+            self._renderer.close()
+
     def serialize(self, serializer):
         if isinstance(serializer, serializer_module.Serializer):
             serializer('_plot_{}'.format(self._file_name),
@@ -179,6 +246,7 @@ class PlotReport(extension.Extension):
         else:
             self._data = json.loads(
                 serializer('_plot_{}'.format(self._file_name), ''))
+            self._n_sent = None
 
     def _init_summary(self):
         self._summary = reporter.DictSummary()
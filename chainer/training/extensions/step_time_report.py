@@ -0,0 +1,92 @@
+import warnings
+
+import six
+
+from chainer import reporter
+from chainer.training import extension
+from chainer.training import trigger as trigger_module
+
+
+class StepTimeReport(extension.Extension):
+
+    """Trainer extension to report the time breakdown of training steps.
+
+    This extension turns on the time measurement of the trainer and the
+    updater (see the ``measure_time`` attributes of
+    :class:`~chainer.training.Trainer` and
+    :class:`~chainer.training.updaters.StandardUpdater`), which report the
+    wall times of the phases of each iteration as ``time/...`` entries of the
+    observation. The time measurement is disabled unless this extension is
+    registered, so it does not slow down the training otherwise.
+
+    At each iteration, this extension adds ``time/iterator_ratio``, the
+    fraction of the update spent waiting for the iterator, to the
+    observation, so that it can be logged by
+    :class:`~chainer.training.extensions.LogReport` together with the other
+    ``time/...`` entries. The ratio is accumulated and, when ``trigger``
+    fires, its mean over the interval is compared with ``threshold``. If it
+    exceeds the threshold, the training is considered to be starved of data
+    and a warning is issued; a faster iterator such as
+    :class:`~chainer.iterators.MultiprocessIterator` may help in this case.
+
+    Args:
+        trigger: Trigger that decides when to check the accumulated times.
+            If it is a tuple in the form ``<int>, 'epoch'`` or
+            ``<int>, 'iteration'``, it is passed to :class:`IntervalTrigger`.
+        threshold (float): The fraction of time spent on the iterator above
+            which the training is considered to be starved of data.
+
+    Attributes:
+        summary (dict): Mean values of the ``time/...`` entries over the last
+            interval. It is empty until the trigger fires first.
+        starving (bool): Whether the training was starved of data in the last
+            interval.
+
+    """
+
+    trigger = 1, 'iteration'
+    priority = extension.PRIORITY_EDITOR
+
+    def __init__(self, trigger=(100, 'iteration'), threshold=0.2):
+        self._trigger = trigger_module.get_trigger(trigger)
+        self.threshold = threshold
+        self.summary = {}
+        self.starving = False
+        self._summary = reporter.DictSummary()
+
+    def initialize(self, trainer):
+        trainer.measure_time = True
+        updater = trainer.updater
+        if hasattr(updater, 'measure_time'):
+            updater.measure_time = True
+        else:
+            warnings.warn(
+                '{} does not support the time measurement; only the time of '
+                'extensions is reported.'.format(type(updater).__name__))
+
+    def __call__(self, trainer):
+        observation = trainer.observation
+        step = observation.get('time/step')
+        if step:
+            observation['time/iterator_ratio'] = (
+                observation['time/iterator'] / step)
+        self._summary.add({k: v for k, v in six.iteritems(observation)
+                           if k.startswith('time/')})
+
+        if self._trigger(trainer):
+            self.summary = {k: float(v) for k, v in
+                            six.iteritems(self._summary.compute_mean())}
+            ratio = self.summary.get('time/iterator_ratio', 0.)
+            self.starving = ratio > self.threshold
+            if self.starving:
+                warnings.warn(
+                    'The training is starved of data: {:.1%} of each update '
+                    'is spent waiting for the iterator at iteration {}. '
+                    'Consider using a faster iterator.'.format(
+                        ratio, trainer.updater.iteration), RuntimeWarning)
+            self._summary = reporter.DictSummary()
+
+    def serialize(self, serializer):
+        if hasattr(self._trigger, 'serialize'):
+            self._trigger.serialize(serializer['_trigger'])
+        self._summary.serialize(serializer['_summary'])
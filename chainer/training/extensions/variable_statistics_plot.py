@@ -8,6 +8,7 @@ import six
 import chainer
 from chainer.backends import cuda
 from chainer.training import extension
+from chainer.training.extensions import _renderer
 from chainer.training import trigger as trigger_module
 
 
@@ -118,6 +119,185 @@ class Statistician(object):
         return out
 
 
+class StreamingStatistician(object):
+
+    """Helper to compute approximate statistics of a sequence of arrays.
+
+    Unlike :class:`Statistician`, it computes the statistics of the elements
+    of all the given arrays without concatenating them. The mean and the
+    standard deviation are computed from the sums of the elements and their
+    squares. The percentiles are approximated by a histogram with ``n_bins``
+    bins of equal width between the minimum and the maximum, which is
+    accumulated over the arrays without sorting the elements. The error of
+    each percentile is less than the width of a bin, and the 0th and the
+    100th percentiles are exact.
+
+    """
+
+    def __init__(self, collect_mean, collect_std, percentile_sigmas,
+                 n_bins=1000):
+        self.collect_mean = collect_mean
+        self.collect_std = collect_std
+        self.percentile_sigmas = percentile_sigmas
+        self.n_bins = n_bins
+
+    def __call__(self, xs):
+        """Computes the statistics on the host.
+
+        Args:
+            xs (list of arrays): Arrays on a device.
+
+        Returns:
+            dict: Statistics as NumPy arrays.
+
+        """
+        xp = cuda.get_array_module(xs[0])
+        size = sum(x.size for x in xs)
+        out = {}
+
+        if self.collect_mean or self.collect_std:
+            s = xp.stack([x.sum(dtype=numpy.float64) for x in xs]).sum()
+            mean = float(s) / size
+            if self.collect_mean:
+                out['mean'] = numpy.asarray(mean)
+            if self.collect_std:
+                s2 = xp.stack([(x * x).sum(dtype=numpy.float64)
+                               for x in xs]).sum()
+                var = max(float(s2) / size - mean * mean, 0.)
+                out['std'] = numpy.asarray(numpy.sqrt(var))
+
+        if self.percentile_sigmas:
+            lo = float(xp.stack([x.min() for x in xs]).min())
+            hi = float(xp.stack([x.max() for x in xs]).max())
+            q = numpy.atleast_1d(
+                numpy.asarray(self.percentile_sigmas, numpy.float64))
+            if hi > lo:
+                counts = self._histogram(xs, lo, hi)
+                p = self._percentile(counts, lo, hi, q)
+            else:
+                p = numpy.full(q.shape, lo)
+            out['percentile'] = p
+
+        return out
+
+    def _histogram(self, xs, lo, hi):
+        xp = cuda.get_array_module(xs[0])
+        n_bins = self.n_bins
+        scale = n_bins / (hi - lo)
+        counts = xp.zeros(n_bins, numpy.int64)
+        for x in xs:
+            bins = ((x.ravel() - lo) * scale).astype(numpy.int32)
+            xp.clip(bins, 0, n_bins - 1, out=bins)
+            counts += xp.bincount(bins, minlength=n_bins)
+        return cuda.to_cpu(counts)
+
+    def _percentile(self, counts, lo, hi, q):
+        cum = numpy.cumsum(counts)
+        n = cum[-1]
+
+        def element(r):
+            # Estimates the r-th smallest element assuming that the elements
+            # in each bin are evenly spaced. The estimate is in the same bin
+            # as the element.
+            i = numpy.searchsorted(cum, r, side='right')
+            position = i + (r - (cum[i] - counts[i]) + 0.5) / counts[i]
+            x = lo + position * ((hi - lo) / len(counts))
+            x[r == 0] = lo
+            x[r == n - 1] = hi
+            return x
+
+        # Interpolates the two nearest elements as numpy.percentile.
+        rank = numpy.clip(q / 100 * (n - 1), 0, n - 1)
+        r0 = numpy.floor(rank).astype(numpy.int64)
+        r1 = numpy.minimum(r0 + 1, n - 1)
+        x0 = element(r0)
+        return x0 + (rank - r0) * (element(r1) - x0)
+
+
+def _plot(plt, file_path, idxs, data, keys, plot_mean, plot_std,
+          plot_percentile, figsize, marker, grid):
+    nrows = int(plot_mean or plot_std) + int(plot_percentile)
+    ncols = len(keys)
+
+    fig, axes = plt.subplots(nrows, ncols, figsize=figsize, sharex=True)
+
+    if not isinstance(axes, numpy.ndarray):  # single subplot
+        axes = numpy.asarray([axes])
+    if nrows == 1:
+        axes = axes[None, :]
+    elif ncols == 1:
+        axes = axes[:, None]
+    assert axes.ndim == 2
+
+    # Offset to access percentile data from `data`
+    offset = int(plot_mean) + int(plot_std)
+    n_percentile = data.shape[-1] - offset
+    n_percentile_mid_floor = n_percentile // 2
+    n_percentile_odd = n_percentile % 2 == 1
+
+    for col in six.moves.range(ncols):
+        row = 0
+        ax = axes[row, col]
+        ax.set_title(keys[col])  # `data` or `grad`
+
+        if plot_mean or plot_std:
+            if plot_mean and plot_std:
+                ax.errorbar(
+                    idxs, data[:, col, 0], data[:, col, 1],
+                    color=_plot_color, ecolor=_plot_color_trans,
+                    label='mean, std', marker=marker)
+            else:
+                if plot_mean:
+                    label = 'mean'
+                elif plot_std:
+                    label = 'std'
+                ax.plot(
+                    idxs, data[:, col, 0], color=_plot_color, label=label,
+                    marker=marker)
+            row += 1
+
+        if plot_percentile:
+            ax = axes[row, col]
+            for i in six.moves.range(n_percentile_mid_floor + 1):
+                if n_percentile_odd and i == n_percentile_mid_floor:
+                    # Enters at most once per sub-plot, in case there is
+                    # only a single percentile to plot or when this
+                    # percentile is the mid percentile and the numner of
+                    # percentiles are odd
+                    ax.plot(
+                        idxs, data[:, col, offset + i], color=_plot_color,
+                        label='percentile', marker=marker)
+                else:
+                    if i == n_percentile_mid_floor:
+                        # Last percentiles and the number of all
+                        # percentiles are even
+                        label = 'percentile'
+                    else:
+                        label = '_nolegend_'
+                    ax.fill_between(
+                        idxs,
+                        data[:, col, offset + i],
+                        data[:, col, -i - 1],
+                        label=label,
+                        **_plot_common_kwargs)
+                ax.set_xlabel('iteration')
+
+    for ax in axes.ravel():
+        ax.legend()
+        if grid:
+            ax.grid()
+            ax.set_axisbelow(True)
+
+    fig.savefig(file_path)
+    plt.close()
+
+
+def _render(*args):
+    # Renders a plot in the background process.
+    import matplotlib.pyplot as plt
+    _plot(plt, *args)
+
+
 class VariableStatisticsPlot(extension.Extension):
 
     """Trainer extension to plot statistics for :class:`Variable`\s.
@@ -172,6 +352,14 @@ class VariableStatisticsPlot(extension.Extension):
         grid (bool):
             Matplotlib ``grid`` argument that specifies whether grids are
             rendered in in the plots or not.
+        percentile_bins (int):
+            If it is given, the percentiles are approximated by a histogram
+            with this number of bins (see :class:`StreamingStatistician`)
+            instead of sorting all the elements of the variables. It is much
+            faster for large models.
+        background (bool):
+            If ``True``, the plot is rendered in a background process as
+            :class:`~chainer.training.extensions.PlotReport`.
     """
 
     def __init__(self, targets, max_sample_size=1000,
@@ -180,7 +368,8 @@ class VariableStatisticsPlot(extension.Extension):
                  percentile_sigmas=(
                      0, 0.13, 2.28, 15.87, 50, 84.13, 97.72, 99.87, 100),
                  trigger=(1, 'epoch'), file_name='statistics.png',
-                 figsize=None, marker=None, grid=True):
+                 figsize=None, marker=None, grid=True, percentile_bins=None,
+                 background=False):
 
         if file_name is None:
             raise ValueError('Missing output file name of statstics plot')
@@ -203,9 +392,15 @@ class VariableStatisticsPlot(extension.Extension):
         self._report_data = report_data
         self._report_grad = report_grad
 
-        self._statistician = Statistician(
-            collect_mean=plot_mean, collect_std=plot_std,
-            percentile_sigmas=percentile_sigmas)
+        if percentile_bins is None:
+            self._statistician = Statistician(
+                collect_mean=plot_mean, collect_std=plot_std,
+                percentile_sigmas=percentile_sigmas)
+        else:
+            self._statistician = StreamingStatistician(
+                collect_mean=plot_mean, collect_std=plot_std,
+                percentile_sigmas=percentile_sigmas, n_bins=percentile_bins)
+        self._streaming = percentile_bins is not None
 
         self._plot_mean = plot_mean
         self._plot_std = plot_std
@@ -227,6 +422,7 @@ class VariableStatisticsPlot(extension.Extension):
         self._data_shape = (
             len(self._keys), int(plot_mean) + int(plot_std) + n_percentile)
         self._samples = Reservoir(max_sample_size, data_shape=self._data_shape)
+        self._renderer = _renderer.BackgroundRenderer() if background else None
 
     @staticmethod
     def available():
@@ -234,14 +430,16 @@ class VariableStatisticsPlot(extension.Extension):
         return _available
 
     def __call__(self, trainer):
-        if _available:
-            # Dynamically import pyplot to call matplotlib.use()
-            # after importing chainer.training.extensions
-            import matplotlib.pyplot as plt
-        else:
+        if not _available:
             return
+        if self._renderer is not None:
+            self._renderer.poll()
 
-        xp = cuda.get_array_module(self._vars[0].data)
+        if self._streaming:
+            # The statistics are computed on the host.
+            xp = numpy
+        else:
+            xp = cuda.get_array_module(self._vars[0].data)
         stats = xp.zeros(self._data_shape, dtype=xp.float32)
         for i, k in enumerate(self._keys):
             xs = []
@@ -250,8 +448,11 @@ class VariableStatisticsPlot(extension.Extension):
                 if x is not None:
                     xs.append(x.ravel())
             if len(xs) > 0:
-                stat_dict = self._statistician(
-                    xp.concatenate(xs, axis=0), axis=0, xp=xp)
+                if self._streaming:
+                    stat_dict = self._statistician(xs)
+                else:
+                    stat_dict = self._statistician(
+                        xp.concatenate(xs, axis=0), axis=0, xp=xp)
                 stat_list = []
                 if self._plot_mean:
                     stat_list.append(xp.atleast_1d(stat_dict['mean']))
@@ -267,84 +468,24 @@ class VariableStatisticsPlot(extension.Extension):
 
         if self._trigger(trainer):
             file_path = os.path.join(trainer.out, self._file_name)
-            self.save_plot_using_module(file_path, plt)
-
-    def save_plot_using_module(self, file_path, plt):
-        nrows = int(self._plot_mean or self._plot_std) \
-            + int(self._plot_percentile)
-        ncols = len(self._keys)
-
-        fig, axes = plt.subplots(
-            nrows, ncols, figsize=self._figsize, sharex=True)
+            if self._renderer is not None:
+                idxs, data = self._samples.get_data()
+                self._renderer.submit(
+                    _render, file_path, idxs, data, self._keys,
+                    self._plot_mean, self._plot_std, self._plot_percentile,
+                    self._figsize, self._marker, self._grid)
+            else:
+                # Dynamically import pyplot to call matplotlib.use()
+                # after importing chainer.training.extensions
+                import matplotlib.pyplot as plt
+                self.save_plot_using_module(file_path, plt)
 
-        if not isinstance(axes, numpy.ndarray):  # single subplot
-            axes = numpy.asarray([axes])
-        if nrows == 1:
-            axes = axes[None, :]
-        elif ncols == 1:
-            axes = axes[:, None]
-        assert axes.ndim == 2
+    def finalize(self):
+        if self._renderer is not None:
+            self._renderer.close()
 
+    def save_plot_using_module(self, file_path, plt):
         idxs, data = self._samples.get_data()
-
-        # Offset to access percentile data from `data`
-        offset = int(self._plot_mean) + int(self._plot_std)
-        n_percentile = data.shape[-1] - offset
-        n_percentile_mid_floor = n_percentile // 2
-        n_percentile_odd = n_percentile % 2 == 1
-
-        for col in six.moves.range(ncols):
-            row = 0
-            ax = axes[row, col]
-            ax.set_title(self._keys[col])  # `data` or `grad`
-
-            if self._plot_mean or self._plot_std:
-                if self._plot_mean and self._plot_std:
-                    ax.errorbar(
-                        idxs, data[:, col, 0], data[:, col, 1],
-                        color=_plot_color, ecolor=_plot_color_trans,
-                        label='mean, std', marker=self._marker)
-                else:
-                    if self._plot_mean:
-                        label = 'mean'
-                    elif self._plot_std:
-                        label = 'std'
-                    ax.plot(
-                        idxs, data[:, col, 0], color=_plot_color, label=label,
-                        marker=self._marker)
-                row += 1
-
-            if self._plot_percentile:
-                ax = axes[row, col]
-                for i in six.moves.range(n_percentile_mid_floor + 1):
-                    if n_percentile_odd and i == n_percentile_mid_floor:
-                        # Enters at most once per sub-plot, in case there is
-                        # only a single percentile to plot or when this
-                        # percentile is the mid percentile and the numner of
-                        # percentiles are odd
-                        ax.plot(
-                            idxs, data[:, col, offset + i], color=_plot_color,
-                            label='percentile', marker=self._marker)
-                    else:
-                        if i == n_percentile_mid_floor:
-                            # Last percentiles and the number of all
-                            # percentiles are even
-                            label = 'percentile'
-                        else:
-                            label = '_nolegend_'
-                        ax.fill_between(
-                            idxs,
-                            data[:, col, offset + i],
-                            data[:, col, -i - 1],
-                            label=label,
-                            **_plot_common_kwargs)
-                    ax.set_xlabel('iteration')
-
-        for ax in axes.ravel():
-            ax.legend()
-            if self._grid:
-                ax.grid()
-                ax.set_axisbelow(True)
-
-        fig.savefig(file_path)
-        plt.close()
+        _plot(plt, file_path, idxs, data, self._keys, self._plot_mean,
+              self._plot_std, self._plot_percentile, self._figsize,
+              self._marker, self._grid)
@@ -1,7 +1,6 @@
 import collections
 import os
 import sys
-import time
 import traceback
 
 import six
@@ -10,17 +9,11 @@ from chainer import reporter as reporter_module
 from chainer import serializer as serializer_module
 from chainer.training import extension as extension_module
 from chainer.training import trigger as trigger_module
+from chainer.training import util
 from chainer.utils import argument
 
 
-# Select the best-resolution timer function
-try:
-    _get_time = time.perf_counter
-except AttributeError:
-    if os.name == 'nt':
-        _get_time = time.clock
-    else:
-        _get_time = time.time
+_get_time = util.get_time
 
 
 class _ExtensionEntry(object):
@@ -127,6 +120,11 @@ class Trainer(object):
             :class:`Reporter` class for details.
         out: Output directory.
         reporter: Reporter object to report observed values.
+        measure_time (bool): If ``True``, the wall time (in seconds) of each
+            extension call is measured and reported to the observation of
+            the next iteration as ``time/extension/<name>``, and the total
+            time of the extensions as ``time/extensions``.
+            :class:`~chainer.training.extensions.StepTimeReport` turns it on.
 
     """
 
@@ -148,6 +146,7 @@ class Trainer(object):
 
         self._done = False
         self._extensions = collections.OrderedDict()
+        self.measure_time = False
 
         self._start_at = None
         self._snapshot_elapsed_time = 0.0
@@ -298,13 +297,16 @@ class Trainer(object):
 
         # main training loop
         try:
-            while not stop_trigger(self):
-                self.observation = {}
-                with reporter.scope(self.observation):
-                    update()
-                    for name, entry in extensions:
-                        if entry.trigger(self):
-                            entry.extension(self)
+            if self.measure_time:
+                self._run_loop_with_time(extensions)
+            else:
+                while not stop_trigger(self):
+                    self.observation = {}
+                    with reporter.scope(self.observation):
+                        update()
+                        for name, entry in extensions:
+                            if entry.trigger(self):
+                                entry.extension(self)
         except Exception as e:
             if show_loop_exception_msg:
                 # Show the exception here, as it will appear as if chainer
@@ -326,6 +328,29 @@ class Trainer(object):
         self._final_elapsed_time = self.elapsed_time
         self._done = True
 
+    def _run_loop_with_time(self, extensions):
+        update = self.updater.update
+        reporter = self.reporter
+        stop_trigger = self.stop_trigger
+        # Extensions run after the updater in each iteration, so their times
+        # are reported to the observation of the next iteration.
+        times = {}
+        while not stop_trigger(self):
+            self.observation = {}
+            with reporter.scope(self.observation):
+                reporter.report(times)
+                update()
+                times = {}
+                total = 0.
+                for name, entry in extensions:
+                    if entry.trigger(self):
+                        start = _get_time()
+                        entry.extension(self)
+                        elapsed_time = _get_time() - start
+                        times['time/extension/' + name] = elapsed_time
+                        total += elapsed_time
+                times['time/extensions'] = total
+
     def serialize(self, serializer):
         self.updater.serialize(serializer['updater'])
         if hasattr(self.stop_trigger, 'serialize'):
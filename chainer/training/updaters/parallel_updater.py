@@ -41,14 +41,17 @@ class ParallelUpdater(standard_updater.StandardUpdater):
             as ``models``.
         loss_func: Loss function. The model is used as a loss function by
             default.
-        loss_scale (float): Loss scaling factor. Loss scaling is a usefull
-            technique to mitigate vanishing gradient issue that tends to happen
-            when low precision data type like float16 is used during training.
-            If you set loss scaling factor, gradients of loss values are to be
-            multiplied by the factor before backprop starts. The factor is
-            propagated to whole gradients in a computational graph along the
-            backprop. The gradients of parameters are divided by the factor
-            just before the parameters are to be updated.
+        loss_scale (float or str): Loss scaling factor. Loss scaling is a
+            usefull technique to mitigate vanishing gradient issue that tends
+            to happen when low precision data type like float16 is used during
+            training. If you set loss scaling factor, gradients of loss values
+            are to be multiplied by the factor before backprop starts. The
+            factor is propagated to whole gradients in a computational graph
+            along the backprop. The gradients of parameters are divided by the
+            factor just before the parameters are to be updated. If it is
+            ``'dynamic'``, the factor is adjusted dynamically and the updates
+            with overflowed gradients are skipped (see
+            :meth:`chainer.Optimizer.loss_scaling`).
 
     """
 
@@ -133,7 +136,7 @@ class ParallelUpdater(standard_updater.StandardUpdater):
             model.cleargrads()
 
         for loss in losses:
-            loss.backward(loss_scale=self.loss_scale)
+            loss.backward(loss_scale=optimizer.loss_scale)
 
         for model in six.itervalues(models_others):
             model_main.addgrads(model)
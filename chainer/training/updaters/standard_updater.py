@@ -1,8 +1,17 @@
+import collections
+
 import six
 
+from chainer.backends import cuda
 from chainer.dataset import convert
 from chainer.dataset import iterator as iterator_module
+from chainer import optimizer as optimizer_module
+from chainer import reporter as reporter_module
 from chainer.training import _updater
+from chainer.training import util
+
+
+_get_time = util.get_time
 
 
 class StandardUpdater(_updater.Updater):
@@ -29,19 +38,29 @@ class StandardUpdater(_updater.Updater):
         converter: Converter function to build input arrays. Each batch
             extracted by the main iterator and the ``device`` option are passed
             to this function. :func:`~chainer.dataset.concat_examples` is used
-            by default.
+            by default. If it has a ``serialize`` method (e.g.
+            :class:`~chainer.datasets.Augmentation`), its state is serialized
+            with the updater.
         device: Device to which the training data is sent. Negative value
             indicates the host memory (CPU).
         loss_func: Loss function. The target link of the main optimizer is used
             by default.
-        loss_scale (float): Loss scaling factor. Loss scaling is a usefull
-            technique to mitigate vanishing gradient issue that tends to happen
-            when low precision data type like float16 is used during training.
-            If you set loss scaling factor, gradients of loss values are to be
-            multiplied by the factor before backprop starts. The factor is
-            propagated to whole gradients in a computational graph along the
-            backprop. The gradients of parameters are divided by the factor
-            just before the parameters are to be updated.
+        loss_scale (float or str): Loss scaling factor. Loss scaling is a
+            usefull technique to mitigate vanishing gradient issue that tends
+            to happen when low precision data type like float16 is used during
+            training. If you set loss scaling factor, gradients of loss values
+            are to be multiplied by the factor before backprop starts. The
+            factor is propagated to whole gradients in a computational graph
+            along the backprop. The gradients of parameters are divided by the
+            factor just before the parameters are to be updated. If it is
+            ``'dynamic'``, the factor is adjusted dynamically and the updates
+            with overflowed gradients are skipped (see
+            :meth:`chainer.Optimizer.loss_scaling`).
+        measure_time (bool): If ``True``, the wall time of each phase of the
+            update is measured and reported. See the ``measure_time``
+            attribute for details.
+        n_micro_batches (int): Number of micro-batches each batch is split
+            into. See the ``n_micro_batches`` attribute for details.
 
     Attributes:
         converter: Converter function.
@@ -49,11 +68,41 @@ class StandardUpdater(_updater.Updater):
                    main optimizer is used instead.
         device: Device to which the training data is sent.
         iteration: Current number of completed updates.
+        measure_time (bool): If ``True``, the default update routine reports
+            the wall times (in seconds) of loading a batch from the iterator
+            (``time/iterator``), the conversion (``time/converter``), the
+            forward computation (``time/forward``), the backward computation
+            (``time/backward``), the update of parameters (``time/update``)
+            and the whole update (``time/step``), and the number of examples
+            processed per second (``time/throughput``) via
+            :func:`chainer.report`. The forward and backward computations are
+            measured separately only if the main optimizer is a
+            :class:`~chainer.GradientMethod`; otherwise their time is
+            included in ``time/update``. The device is synchronized at each
+            phase boundary when ``device`` is a GPU.
+            :class:`~chainer.training.extensions.StepTimeReport` turns it on.
+        n_micro_batches (int): Number of micro-batches each batch is split
+            into. If it is greater than one, the default update routine
+            converts and processes the micro-batches one by one, accumulates
+            their gradients into the gradient arrays of the parameters, and
+            then updates the parameters once. Only the activations of one
+            micro-batch are kept at a time, so that a large batch can be
+            trained with a fraction of the memory. The gradient of the loss of
+            each micro-batch is weighted by its share of the batch, so that
+            the accumulated gradient equals the gradient of the whole batch
+            if the loss is the mean over the examples. The values reported in
+            the micro-batches are averaged. Note that
+            :class:`~chainer.links.BatchNormalization` computes the batch
+            statistics and updates the running averages per micro-batch. The
+            iterator, and hence ``epoch_detail`` and the extensions triggered
+            by it, still advance by one batch per update. It requires the
+            main optimizer to be a :class:`~chainer.GradientMethod`.
 
     """
 
     def __init__(self, iterator, optimizer, converter=convert.concat_examples,
-                 device=None, loss_func=None, loss_scale=None):
+                 device=None, loss_func=None, loss_scale=None,
+                 measure_time=False, n_micro_batches=1):
         if isinstance(iterator, iterator_module.Iterator):
             iterator = {'main': iterator}
         self._iterators = iterator
@@ -70,11 +119,25 @@ class StandardUpdater(_updater.Updater):
         self.loss_func = loss_func
         self.device = device
         self.iteration = 0
+        self.measure_time = measure_time
+
+        if n_micro_batches < 1:
+            raise ValueError('n_micro_batches must be at least 1. Actual: {}'
+                             .format(n_micro_batches))
+        if n_micro_batches > 1 and not isinstance(
+                self._optimizers['main'], optimizer_module.GradientMethod):
+            raise ValueError(
+                'gradient accumulation over micro-batches requires the main '
+                'optimizer to be a GradientMethod')
+        self.n_micro_batches = n_micro_batches
 
         self.loss_scale = loss_scale
         if loss_scale is not None:
             for optimizer in six.itervalues(self._optimizers):
-                optimizer.set_loss_scale(loss_scale)
+                if loss_scale == 'dynamic':
+                    optimizer.loss_scaling()
+                else:
+                    optimizer.set_loss_scale(loss_scale)
 
     @property
     def epoch(self):
@@ -150,12 +213,21 @@ class StandardUpdater(_updater.Updater):
         self.iteration += 1
 
     def update_core(self):
-        batch = self._iterators['main'].next()
-        in_arrays = self.converter(batch, self.device)
+        if self.measure_time:
+            self._update_core_with_time()
+            return
 
+        batch = self._iterators['main'].next()
         optimizer = self._optimizers['main']
         loss_func = self.loss_func or optimizer.target
 
+        if self.n_micro_batches > 1:
+            self._accumulate_grads(batch, optimizer, loss_func)
+            optimizer.update()
+            return
+
+        in_arrays = self.converter(batch, self.device)
+
         if isinstance(in_arrays, tuple):
             optimizer.update(loss_func, *in_arrays)
         elif isinstance(in_arrays, dict):
@@ -163,6 +235,124 @@ class StandardUpdater(_updater.Updater):
         else:
             optimizer.update(loss_func, in_arrays)
 
+    def _accumulate_grads(self, batch, optimizer, loss_func, times=None):
+        # Computes the gradients of the batch by accumulating those of the
+        # micro-batches. The weight of each micro-batch is set to the initial
+        # gradient of its loss, so that the gradients are scaled without
+        # extra computation. If ``times`` is given, the wall time of each
+        # phase is added to it.
+        optimizer._clear_grads()
+        try:
+            reporter = reporter_module.get_current_reporter()
+        except IndexError:
+            reporter = None
+        loss_scale = optimizer.loss_scale
+        summary = reporter_module.DictSummary()
+        micro_observation = {}
+
+        n = len(batch)
+        k = max(min(self.n_micro_batches, n), 1)
+        for i in six.moves.range(k):
+            micro_batch = batch[i * n // k:(i + 1) * n // k]
+            start = _get_time()
+            args, kwargs = _to_arguments(
+                self.converter(micro_batch, self.device))
+            if times is not None:
+                self._synchronize()
+                converter_end = _get_time()
+                times['converter'] += converter_end - start
+
+            micro_observation = {}
+            if reporter is None:
+                loss = loss_func(*args, **kwargs)
+            else:
+                with reporter.scope(micro_observation):
+                    loss = loss_func(*args, **kwargs)
+            if times is not None:
+                self._synchronize()
+                forward_end = _get_time()
+                times['forward'] += forward_end - converter_end
+
+            weight = float(len(micro_batch)) / n
+            if loss_scale is not None:
+                weight *= loss_scale
+            xp = cuda.get_array_module(loss.array)
+            loss.grad = xp.full_like(loss.array, weight)
+            loss.backward(loss_scale=loss_scale)
+            del loss
+            if times is not None:
+                self._synchronize()
+                times['backward'] += _get_time() - forward_end
+
+            summary.add(micro_observation)
+
+        if reporter is not None:
+            # The values of the last micro-batch are kept for the entries
+            # that are not averaged.
+            micro_observation.update(summary.compute_mean())
+            reporter.report(micro_observation)
+
+    def _synchronize(self):
+        if self.device is not None and self.device >= 0:
+            cuda.get_device_from_id(self.device).synchronize()
+
+    def _update_core_with_time(self):
+        start = _get_time()
+        batch = self._iterators['main'].next()
+        iterator_end = _get_time()
+
+        optimizer = self._optimizers['main']
+        loss_func = self.loss_func or optimizer.target
+        observation = {}
+        if self.n_micro_batches > 1:
+            times = collections.defaultdict(float)
+            self._accumulate_grads(batch, optimizer, loss_func, times)
+            backward_end = _get_time()
+            optimizer.update()
+            self._synchronize()
+            end = _get_time()
+
+            observation['time/iterator'] = iterator_end - start
+            for key in ('converter', 'forward', 'backward'):
+                observation['time/' + key] = times[key]
+            observation['time/update'] = end - backward_end
+            observation['time/step'] = end - start
+            if end > start:
+                observation['time/throughput'] = len(batch) / (end - start)
+            reporter_module.report(observation)
+            return
+
+        in_arrays = self.converter(batch, self.device)
+        self._synchronize()
+        converter_end = _get_time()
+        args, kwargs = _to_arguments(in_arrays)
+
+        if isinstance(optimizer, optimizer_module.GradientMethod):
+            # Same as GradientMethod.update with lossfun, split into phases.
+            loss = loss_func(*args, **kwargs)
+            self._synchronize()
+            forward_end = _get_time()
+            optimizer._backward(loss)
+            del loss
+            self._synchronize()
+            backward_end = _get_time()
+            optimizer.update()
+            observation['time/forward'] = forward_end - converter_end
+            observation['time/backward'] = backward_end - forward_end
+        else:
+            backward_end = converter_end
+            optimizer.update(loss_func, *args, **kwargs)
+        self._synchronize()
+        end = _get_time()
+
+        observation['time/iterator'] = iterator_end - start
+        observation['time/converter'] = converter_end - iterator_end
+        observation['time/update'] = end - backward_end
+        observation['time/step'] = end - start
+        if end > start:
+            observation['time/throughput'] = len(batch) / (end - start)
+        reporter_module.report(observation)
+
     def serialize(self, serializer):
         """Serializes the current state of the updater object."""
         for name, iterator in six.iteritems(self._iterators):
@@ -172,4 +362,16 @@ class StandardUpdater(_updater.Updater):
             optimizer.serialize(serializer['optimizer:' + name])
             optimizer.target.serialize(serializer['model:' + name])
 
+        if hasattr(self.converter, 'serialize'):
+            self.converter.serialize(serializer['converter'])
+
         self.iteration = serializer('iteration', self.iteration)
+
+
+def _to_arguments(in_arrays):
+    if isinstance(in_arrays, tuple):
+        return in_arrays, {}
+    elif isinstance(in_arrays, dict):
+        return (), in_arrays
+    else:
+        return (in_arrays,), {}
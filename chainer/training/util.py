@@ -1,6 +1,19 @@
+import os
+import time
+
 from chainer.training.triggers import interval_trigger
 
 
+# Select the best-resolution timer function
+try:
+    get_time = time.perf_counter
+except AttributeError:
+    if os.name == 'nt':
+        get_time = time.clock
+    else:
+        get_time = time.time
+
+
 def get_trigger(trigger):
     """Gets a trigger object.
 
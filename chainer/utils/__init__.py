@@ -7,6 +7,8 @@ import numpy
 # import classes and functions
 from chainer.utils.conv import get_conv_outsize  # NOQA
 from chainer.utils.conv import get_deconv_outsize  # NOQA
+from chainer.utils.decoding import beam_search  # NOQA
+from chainer.utils.decoding import greedy_search  # NOQA
 from chainer.utils.experimental import experimental  # NOQA
 from chainer.utils.walker_alias import WalkerAlias  # NOQA
 
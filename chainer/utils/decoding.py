@@ -0,0 +1,189 @@
+import numpy
+
+import chainer
+from chainer.backends import cuda
+
+
+def _as_array(x):
+    if isinstance(x, chainer.Variable):
+        return x.array
+    return x
+
+
+def greedy_search(step, bos, eos, max_length):
+    """Decodes sequences greedily with a step-wise model.
+
+    At each step, the token with the highest score is selected for every
+    sequence in the mini-batch. Decoding stops when all sequences emit
+    ``eos`` or ``max_length`` steps are computed.
+
+    Args:
+        step (callable): A function that takes an integer array of the
+            previous tokens whose shape is ``(B,)`` and returns scores of
+            the next tokens whose shape is ``(B, V)``, where ``B`` is the
+            mini-batch size and ``V`` is the vocabulary size. It usually
+            updates the recurrent states of the model.
+        bos (numpy.ndarray or cupy.ndarray): Integer array of the first
+            input tokens whose shape is ``(B,)``.
+        eos (int): Token ID which terminates a sequence.
+        max_length (int): Maximum number of steps.
+
+    Returns:
+        list of numpy.ndarray: Decoded token sequences without ``eos``.
+
+    """
+    xp = cuda.get_array_module(bos)
+    batch = len(bos)
+    ys = bos
+    finished = xp.zeros(batch, dtype=bool)
+    result = []
+    for _ in range(max_length):
+        scores = _as_array(step(ys))
+        ys = scores.argmax(axis=1).astype(bos.dtype)
+        result.append(ys)
+        finished |= ys == eos
+        if finished.all():
+            break
+
+    # Using `xp.concatenate(...)` instead of `xp.stack(result)` here to
+    # support NumPy 1.9.
+    result = cuda.to_cpu(
+        xp.concatenate([y[:, None] for y in result], axis=1))
+    outs = []
+    for y in result:
+        inds = numpy.argwhere(y == eos)
+        if len(inds) > 0:
+            y = y[:inds[0, 0]]
+        outs.append(y)
+    return outs
+
+
+def beam_search(step, reorder, bos, eos, beam_size, max_length,
+                length_penalty=0.):
+    """Decodes sequences with batched beam search.
+
+    All hypotheses of all sequences are kept in one mini-batch of size
+    ``B * K``, where ``B`` is the number of sequences and ``K`` is the beam
+    size, so that the model computes one step of every hypothesis with a
+    single call. The ``K`` best candidates of each sequence are selected
+    with :func:`numpy.argpartition` over the ``K * V`` candidates, and the
+    recurrent states of the model are gathered by ``reorder``. Only the
+    selected tokens and back pointers are recorded at each step and the
+    hypotheses are reconstructed once at the end.
+
+    A hypothesis is finished when it emits ``eos``. Decoding stops when all
+    the hypotheses are finished or ``max_length`` steps are computed.
+
+    .. admonition:: Example
+
+       Decoding with :class:`~chainer.links.LSTM`, whose states are replaced
+       via :meth:`~chainer.links.LSTM.set_state`:
+
+       >>> embed = L.EmbedID(10, 4)
+       >>> lstm = L.LSTM(4, 4)
+       >>> out = L.Linear(4, 10)
+       >>> def step(ys):
+       ...     return F.log_softmax(out(lstm(embed(ys))))
+       >>> def reorder(indices):
+       ...     if lstm.h is not None:
+       ...         lstm.set_state(lstm.c[indices], lstm.h[indices])
+       >>> bos = np.zeros(3, dtype=np.int32)
+       >>> with chainer.no_backprop_mode():
+       ...     outs, scores = utils.beam_search(
+       ...         step, reorder, bos, eos=1, beam_size=5, max_length=8)
+       >>> len(outs), scores.shape
+       (3, (3,))
+
+       For :class:`~chainer.links.NStepLSTM`, ``step`` and ``reorder`` can be
+       built on :meth:`chainer.links.NStepRNNDecoder.step` and
+       :meth:`chainer.links.NStepRNNDecoder.reorder`.
+
+    Args:
+        step (callable): A function that takes an integer array of the
+            previous tokens whose shape is ``(B * K,)`` and returns
+            log-probabilities of the next tokens whose shape is
+            ``(B * K, V)``, where ``V`` is the vocabulary size.
+        reorder (callable): A function that takes an integer array
+            ``indices`` and replaces the recurrent states of the model so
+            that the ``i``-th new state is the ``indices[i]``-th old state.
+            It is first called with an array of size ``B * K`` to expand
+            the initial states of ``B`` sequences to the beams.
+        bos (numpy.ndarray or cupy.ndarray): Integer array of the first
+            input tokens whose shape is ``(B,)``.
+        eos (int): Token ID which terminates a hypothesis.
+        beam_size (int): Beam size ``K``.
+        max_length (int): Maximum number of steps.
+        length_penalty (float): Exponent :math:`\\alpha` of the length
+            normalization. The final score of a hypothesis of length
+            :math:`L` is its log-probability divided by :math:`L^\\alpha`.
+            ``0`` means no normalization.
+
+    Returns:
+        tuple: A tuple of the list of the best token sequence for each input
+        without ``eos`` and a :class:`numpy.ndarray` of their normalized
+        scores.
+
+    """
+    xp = cuda.get_array_module(bos)
+    batch = len(bos)
+    n_hyp = batch * beam_size
+    base = xp.arange(batch, dtype=numpy.int32)[:, None] * beam_size
+
+    reorder(xp.repeat(xp.arange(batch, dtype=numpy.int32), beam_size))
+    ys = xp.repeat(bos, beam_size)
+    # Only the first beam of each sequence is alive at the beginning so that
+    # the same hypothesis does not appear more than once.
+    beam_scores = xp.full((batch, beam_size), -numpy.inf, dtype=numpy.float32)
+    beam_scores[:, 0] = 0
+    beam_scores = beam_scores.ravel()
+    finished = xp.zeros(n_hyp, dtype=bool)
+    lengths = xp.zeros(n_hyp, dtype=numpy.int32)
+
+    tokens = []
+    parents = []
+    for _ in range(max_length):
+        scores = _as_array(step(ys)) + beam_scores[:, None]
+        n_vocab = scores.shape[1]
+        # Finished hypotheses are extended only by eos without changing
+        # their scores.
+        scores[finished] = -numpy.inf
+        scores[finished, eos] = beam_scores[finished]
+        scores = scores.reshape(batch, beam_size * n_vocab)
+
+        kth = scores.shape[1] - beam_size
+        top = xp.argpartition(scores, kth, axis=1)[:, kth:]
+        top_scores = scores[xp.arange(batch)[:, None], top]
+
+        origin = (base + top // n_vocab).ravel()
+        ys = (top % n_vocab).astype(bos.dtype).ravel()
+        beam_scores = top_scores.ravel()
+        lengths = lengths[origin] + ~finished[origin]
+        finished = finished[origin] | (ys == eos)
+
+        reorder(origin)
+        tokens.append(ys)
+        parents.append(origin)
+        if finished.all():
+            break
+
+    if length_penalty:
+        beam_scores = beam_scores / (
+            xp.maximum(lengths, 1).astype(numpy.float32) ** length_penalty)
+    beam_scores = cuda.to_cpu(beam_scores).reshape(batch, beam_size)
+    best = beam_scores.argmax(axis=1)
+    tokens = cuda.to_cpu(xp.concatenate([y[None] for y in tokens]))
+    parents = cuda.to_cpu(xp.concatenate([p[None] for p in parents]))
+
+    outs = []
+    for b in range(batch):
+        i = b * beam_size + best[b]
+        seq = []
+        for t in range(len(tokens) - 1, -1, -1):
+            seq.append(tokens[t, i])
+            i = parents[t, i]
+        y = numpy.array(seq[::-1], dtype=tokens.dtype)
+        inds = numpy.argwhere(y == eos)
+        if len(inds) > 0:
+            y = y[:inds[0, 0]]
+        outs.append(y)
+    return outs, beam_scores[numpy.arange(batch), best]
@@ -1,4 +1,7 @@
+from __future__ import division
+
 import numpy
+import six
 
 
 def oversample(images, crop_dims):
@@ -29,3 +32,365 @@ def oversample(images, crop_dims):
         crops[ix:ix + 5] = crops[ix - 5:ix, :, :, ::-1]
         ix += 5
     return crops
+
+
+def _check_batch(images):
+    if images.ndim != 4:
+        raise ValueError(
+            'images must be a batch of images in the shape of '
+            '(N, C, H, W). Actual shape: {}'.format(images.shape))
+
+
+def _check_out(out, shape):
+    if out.shape != tuple(shape):
+        raise ValueError('out must be in the shape of {}. Actual: {}'
+                         .format(tuple(shape), out.shape))
+
+
+def _check_index(index, high):
+    index = int(index)
+    if not 0 <= index <= high:
+        raise IndexError('index {} is out of range [0, {}]'.format(
+            index, high))
+    return index
+
+
+def _check_indices(indices, high):
+    indices = numpy.asarray(indices)
+    if indices.size > 0 and not (0 <= indices.min() and
+                                 indices.max() <= high):
+        raise IndexError('indices {} are out of range [0, {}]'.format(
+            indices, high))
+    return indices
+
+
+def crop(images, top, left, size, out=None):
+    """Crops a batch of images at different positions.
+
+    Args:
+        images (numpy.ndarray): Batch of images in the shape of
+            ``(N, C, H, W)``.
+        top (numpy.ndarray): Integer array of the shape ``(N,)`` that
+            contains the top coordinate of the region of each image.
+        left (numpy.ndarray): Integer array of the shape ``(N,)`` that
+            contains the left coordinate of the region of each image.
+        size (tuple of ints): Height and width of the regions.
+        out (numpy.ndarray): Array of the shape ``(N, C, *size)`` to which
+            the regions are copied without temporary arrays. If it is
+            ``None``, a new array is allocated.
+
+    Returns:
+        numpy.ndarray: Cropped images in the shape of ``(N, C, *size)``.
+
+    """
+    _check_batch(images)
+    n, c, h, w = images.shape
+    height, width = size
+    if not (0 < height <= h and 0 < width <= w):
+        raise ValueError(
+            'invalid crop size {} for images of the size {}'.format(
+                size, (h, w)))
+    if out is not None:
+        _check_out(out, (n, c, height, width))
+        for i in six.moves.range(n):
+            y = _check_index(top[i], h - height)
+            x = _check_index(left[i], w - width)
+            out[i] = images[i, :, y:y + height, x:x + width]
+        return out
+
+    # Negative coordinates would wrap around in the indexing below.
+    top = _check_indices(top, h - height)
+    left = _check_indices(left, w - width)
+    s_n, s_c, s_h, s_w = images.strides
+    # View of all the regions, from which the regions are gathered at once.
+    windows = numpy.lib.stride_tricks.as_strided(
+        images, shape=(n, h - height + 1, w - width + 1, c, height, width),
+        strides=(s_n, s_h, s_w, s_c, s_h, s_w))
+    return windows[numpy.arange(n), top, left]
+
+
+def flip(images, mask, out=None):
+    """Flips the selected images of a batch horizontally.
+
+    Args:
+        images (numpy.ndarray): Batch of images in the shape of
+            ``(N, C, H, W)``.
+        mask (numpy.ndarray): Boolean array of the shape ``(N,)``. The images
+            where it is ``True`` are flipped.
+        out (numpy.ndarray): Array of the same shape as ``images`` to which
+            the images are written. If it is ``None``, a new array is
+            allocated.
+
+    Returns:
+        numpy.ndarray: Batch of images.
+
+    """
+    _check_batch(images)
+    if out is None:
+        out = numpy.empty_like(images)
+    else:
+        _check_out(out, images.shape)
+    mask = numpy.asarray(mask, dtype=bool).reshape(-1, 1, 1, 1)
+    numpy.copyto(out, images[:, :, :, ::-1], where=mask)
+    numpy.copyto(out, images, where=~mask)
+    return out
+
+
+def resized_crop(images, top, left, height, width, size):
+    """Crops regions of different sizes and resizes them to the same size.
+
+    The regions are resized by the nearest neighbor interpolation, so that
+    all the images are processed by one gather operation.
+
+    Args:
+        images (numpy.ndarray): Batch of images in the shape of
+            ``(N, C, H, W)``.
+        top (numpy.ndarray): Integer array of the shape ``(N,)`` that
+            contains the top coordinate of the region of each image.
+        left (numpy.ndarray): Integer array of the shape ``(N,)`` that
+            contains the left coordinate of the region of each image.
+        height (numpy.ndarray): Integer array of the shape ``(N,)`` that
+            contains the height of the region of each image.
+        width (numpy.ndarray): Integer array of the shape ``(N,)`` that
+            contains the width of the region of each image.
+        size (tuple of ints): Height and width of the output images.
+
+    Returns:
+        numpy.ndarray: Resized images in the shape of ``(N, C, *size)``.
+
+    """
+    _check_batch(images)
+    n, c, h, w = images.shape
+    out_h, out_w = size
+    top = numpy.asarray(top)
+    left = numpy.asarray(left)
+    height = numpy.asarray(height)
+    width = numpy.asarray(width)
+    if ((top < 0).any() or (left < 0).any() or (height < 1).any() or
+            (width < 1).any() or (top + height > h).any() or
+            (left + width > w).any()):
+        raise ValueError('regions must be inside the images')
+
+    y = ((numpy.arange(out_h) + 0.5) / out_h * height[:, None]).astype(
+        numpy.intp)
+    x = ((numpy.arange(out_w) + 0.5) / out_w * width[:, None]).astype(
+        numpy.intp)
+    y += top[:, None]
+    x += left[:, None]
+    return images[numpy.arange(n)[:, None, None, None],
+                  numpy.arange(c)[None, :, None, None],
+                  y[:, None, :, None], x[:, None, None, :]]
+
+
+def _gray(x):
+    # Luma of RGB images, or the images themselves if they are grayscale.
+    c = x.shape[1]
+    if c == 1:
+        return x.copy()
+    if c != 3:
+        raise ValueError('images must have 1 or 3 channels. Actual: {}'
+                         .format(c))
+    gray = x[:, 0:1] * 0.299
+    gray += x[:, 1:2] * 0.587
+    gray += x[:, 2:3] * 0.114
+    return gray
+
+
+def adjust_color(images, brightness=None, contrast=None, saturation=None):
+    """Adjusts the brightness, contrast and saturation of a batch of images.
+
+    Each factor is given for each image. The brightness is adjusted by
+    scaling the pixel values, the contrast by scaling the difference from
+    the mean luma of each image, and the saturation by scaling the
+    difference from the luma of each pixel, in this order. A factor of one
+    keeps the image as it is.
+
+    Args:
+        images (numpy.ndarray): Batch of RGB or grayscale images in the shape
+            of ``(N, C, H, W)``.
+        brightness (numpy.ndarray): Array of the shape ``(N,)`` that contains
+            the brightness factor of each image. If it is ``None``, the
+            brightness is not changed.
+        contrast (numpy.ndarray): Array of the shape ``(N,)`` that contains
+            the contrast factor of each image. If it is ``None``, the
+            contrast is not changed.
+        saturation (numpy.ndarray): Array of the shape ``(N,)`` that contains
+            the saturation factor of each image. If it is ``None``, the
+            saturation is not changed.
+
+    Returns:
+        numpy.ndarray: Adjusted images of the same dtype as ``images``.
+        Integer images are rounded and clipped to the range of the dtype.
+
+    """
+    _check_batch(images)
+
+    def factor(f):
+        return numpy.asarray(f, dtype=numpy.float32).reshape(-1, 1, 1, 1)
+
+    x = images.astype(numpy.float32)
+    if brightness is not None:
+        x *= factor(brightness)
+    if contrast is not None:
+        mean = _gray(x).mean(axis=(1, 2, 3), keepdims=True)
+        x -= mean
+        x *= factor(contrast)
+        x += mean
+    if saturation is not None:
+        gray = _gray(x)
+        x -= gray
+        x *= factor(saturation)
+        x += gray
+
+    if numpy.issubdtype(images.dtype, numpy.integer):
+        info = numpy.iinfo(images.dtype)
+        numpy.rint(x, out=x)
+        numpy.clip(x, info.min, info.max, out=x)
+    return x.astype(images.dtype, copy=False)
+
+
+def _resize_weights(in_size, out_size):
+    # Source indexes and weights of the linear interpolation, where the
+    # centers of the pixels are aligned.
+    src = (numpy.arange(out_size) + 0.5) * (in_size / out_size) - 0.5
+    numpy.clip(src, 0, in_size - 1, out=src)
+    i0 = src.astype(numpy.intp)
+    i1 = numpy.minimum(i0 + 1, in_size - 1)
+    weight = (src - i0).astype(numpy.float32)
+    return i0, i1, weight
+
+
+def resize(images, size, interpolation='bilinear', out=None):
+    """Resizes a batch of images to the same size.
+
+    Args:
+        images (numpy.ndarray): Batch of images in the shape of
+            ``(N, C, H, W)``.
+        size (tuple of ints): Height and width of the output images.
+        interpolation (str): Interpolation method, ``'nearest'`` or
+            ``'bilinear'``. The bilinear interpolation is computed in float32
+            separately along each axis.
+        out (numpy.ndarray): Array of the shape ``(N, C, *size)`` to which
+            the images are written. If it is ``None``, a new array of the
+            dtype of ``images`` is allocated. Integer outputs are rounded.
+
+    Returns:
+        numpy.ndarray: Resized images in the shape of ``(N, C, *size)``.
+
+    """
+    _check_batch(images)
+    n, c, h, w = images.shape
+    out_h, out_w = size
+    if out is None:
+        out = numpy.empty((n, c, out_h, out_w), dtype=images.dtype)
+    else:
+        _check_out(out, (n, c, out_h, out_w))
+
+    if interpolation == 'nearest':
+        y = ((numpy.arange(out_h) + 0.5) * (h / out_h)).astype(numpy.intp)
+        x = ((numpy.arange(out_w) + 0.5) * (w / out_w)).astype(numpy.intp)
+        rows = images.take(y, axis=2)
+        if out.dtype == images.dtype:
+            # The indexes are valid, so that they are not checked to avoid
+            # buffering the output.
+            numpy.take(rows, x, axis=3, out=out, mode='clip')
+        else:
+            numpy.copyto(out, rows.take(x, axis=3), casting='unsafe')
+        return out
+    elif interpolation != 'bilinear':
+        raise ValueError('unknown interpolation: {}'.format(interpolation))
+
+    y0, y1, wy = _resize_weights(h, out_h)
+    x0, x1, wx = _resize_weights(w, out_w)
+    # Interpolates along the rows, and then along the columns.
+    rows = images.take(y0, axis=2).astype(numpy.float32)
+    diff = images.take(y1, axis=2).astype(numpy.float32)
+    diff -= rows
+    diff *= wy[:, None]
+    rows += diff
+    result = rows.take(x0, axis=3)
+    diff = rows.take(x1, axis=3)
+    diff -= result
+    diff *= wx
+    result += diff
+    if numpy.issubdtype(out.dtype, numpy.integer):
+        numpy.rint(result, out=result)
+    numpy.copyto(out, result, casting='unsafe')
+    return out
+
+
+def normalize(images, mean=None, std=None, dtype=numpy.float32, out=None):
+    """Normalizes a batch of images by the mean and the standard deviation.
+
+    It computes ``(images - mean) / std`` by subtracting the mean into the
+    output and multiplying it by the reciprocal of ``std`` in place, without
+    temporary arrays of the size of the batch.
+
+    Args:
+        images (numpy.ndarray): Batch of images, e.g. in the shape of
+            ``(N, C, H, W)``.
+        mean (numpy.ndarray or float): Mean broadcast to each image, e.g.
+            per channel in the shape of ``(C, 1, 1)`` or per pixel in the
+            shape of ``(C, H, W)``. If it is ``None``, the mean is not
+            subtracted.
+        std (numpy.ndarray or float): Standard deviation broadcast to each
+            image. If it is ``None``, the images are not divided.
+        dtype: Floating point data type of the output array. It is ignored
+            if ``out`` is given.
+        out (numpy.ndarray): Array of a floating point dtype and the same
+            shape as ``images`` to which the normalized images are written.
+            It may be ``images`` itself. If it is ``None``, a new array is
+            allocated.
+
+    Returns:
+        numpy.ndarray: Normalized images.
+
+    """
+    if out is None:
+        dtype = numpy.dtype(dtype)
+    else:
+        _check_out(out, images.shape)
+        dtype = out.dtype
+    if dtype.kind != 'f':
+        raise ValueError(
+            'normalized images must be of a floating point dtype. '
+            'Actual: {}'.format(dtype))
+    if out is None:
+        out = numpy.empty(images.shape, dtype=dtype)
+
+    if mean is None:
+        if out is not images:
+            numpy.copyto(out, images, casting='unsafe')
+    else:
+        mean = numpy.asarray(mean, dtype=out.dtype)
+        numpy.subtract(images, mean, out=out, casting='unsafe')
+    if std is not None:
+        # Multiplies the reciprocal, which is faster than the division.
+        numpy.multiply(out, 1 / numpy.asarray(std, dtype=out.dtype), out=out)
+    return out
+
+
+def hwc_to_chw(images, out=None):
+    """Transposes a batch of images from the HWC to the CHW layout.
+
+    Args:
+        images (numpy.ndarray): Batch of images in the shape of
+            ``(N, H, W, C)``, e.g. those decoded by PIL.
+        out (numpy.ndarray): Array of the shape ``(N, C, H, W)`` to which
+            the images are written. If it is ``None``, a new C-contiguous
+            array is allocated.
+
+    Returns:
+        numpy.ndarray: Images in the shape of ``(N, C, H, W)``.
+
+    """
+    if images.ndim != 4:
+        raise ValueError(
+            'images must be a batch of images in the shape of '
+            '(N, H, W, C). Actual shape: {}'.format(images.shape))
+    transposed = images.transpose(0, 3, 1, 2)
+    if out is None:
+        return numpy.ascontiguousarray(transposed)
+    _check_out(out, transposed.shape)
+    numpy.copyto(out, transposed, casting='unsafe')
+    return out
@@ -1,5 +1,4 @@
 import collections
-import copy
 import heapq
 import traceback
 import warnings
@@ -489,10 +488,11 @@ Actual: {0}'''.format(type(data))
         self._loss_scale = None
 
     def __copy__(self):
-        return self._copy_to(Variable())
+        # The initializer is skipped because the attributes are overwritten.
+        return self._copy_to(Variable.__new__(Variable))
 
     def _copy_to(self, target):
-        target.__dict__ = copy.copy(self.__dict__)
+        target.__dict__ = self.__dict__.copy()
         target._node = VariableNode(target, self.name)
         return target
 
@@ -1341,7 +1341,7 @@ class Parameter(Variable):
         self.initializer = initializer
 
     def __copy__(self):
-        return self._copy_to(Parameter())
+        return self._copy_to(Parameter.__new__(Parameter))
 
     def __reduce__(self):
         return _recover_parameter, (self.data, self.name, self.grad,
@@ -0,0 +1,115 @@
+#!/usr/bin/env python
+"""Benchmark of the batched preprocessing of images.
+
+This script compares the preprocessing of ``train_imagenet.py``, which
+randomly crops, flips, subtracts the mean and scales each example before the
+examples are concatenated, with the batched implementation of
+:mod:`chainer.utils.imgproc` applied to a whole batch of ``uint8`` images.
+Random images are used, and the mean is given per channel so that both
+implementations compute the same batch.
+
+"""
+import argparse
+import time
+
+import numpy as np
+
+from chainer import dataset
+from chainer.utils import imgproc
+
+
+class Preprocess(object):
+
+    def __init__(self, images, mean, crop_size):
+        self.images = images
+        self.mean = mean
+        self.crop_size = crop_size
+        n, c, h, w = images.shape
+        self.top = np.random.randint(0, h - crop_size + 1, n)
+        self.left = np.random.randint(0, w - crop_size + 1, n)
+        self.mask = np.random.rand(n) < 0.5
+        shape = (n, c, crop_size, crop_size)
+        self.cropped = np.empty(shape, dtype=np.uint8)
+        self.flipped = np.empty(shape, dtype=np.uint8)
+        self.out = np.empty(shape, dtype=np.float32)
+
+    def per_example(self):
+        crop_size = self.crop_size
+        batch = []
+        for i, image in enumerate(self.images):
+            image = image.astype(np.float32)
+            if self.mask[i]:
+                image = image[:, :, ::-1]
+            top, left = self.top[i], self.left[i]
+            image = image[:, top:top + crop_size, left:left + crop_size]
+            image -= self.mean
+            image *= (1.0 / 255.0)
+            batch.append(image)
+        return dataset.concat_examples(batch)
+
+    def _mirrored_left(self):
+        # Flipping the images before cropping is equivalent to cropping at
+        # the mirrored position.
+        w = self.images.shape[3]
+        return np.where(self.mask, w - self.crop_size - self.left, self.left)
+
+    def batched(self):
+        size = (self.crop_size, self.crop_size)
+        images = imgproc.crop(self.images, self.top, self._mirrored_left(),
+                              size)
+        images = imgproc.flip(images, self.mask)
+        return imgproc.normalize(images, self.mean, 255)
+
+    def batched_out(self):
+        size = (self.crop_size, self.crop_size)
+        imgproc.crop(self.images, self.top, self._mirrored_left(), size,
+                     out=self.cropped)
+        imgproc.flip(self.cropped, self.mask, out=self.flipped)
+        return imgproc.normalize(self.flipped, self.mean, 255, out=self.out)
+
+
+def measure(f, n_iter):
+    times = []
+    for _ in range(n_iter):
+        start = time.time()
+        f()
+        times.append(time.time() - start)
+    return np.array(times)
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description='Benchmark the batched preprocessing of images')
+    parser.add_argument('--batchsize', '-B', type=int, default=32,
+                        help='Minibatch size')
+    parser.add_argument('--size', type=int, default=256,
+                        help='Height and width of the input images')
+    parser.add_argument('--crop-size', type=int, default=224,
+                        help='Height and width of the cropped images')
+    parser.add_argument('--iteration', '-i', type=int, default=20,
+                        help='Number of measured iterations')
+    parser.add_argument('--warmup', '-w', type=int, default=3,
+                        help='Number of warm-up iterations')
+    args = parser.parse_args()
+
+    images = np.random.randint(
+        0, 256, (args.batchsize, 3, args.size, args.size)).astype(np.uint8)
+    mean = np.random.uniform(0, 255, (3, 1, 1)).astype(np.float32)
+    preprocess = Preprocess(images, mean, args.crop_size)
+    np.testing.assert_allclose(preprocess.batched_out(),
+                               preprocess.per_example(), rtol=1e-5, atol=1e-6)
+
+    methods = [
+        ('per-example', preprocess.per_example),
+        ('batched', preprocess.batched),
+        ('batched (out)', preprocess.batched_out),
+    ]
+    for name, f in methods:
+        measure(f, args.warmup)
+        times = measure(f, args.iteration) * 1000
+        print('{:<14} mean: {:8.2f} ms  median: {:8.2f} ms  min: {:8.2f} ms'
+              .format(name, times.mean(), np.median(times), times.min()))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,68 @@
+#!/usr/bin/env python
+"""Benchmark of the inference latency of VGG16Layers.
+
+This script measures the latency of forward computation of
+:class:`chainer.links.VGG16Layers` with small mini-batches under
+``chainer.no_backprop_mode`` and ``chainer.inference_mode``. Randomly
+initialized weights are used, so no pretrained model is downloaded.
+
+"""
+import argparse
+import time
+
+import numpy as np
+
+import chainer
+from chainer.backends import cuda
+import chainer.links as L
+
+
+def measure(model, x, n_iter, mode):
+    xp = model.xp
+    times = []
+    for _ in range(n_iter):
+        if xp is not np:
+            cuda.Device().synchronize()
+        start = time.time()
+        with mode(), chainer.using_config('train', False):
+            y = model(x, layers=['prob'])['prob']
+        if xp is not np:
+            cuda.Device().synchronize()
+        times.append(time.time() - start)
+        del y
+    return np.array(times)
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description='Benchmark the inference latency of VGG16Layers')
+    parser.add_argument('--batchsize', '-B', type=int, default=1,
+                        help='Minibatch size')
+    parser.add_argument('--iteration', '-i', type=int, default=20,
+                        help='Number of measured iterations')
+    parser.add_argument('--warmup', '-w', type=int, default=3,
+                        help='Number of warm-up iterations')
+    parser.add_argument('--gpu', '-g', type=int, default=-1,
+                        help='GPU ID (negative value indicates CPU)')
+    args = parser.parse_args()
+
+    model = L.VGG16Layers(pretrained_model=None)
+    if args.gpu >= 0:
+        cuda.get_device_from_id(args.gpu).use()
+        model.to_gpu()
+    x = model.xp.random.uniform(
+        -1, 1, (args.batchsize, 3, 224, 224)).astype(np.float32)
+
+    modes = [
+        ('no_backprop_mode', chainer.no_backprop_mode),
+        ('inference_mode', chainer.inference_mode),
+    ]
+    for name, mode in modes:
+        measure(model, x, args.warmup, mode)
+        times = measure(model, x, args.iteration, mode) * 1000
+        print('{:<18} mean: {:8.2f} ms  median: {:8.2f} ms  min: {:8.2f} ms'
+              .format(name, times.mean(), np.median(times), times.min()))
+
+
+if __name__ == '__main__':
+    main()
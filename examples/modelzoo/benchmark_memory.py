@@ -0,0 +1,77 @@
+#!/usr/bin/env python
+"""Benchmark of the peak memory usage of training with MemoryPlanHook.
+
+This script measures the peak host memory allocated during a forward and
+backward computation of :class:`chainer.links.ResNet50Layers` and
+:class:`chainer.links.VGG16Layers` on CPU with :mod:`tracemalloc`, with and
+without :class:`chainer.function_hooks.MemoryPlanHook`. Randomly
+initialized weights are used, so no pretrained model is downloaded.
+
+"""
+import argparse
+import time
+import tracemalloc
+
+import numpy as np
+
+import chainer.functions as F
+from chainer.function_hooks import MemoryPlanHook
+import chainer.links as L
+
+
+def forward_backward(model, layer, x, t):
+    y = model(x, layers=[layer])[layer]
+    loss = F.softmax_cross_entropy(y, t)
+    loss.backward()
+
+
+def run(model, layer, x, t, hook):
+    model.cleargrads()
+    tracemalloc.start()
+    start = time.time()
+    if hook is None:
+        forward_backward(model, layer, x, t)
+    else:
+        with hook:
+            forward_backward(model, layer, x, t)
+    elapsed = time.time() - start
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return peak, elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description='Benchmark the peak memory usage with MemoryPlanHook')
+    parser.add_argument('--batchsize', '-B', type=int, default=8,
+                        help='Minibatch size')
+    parser.add_argument('--model', '-m', choices=('resnet50', 'vgg16'),
+                        nargs='+', default=['resnet50', 'vgg16'],
+                        help='Models to measure')
+    args = parser.parse_args()
+
+    models = {
+        'resnet50': (L.ResNet50Layers, 'fc6'),
+        'vgg16': (L.VGG16Layers, 'fc8'),
+    }
+    for name in args.model:
+        model_class, layer = models[name]
+        model = model_class(pretrained_model=None)
+        x = np.random.uniform(
+            -1, 1, (args.batchsize, 3, 224, 224)).astype(np.float32)
+        t = np.random.randint(0, 1000, args.batchsize).astype(np.int32)
+
+        # Parameters and gradients are allocated by the first run.
+        run(model, layer, x, t, None)
+        base_peak, base_time = run(model, layer, x, t, None)
+        hook = MemoryPlanHook()
+        run(model, layer, x, t, hook)
+        peak, elapsed = run(model, layer, x, t, hook)
+        print('{:<9} baseline: {:8.1f} MiB {:6.2f} s  planned: {:8.1f} MiB '
+              '{:6.2f} s  ({} buffers reused, {:.1%} reduction)'.format(
+                  name, base_peak / 2. ** 20, base_time, peak / 2. ** 20,
+                  elapsed, hook.n_reused, 1 - float(peak) / base_peak))
+
+
+if __name__ == '__main__':
+    main()
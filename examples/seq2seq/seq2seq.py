@@ -70,35 +70,23 @@ class Seq2seq(chainer.Chain):
         chainer.report({'perp': perp}, self)
         return loss
 
-    def translate(self, xs, max_length=100):
+    def translate(self, xs, max_length=100, beam_size=1):
         batch = len(xs)
         with chainer.no_backprop_mode(), chainer.using_config('train', False):
             xs = [x[::-1] for x in xs]
             exs = sequence_embed(self.embed_x, xs)
             h, c, _ = self.encoder(None, None, exs)
-            ys = self.xp.full(batch, EOS, numpy.int32)
-            result = []
-            for i in range(max_length):
-                eys = self.embed_y(ys)
-                eys = F.split_axis(eys, batch, 0)
-                h, c, ys = self.decoder(h, c, eys)
-                cys = F.concat(ys, axis=0)
-                wy = self.W(cys)
-                ys = self.xp.argmax(wy.data, axis=1).astype(numpy.int32)
-                result.append(ys)
-
-        # Using `xp.concatenate(...)` instead of `xp.stack(result)` here to
-        # support NumPy 1.9.
-        result = cuda.to_cpu(
-            self.xp.concatenate([self.xp.expand_dims(x, 0) for x in result]).T)
-
-        # Remove EOS taggs
-        outs = []
-        for y in result:
-            inds = numpy.argwhere(y == EOS)
-            if len(inds) > 0:
-                y = y[:inds[0, 0]]
-            outs.append(y)
+            decoder = self.decoder.decoder(h, c)
+
+            def step(ys):
+                return F.log_softmax(self.W(decoder.step(self.embed_y(ys))))
+
+            bos = self.xp.full(batch, EOS, numpy.int32)
+            if beam_size > 1:
+                outs, _ = chainer.utils.beam_search(
+                    step, decoder.reorder, bos, EOS, beam_size, max_length)
+            else:
+                outs = chainer.utils.greedy_search(step, bos, EOS, max_length)
         return outs
 
 
@@ -127,13 +115,15 @@ class CalculateBleu(chainer.training.Extension):
     priority = chainer.training.PRIORITY_WRITER
 
     def __init__(
-            self, model, test_data, key, batch=100, device=-1, max_length=100):
+            self, model, test_data, key, batch=100, device=-1, max_length=100,
+            beam_size=1):
         self.model = model
         self.test_data = test_data
         self.key = key
         self.batch = batch
         self.device = device
         self.max_length = max_length
+        self.beam_size = beam_size
 
     def __call__(self, trainer):
         with chainer.no_backprop_mode():
@@ -146,7 +136,8 @@ class CalculateBleu(chainer.training.Extension):
                 sources = [
                     chainer.dataset.to_device(self.device, x) for x in sources]
                 ys = [y.tolist()
-                      for y in self.model.translate(sources, self.max_length)]
+                      for y in self.model.translate(
+                          sources, self.max_length, self.beam_size)]
                 hypotheses.extend(ys)
 
         bleu = bleu_score.corpus_bleu(
@@ -224,6 +215,9 @@ def main():
     parser.add_argument('--validation-interval', type=int, default=4000,
                         help='number of iteration to evlauate the model '
                         'with validation dataset')
+    parser.add_argument('--beam-size', type=int, default=1,
+                        help='beam size used in translation. Greedy search '
+                        'is used if it is 1')
     parser.add_argument('--out', '-o', default='result',
                         help='directory to output the result')
     args = parser.parse_args()
@@ -300,7 +294,8 @@ def main():
         @chainer.training.make_extension()
         def translate(trainer):
             source, target = test_data[numpy.random.choice(len(test_data))]
-            result = model.translate([model.xp.array(source)])[0]
+            result = model.translate(
+                [model.xp.array(source)], beam_size=args.beam_size)[0]
 
             source_sentence = ' '.join([source_words[x] for x in source])
             target_sentence = ' '.join([target_words[y] for y in target])
@@ -313,7 +308,8 @@ def main():
             translate, trigger=(args.validation_interval, 'iteration'))
         trainer.extend(
             CalculateBleu(
-                model, test_data, 'validation/main/bleu', device=args.gpu),
+                model, test_data, 'validation/main/bleu', device=args.gpu,
+                beam_size=args.beam_size),
             trigger=(args.validation_interval, 'iteration'))
 
     print('start training')
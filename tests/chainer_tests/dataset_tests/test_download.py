@@ -1,9 +1,13 @@
+import hashlib
 import os
 import shutil
 import tempfile
+import threading
 import unittest
 
 import mock
+import numpy
+import six
 
 from chainer import dataset
 from chainer import testing
@@ -107,6 +111,65 @@ class TestCacheOrLoadFileFileExists(unittest.TestCase):
             dataset.cache_or_load_file(path, creator, loader)
 
 
+class TestCacheOrLoadArrays(unittest.TestCase):
+
+    def setUp(self):
+        self.default_dataset_root = dataset.get_dataset_root()
+        self.temp_dir = tempfile.mkdtemp()
+        dataset.set_dataset_root(self.temp_dir)
+        self.x = numpy.arange(6, dtype=numpy.float32).reshape(2, 3)
+        self.y = numpy.array([1, 0], dtype=numpy.int32)
+        self.creator = mock.Mock(return_value={'x': self.x, 'y': self.y})
+
+    def tearDown(self):
+        dataset.set_dataset_root(self.default_dataset_root)
+        shutil.rmtree(self.temp_dir)
+
+    def _load(self, params, **kwargs):
+        return dataset.cache_or_load_arrays(
+            self.temp_dir, 'test', params, self.creator, **kwargs)
+
+    def test_create(self):
+        arrays = self._load({'scale': 1., 'dtype': numpy.float32})
+        self.assertEqual(self.creator.call_count, 1)
+        self.assertIs(arrays['x'], self.x)
+        self.assertIs(arrays['y'], self.y)
+        self.assertTrue(os.path.isdir(os.path.join(
+            self.temp_dir, 'test.dtype=float32,scale=1.0.npycache')))
+
+    def test_load(self):
+        params = {'scale': 1., 'dtype': numpy.float32}
+        self._load(params)
+        arrays = self._load(params)
+        self.assertEqual(self.creator.call_count, 1)
+        self.assertEqual(sorted(arrays.keys()), ['x', 'y'])
+        for key, expect in (('x', self.x), ('y', self.y)):
+            self.assertIsInstance(arrays[key], numpy.memmap)
+            self.assertEqual(arrays[key].dtype, expect.dtype)
+            numpy.testing.assert_array_equal(arrays[key], expect)
+
+    def test_load_copy_on_write(self):
+        params = {'scale': 1.}
+        self._load(params)
+        arrays = self._load(params)
+        arrays['x'][...] = -1
+        arrays = self._load(params)
+        numpy.testing.assert_array_equal(arrays['x'], self.x)
+
+    def test_load_mmap_mode(self):
+        params = {'scale': 1.}
+        self._load(params)
+        arrays = self._load(params, mmap_mode=None)
+        self.assertNotIsInstance(arrays['x'], numpy.memmap)
+        numpy.testing.assert_array_equal(arrays['x'], self.x)
+
+    def test_different_params(self):
+        self._load({'scale': 1.})
+        self._load({'scale': 2.})
+        self._load({'scale': 1., 'dtype': numpy.float64})
+        self.assertEqual(self.creator.call_count, 3)
+
+
 class TestCachedDownload(unittest.TestCase):
 
     def setUp(self):
@@ -131,26 +194,130 @@ class TestCachedDownload(unittest.TestCase):
         with self.assertRaises(OSError):
             dataset.cached_download('https://example.com')
 
+
+class _RangeRequestHandler(six.moves.BaseHTTPServer.BaseHTTPRequestHandler):
+
+    def do_GET(self):
+        server = self.server
+        data = server.data
+        range_header = self.headers.get('Range')
+        server.ranges.append(range_header)
+        if range_header is None or not server.support_range:
+            self.send_response(200)
+            body = data
+        else:
+            start, _, end = range_header[len('bytes='):].partition('-')
+            start = int(start)
+            end = int(end) + 1 if end else len(data)
+            if start >= len(data):
+                self.send_response(416)
+                self.end_headers()
+                return
+            body = data[start:end]
+            self.send_response(206)
+            self.send_header('Content-Range', 'bytes {}-{}/{}'.format(
+                start, start + len(body) - 1, len(data)))
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+class _HTTPServer(six.moves.socketserver.ThreadingMixIn,
+                  six.moves.BaseHTTPServer.HTTPServer):
+
+    daemon_threads = True
+
+
+@testing.parameterize(*testing.product({
+    'n_connections': [1, 3],
+    'support_range': [True, False],
+    'size': [0, 1, 100000],
+}))
+class TestCachedDownloadFromServer(unittest.TestCase):
+
+    def setUp(self):
+        self.default_dataset_root = dataset.get_dataset_root()
+        self.temp_dir = tempfile.mkdtemp()
+        dataset.set_dataset_root(self.temp_dir)
+
+        self.data = os.urandom(self.size)
+        self.server = _HTTPServer(('127.0.0.1', 0), _RangeRequestHandler)
+        self.server.data = self.data
+        self.server.support_range = self.support_range
+        self.server.ranges = []
+        self.thread = threading.Thread(target=self.server.serve_forever)
+        self.thread.daemon = True
+        self.thread.start()
+        self.url = 'http://127.0.0.1:{}/data'.format(
+            self.server.server_address[1])
+        self.cache_root = os.path.join(self.temp_dir, '_dl_cache')
+        self.urlhash = hashlib.md5(self.url.encode('utf-8')).hexdigest()
+
+    def tearDown(self):
+        self.server.shutdown()
+        self.server.server_close()
+        dataset.set_dataset_root(self.default_dataset_root)
+        shutil.rmtree(self.temp_dir)
+
+    def _download(self, **kwargs):
+        return dataset.cached_download(
+            self.url, n_connections=self.n_connections, progress=False,
+            **kwargs)
+
+    def check_cache(self, cache_path):
+        with open(cache_path, 'rb') as f:
+            self.assertEqual(f.read(), self.data)
+        for name in os.listdir(self.cache_root):
+            self.assertNotIn('.part', name)
+
     def test_cached_download(self):
-        with mock.patch('six.moves.urllib.request.urlretrieve') as f:
-            def download(url, path):
-                with open(path, 'w') as f:
-                    f.write('test')
-            f.side_effect = download
-
-            cache_path = dataset.cached_download('https://example.com')
-
-        self.assertEqual(f.call_count, 1)
-        args, kwargs = f.call_args
-        self.assertEqual(kwargs, {})
-        self.assertEqual(len(args), 2)
-        # The second argument is a temporary path, and it is removed
-        self.assertEqual(args[0], 'https://example.com')
-
-        self.assertTrue(os.path.exists(cache_path))
-        with open(cache_path) as f:
-            stored_data = f.read()
-        self.assertEqual(stored_data, 'test')
+        cache_path = self._download()
+        self.assertEqual(
+            cache_path, os.path.join(self.cache_root, self.urlhash))
+        self.check_cache(cache_path)
+
+        n_requests = len(self.server.ranges)
+        self.assertEqual(self._download(), cache_path)
+        self.assertEqual(len(self.server.ranges), n_requests)
+
+    def test_checksum(self):
+        checksum = hashlib.sha256(self.data).hexdigest()
+        cache_path = self._download(checksum=checksum)
+        self.check_cache(cache_path)
+
+    def test_checksum_md5(self):
+        checksum = hashlib.md5(self.data).hexdigest()
+        cache_path = self._download(checksum=checksum, hash_name='md5')
+        self.check_cache(cache_path)
+
+    def test_checksum_mismatch(self):
+        with self.assertRaises(IOError):
+            self._download(checksum='0' * 64)
+        # Neither the cache nor the corrupted parts are left.
+        self.assertEqual(
+            [name for name in os.listdir(self.cache_root)
+             if not name.endswith('.lock')], [])
+
+    def test_resume(self):
+        if not self.support_range or self.size < 2:
+            return
+        n = self.n_connections
+        start = self.size // n
+        head = self.size // (2 * n)
+        # The first half of the first part is already downloaded.
+        os.makedirs(self.cache_root)
+        part_path = os.path.join(
+            self.cache_root, '{}.part{}-0'.format(self.urlhash, n))
+        with open(part_path, 'wb') as f:
+            f.write(self.data[:head])
+        cache_path = self._download()
+        self.check_cache(cache_path)
+        self.assertIn('bytes={}-{}'.format(head, start - 1),
+                      self.server.ranges)
+        self.assertNotIn('bytes=0-{}'.format(start - 1), self.server.ranges)
 
 
 testing.run_module(__name__, __file__)
@@ -0,0 +1,159 @@
+import os
+import shutil
+import tempfile
+import unittest
+
+import numpy
+
+import chainer
+from chainer import datasets
+from chainer import functions
+from chainer import iterators
+from chainer import links
+from chainer import optimizers
+from chainer import serializers
+from chainer import testing
+from chainer import training
+from chainer.training import extensions
+
+
+class DummySerializer(object):
+
+    def __init__(self, target):
+        self.target = target
+
+    def __call__(self, key, value):
+        self.target[key] = value
+        return value
+
+
+class DummyDeserializer(object):
+
+    def __init__(self, target):
+        self.target = target
+
+    def __call__(self, key, value):
+        return self.target[key]
+
+
+def _make_transforms():
+    return [
+        datasets.RandomResizedCrop((6, 6)),
+        datasets.RandomCrop((4, 4)),
+        datasets.RandomFlip(),
+        datasets.ColorJitter(brightness=0.4, contrast=0.4, saturation=0.4),
+    ]
+
+
+class TestAugmentation(unittest.TestCase):
+
+    def setUp(self):
+        self.images = numpy.random.randint(
+            0, 256, (12, 3, 8, 10)).astype(numpy.uint8)
+        self.labels = numpy.arange(12, dtype=numpy.int32)
+        self.batch = list(zip(self.images, self.labels))
+
+    def test_converter(self):
+        augmentation = datasets.Augmentation(_make_transforms(), seed=0)
+        x, t = augmentation(self.batch)
+        self.assertEqual(x.shape, (12, 3, 4, 4))
+        self.assertEqual(x.dtype, numpy.uint8)
+        numpy.testing.assert_array_equal(t, self.labels)
+        self.assertEqual(augmentation.n_examples, 12)
+
+    def test_dict(self):
+        augmentation = datasets.Augmentation(
+            [datasets.RandomCrop((4, 4))], seed=0, key='x')
+        batch = [{'x': x, 't': t} for x, t in self.batch]
+        out = augmentation(batch)
+        self.assertEqual(out['x'].shape, (12, 3, 4, 4))
+        numpy.testing.assert_array_equal(out['t'], self.labels)
+
+    def test_array(self):
+        augmentation = datasets.Augmentation(
+            [datasets.RandomCrop((4, 4))], seed=0)
+        x = augmentation(list(self.images))
+        self.assertEqual(x.shape, (12, 3, 4, 4))
+
+    def test_independent_of_batching(self):
+        # The same examples are augmented in the same way regardless of the
+        # batch size.
+        augmentation1 = datasets.Augmentation(_make_transforms(), seed=1)
+        augmentation2 = datasets.Augmentation(_make_transforms(), seed=1)
+        x1, _ = augmentation1(self.batch)
+        x2 = numpy.concatenate([augmentation2(self.batch[i:i + 3])[0]
+                                for i in range(0, 12, 3)])
+        numpy.testing.assert_array_equal(x1, x2)
+
+    def test_seed(self):
+        x1, _ = datasets.Augmentation(_make_transforms(), seed=1)(self.batch)
+        x2, _ = datasets.Augmentation(_make_transforms(), seed=2)(self.batch)
+        self.assertFalse((x1 == x2).all())
+
+    def test_different_examples(self):
+        # Each example is augmented with different random numbers.
+        images = numpy.repeat(self.images[:1], 12, axis=0)
+        augmentation = datasets.Augmentation(
+            [datasets.RandomCrop((4, 4))], seed=0)
+        x = augmentation.augment(images)
+        self.assertGreater(len(set(x[i].tobytes() for i in range(12))), 1)
+
+    def test_serialize(self):
+        augmentation1 = datasets.Augmentation(_make_transforms())
+        augmentation1(self.batch)
+        target = {}
+        augmentation1.serialize(DummySerializer(target))
+        x1, _ = augmentation1(self.batch)
+
+        augmentation2 = datasets.Augmentation(_make_transforms())
+        augmentation2.serialize(DummyDeserializer(target))
+        self.assertEqual(augmentation2.n_examples, 12)
+        x2, _ = augmentation2(self.batch)
+        numpy.testing.assert_array_equal(x1, x2)
+
+    def test_trainer_snapshot(self):
+        def make_trainer():
+            model = links.Linear(3, 1)
+            optimizer = optimizers.SGD()
+            optimizer.setup(model)
+            iterator = iterators.SerialIterator(
+                self.batch, 4, shuffle=False)
+            augmentation = datasets.Augmentation([datasets.RandomFlip()])
+            images = []
+
+            def loss_func(x, t):
+                images.append(x)
+                x = chainer.Variable(x.astype(numpy.float32))
+                return functions.sum(model(functions.mean(x, axis=(2, 3))))
+
+            updater = training.updaters.StandardUpdater(
+                iterator, optimizer, converter=augmentation,
+                loss_func=loss_func)
+            trainer = training.Trainer(updater, (1, 'iteration'), out=out)
+            return trainer, images
+
+        out = tempfile.mkdtemp()
+        try:
+            trainer1, images1 = make_trainer()
+            trainer1.extend(extensions.snapshot(filename='snapshot'),
+                            trigger=(1, 'iteration'))
+            trainer1.run()
+            trainer1.updater.update()
+
+            # The seed drawn at random and the number of converted examples
+            # are restored from the snapshot.
+            trainer2, images2 = make_trainer()
+            serializers.load_npz(os.path.join(out, 'snapshot'), trainer2)
+            trainer2.updater.update()
+        finally:
+            shutil.rmtree(out)
+        numpy.testing.assert_array_equal(images2[0], images1[1])
+
+    def test_random_flip(self):
+        augmentation = datasets.Augmentation(
+            [datasets.RandomFlip(p=1.)], seed=0)
+        numpy.testing.assert_array_equal(
+            augmentation.augment(self.images), self.images[:, :, :, ::-1])
+
+
+testing.run_module(__name__, __file__)
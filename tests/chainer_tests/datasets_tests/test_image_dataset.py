@@ -1,5 +1,7 @@
 import os
 import pickle
+import shutil
+import tempfile
 import unittest
 
 import numpy
@@ -137,4 +139,98 @@ class TestMultiZippedImageDataset(unittest.TestCase):
         self._get_check(ds)
 
 
+@unittest.skipUnless(image_dataset.available, 'image_dataset is not available')
+class TestImageDatasetNativeDtype(unittest.TestCase):
+
+    def test_get(self):
+        root = os.path.join(os.path.dirname(__file__), 'image_dataset')
+        path = os.path.join(root, 'img.lst')
+        dataset = datasets.ImageDataset(path, root=root, dtype=None)
+        expect = datasets.ImageDataset(path, root=root, dtype=numpy.int32)
+        img = dataset.get_example(0)
+        self.assertEqual(img.dtype, numpy.uint8)
+        numpy.testing.assert_array_equal(img, expect.get_example(0))
+
+    def test_writable(self):
+        root = os.path.join(os.path.dirname(__file__), 'image_dataset')
+        path = os.path.join(root, 'img.lst')
+        for cache_size in (0, 1):
+            dataset = datasets.ImageDataset(
+                path, root=root, dtype=None, cache_size=cache_size)
+            img = dataset.get_example(0)
+            self.assertTrue(img.flags.writeable)
+            img[...] = 0
+
+
+@unittest.skipUnless(image_dataset.available, 'image_dataset is not available')
+class TestImageDatasetDraft(unittest.TestCase):
+
+    def setUp(self):
+        self.root = tempfile.mkdtemp()
+        image = numpy.random.randint(0, 256, (64, 96, 3)).astype(numpy.uint8)
+        image_dataset.Image.fromarray(image).save(
+            os.path.join(self.root, 'img.jpg'))
+        image_dataset.Image.fromarray(image).save(
+            os.path.join(self.root, 'img.png'))
+
+    def tearDown(self):
+        shutil.rmtree(self.root)
+
+    def test_jpeg(self):
+        dataset = datasets.ImageDataset(
+            ['img.jpg'], root=self.root, draft_size=(20, 20))
+        # The smallest scale not smaller than the draft size is 1/2.
+        self.assertEqual(dataset.get_example(0).shape, (3, 32, 48))
+
+    def test_other_format(self):
+        dataset = datasets.ImageDataset(
+            ['img.png'], root=self.root, draft_size=(20, 20))
+        self.assertEqual(dataset.get_example(0).shape, (3, 64, 96))
+
+
+@unittest.skipUnless(image_dataset.available, 'image_dataset is not available')
+class TestImageDatasetCache(unittest.TestCase):
+
+    def setUp(self):
+        self.root = os.path.join(os.path.dirname(__file__), 'image_dataset')
+
+    def check_cache(self, dataset, expect):
+        for _ in range(2):
+            for i in range(len(expect)):
+                img = dataset[i]
+                numpy.testing.assert_array_equal(img, expect[i])
+                # The cached image is not affected by in-place operations.
+                img[...] = 0
+
+    def test_image_dataset(self):
+        path = os.path.join(self.root, 'img.lst')
+        dataset = datasets.ImageDataset(path, root=self.root, cache_size=1)
+        expect = datasets.ImageDataset(path, root=self.root)
+        self.check_cache(dataset, expect)
+
+    def test_labeled_image_dataset(self):
+        path = os.path.join(self.root, 'labeled_img.lst')
+        dataset = datasets.LabeledImageDataset(
+            path, root=self.root, cache_size=2)
+        expect = datasets.LabeledImageDataset(path, root=self.root)
+        for i in range(2):
+            for _ in range(2):
+                img, label = dataset[i]
+                numpy.testing.assert_array_equal(img, expect[i][0])
+                self.assertEqual(label, i)
+                img[...] = 0
+
+    def test_zipped_image_dataset(self):
+        path = os.path.join(self.root, 'zipped_images_1.zip')
+        dataset = datasets.ZippedImageDataset(path, cache_size=2)
+        expect = datasets.ZippedImageDataset(path)
+        self.check_cache(dataset, expect)
+        dataset = pickle.loads(pickle.dumps(dataset))
+        self.check_cache(dataset, expect)
+
+    def test_invalid_cache_size(self):
+        with self.assertRaises(ValueError):
+            datasets.ImageDataset([], cache_size=-1)
+
+
 testing.run_module(__name__, __file__)
@@ -0,0 +1,98 @@
+import os
+import pickle
+import shutil
+import tempfile
+import unittest
+
+import numpy
+
+from chainer import datasets
+from chainer import testing
+
+
+@testing.parameterize(*testing.product({
+    'mmap': [True, False],
+}))
+class TestRecordDataset(unittest.TestCase):
+
+    def setUp(self):
+        self.root = tempfile.mkdtemp()
+        self.path = os.path.join(self.root, 'data.rec')
+        self.records = [b'abc', b'', b'de', b'fghij', b'k']
+        n = datasets.write_records(self.path, self.records)
+        self.assertEqual(n, len(self.records))
+        self.dataset = datasets.RecordDataset(self.path, mmap=self.mmap)
+
+    def tearDown(self):
+        self.dataset.close()
+        shutil.rmtree(self.root)
+
+    def test_index(self):
+        offsets = numpy.fromfile(self.path + '.index', dtype='<i8')
+        numpy.testing.assert_array_equal(offsets, [0, 3, 3, 5, 10, 11])
+
+    def test_len(self):
+        self.assertEqual(len(self.dataset), 5)
+
+    def test_get_example(self):
+        for i, record in enumerate(self.records):
+            self.assertEqual(self.dataset[i], record)
+        self.assertEqual(self.dataset[-1], b'k')
+
+    def test_out_of_range(self):
+        with self.assertRaises(IndexError):
+            self.dataset[5]
+        with self.assertRaises(IndexError):
+            self.dataset[-6]
+
+    def test_slice(self):
+        self.assertEqual(self.dataset[1:4], self.records[1:4])
+        self.assertEqual(self.dataset[:], self.records)
+        self.assertEqual(self.dataset[::2], self.records[::2])
+        self.assertEqual(self.dataset[3:1], [])
+
+    def test_list(self):
+        self.assertEqual(self.dataset[[4, 0]], [b'k', b'abc'])
+
+    def test_pickle(self):
+        self.dataset[0]
+        dataset = pickle.loads(pickle.dumps(self.dataset))
+        self.assertEqual(dataset[:], self.records)
+        dataset.close()
+
+
+class TestRecordDatasetCodec(unittest.TestCase):
+
+    def setUp(self):
+        self.root = tempfile.mkdtemp()
+        self.path = os.path.join(self.root, 'data.rec')
+
+    def tearDown(self):
+        shutil.rmtree(self.root)
+
+    def test_encoder_decoder(self):
+        arrays = [numpy.arange(i, dtype=numpy.float32) for i in range(4)]
+        datasets.write_records(
+            self.path, arrays, encoder=lambda x: x.tobytes())
+        dataset = datasets.RecordDataset(
+            self.path,
+            decoder=lambda b: numpy.frombuffer(b, dtype=numpy.float32))
+        for i, array in enumerate(arrays):
+            numpy.testing.assert_array_equal(dataset[i], array)
+        dataset.close()
+
+    def test_empty(self):
+        datasets.write_records(self.path, [])
+        dataset = datasets.RecordDataset(self.path)
+        self.assertEqual(len(dataset), 0)
+        self.assertEqual(dataset[:], [])
+
+    def test_invalid_index(self):
+        datasets.write_records(self.path, [b'abc'])
+        with open(self.path, 'ab') as f:
+            f.write(b'd')
+        with self.assertRaises(ValueError):
+            datasets.RecordDataset(self.path)
+
+
+testing.run_module(__name__, __file__)
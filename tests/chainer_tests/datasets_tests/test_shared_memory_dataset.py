@@ -0,0 +1,83 @@
+import multiprocessing
+import unittest
+
+import numpy
+
+from chainer import datasets
+from chainer import testing
+
+
+def _fill(dataset, value):
+    dataset.arrays[0][...] = value
+
+
+class TestSharedMemoryDataset(unittest.TestCase):
+
+    def setUp(self):
+        self.x0 = numpy.random.rand(3, 4).astype(numpy.float32)
+        self.x1 = numpy.arange(3, dtype=numpy.int32)
+
+    def test_shared_memory_dataset(self):
+        dataset = datasets.SharedMemoryDataset(self.x0, self.x1)
+        self.assertEqual(len(dataset), 3)
+
+        for i in range(3):
+            example = dataset[i]
+            self.assertEqual(len(example), 2)
+            numpy.testing.assert_array_equal(example[0], self.x0[i])
+            self.assertEqual(example[1], self.x1[i])
+
+        examples = dataset[1:3]
+        self.assertEqual(len(examples), 2)
+        for i, example in enumerate(examples, 1):
+            numpy.testing.assert_array_equal(example[0], self.x0[i])
+            self.assertEqual(example[1], self.x1[i])
+
+    def test_single_array(self):
+        dataset = datasets.SharedMemoryDataset(self.x0)
+        numpy.testing.assert_array_equal(dataset[1], self.x0[1])
+        numpy.testing.assert_array_equal(dataset[0:2], self.x0[0:2])
+
+    def test_arrays(self):
+        dataset = datasets.SharedMemoryDataset(self.x0, self.x1)
+        x0, x1 = dataset.arrays
+        self.assertEqual(x0.dtype, self.x0.dtype)
+        self.assertEqual(x1.dtype, self.x1.dtype)
+        numpy.testing.assert_array_equal(x0, self.x0)
+        numpy.testing.assert_array_equal(x1, self.x1)
+
+    def test_copied(self):
+        dataset = datasets.SharedMemoryDataset(self.x0)
+        self.x0[...] = -1
+        self.assertTrue((dataset.arrays[0] >= 0).all())
+
+    def test_state_shares_memory(self):
+        dataset = datasets.SharedMemoryDataset(self.x0, self.x1)
+        other = datasets.SharedMemoryDataset.__new__(
+            datasets.SharedMemoryDataset)
+        other.__setstate__(dataset.__getstate__())
+        other.arrays[0][...] = 2
+        numpy.testing.assert_array_equal(dataset.arrays[0], 2)
+
+    def test_shared_with_child_process(self):
+        dataset = datasets.SharedMemoryDataset(self.x0)
+        process = multiprocessing.Process(target=_fill, args=(dataset, 3))
+        process.start()
+        process.join()
+        self.assertEqual(process.exitcode, 0)
+        numpy.testing.assert_array_equal(dataset.arrays[0], 3)
+
+    def test_no_arrays(self):
+        with self.assertRaises(ValueError):
+            datasets.SharedMemoryDataset()
+
+    def test_wrong_length(self):
+        with self.assertRaises(ValueError):
+            datasets.SharedMemoryDataset(self.x0, numpy.arange(4))
+
+    def test_object_array(self):
+        with self.assertRaises(ValueError):
+            datasets.SharedMemoryDataset(numpy.array([None, 1]))
+
+
+testing.run_module(__name__, __file__)
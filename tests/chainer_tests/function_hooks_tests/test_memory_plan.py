@@ -0,0 +1,127 @@
+import unittest
+
+import numpy
+import six
+
+import chainer
+from chainer.backends import cuda
+from chainer import function_hooks
+from chainer import functions
+from chainer import links
+from chainer import testing
+from chainer.testing import attr
+
+
+class Model(chainer.Chain):
+
+    def __init__(self):
+        super(Model, self).__init__()
+        with self.init_scope():
+            self.l1 = links.Linear(5, 4)
+            self.l2 = links.Linear(4, 4)
+            self.l3 = links.Linear(4, 3)
+
+    def __call__(self, x):
+        h = functions.relu(self.l1(x))
+        h = functions.tanh(self.l2(h) + h)
+        h = functions.sigmoid(self.l3(h) * 2 + 1)
+        return functions.sum(h * h)
+
+
+@testing.parameterize(*testing.product({
+    'release_retained': [True, False],
+}))
+class TestMemoryPlanHook(unittest.TestCase):
+
+    def setUp(self):
+        self.model = Model()
+        self.x = numpy.random.uniform(-1, 1, (3, 5)).astype(numpy.float32)
+        self.hook = function_hooks.MemoryPlanHook(
+            release_retained=self.release_retained)
+
+    def run_model(self, x, hook=None):
+        self.model.cleargrads()
+        if hook is None:
+            loss = self.model(x)
+            loss.backward()
+        else:
+            with hook:
+                loss = self.model(x)
+                loss.backward()
+        return (loss.array,
+                [p.grad.copy() for _, p in sorted(self.model.namedparams())])
+
+    def check_run(self, x, n_iter=3):
+        expect = self.run_model(x)
+        for i in six.moves.range(n_iter):
+            actual = self.run_model(x, self.hook)
+            testing.assert_allclose(actual[0], expect[0])
+            for g, expect_g in six.moves.zip(actual[1], expect[1]):
+                testing.assert_allclose(g, expect_g)
+            self.assertTrue(self.hook.planned)
+            if i == 0:
+                self.assertEqual(self.hook.n_reused, 0)
+            else:
+                self.assertGreater(self.hook.n_reused, 0)
+            if self.release_retained:
+                self.assertGreater(self.hook.n_released, 0)
+            else:
+                self.assertEqual(self.hook.n_released, 0)
+
+    def test_name(self):
+        self.assertEqual(self.hook.name, 'MemoryPlanHook')
+
+    def test_cpu(self):
+        self.check_run(self.x)
+
+    @attr.gpu
+    def test_gpu(self):
+        self.model.to_gpu()
+        self.check_run(cuda.to_gpu(self.x))
+
+    def test_diverged(self):
+        self.check_run(self.x)
+        x = numpy.random.uniform(-1, 1, (2, 5)).astype(numpy.float32)
+        expect = self.run_model(x)
+        actual = self.run_model(x, self.hook)
+        self.assertEqual(self.hook.n_reused, 0)
+        testing.assert_allclose(actual[0], expect[0])
+
+    def test_reset(self):
+        self.run_model(self.x, self.hook)
+        self.hook.reset()
+        self.assertFalse(self.hook.planned)
+        self.run_model(self.x, self.hook)
+        self.assertTrue(self.hook.planned)
+        self.assertEqual(self.hook.n_reused, 0)
+
+    def test_live_array(self):
+        x = chainer.Variable(self.x)
+        for i in six.moves.range(2):
+            with self.hook:
+                h = self.model.l1(x)
+                expect = h.array.copy()
+                y = functions.relu(h)
+                y.grad = numpy.ones_like(y.array)
+                y.backward()
+                # The input referenced by the user is not overwritten.
+                testing.assert_allclose(h.array, expect)
+            self.assertEqual(self.hook.n_reused, 0)
+
+    def test_double_backprop(self):
+        x = chainer.Variable(self.x)
+        with self.hook:
+            y = functions.sum(functions.tanh(x) * 3)
+            gx, = chainer.grad([y], [x], enable_double_backprop=True)
+            self.assertEqual(self.hook.n_released, 0)
+            functions.sum(gx).backward()
+        expect = -6 * numpy.tanh(self.x) * (1 - numpy.tanh(self.x) ** 2)
+        testing.assert_allclose(x.grad, expect)
+
+    def test_add_to_function(self):
+        function = functions.activation.relu.ReLU()
+        with self.assertRaises(TypeError):
+            function.add_hook(self.hook)
+
+
+testing.run_module(__name__, __file__)
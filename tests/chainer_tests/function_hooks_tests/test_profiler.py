@@ -0,0 +1,175 @@
+import json
+import os
+import tempfile
+import unittest
+
+import numpy
+import six
+
+import chainer
+from chainer.backends import cuda
+from chainer import function_hooks
+from chainer import functions
+from chainer import links
+from chainer import testing
+from chainer.testing import attr
+
+
+class MLP(chainer.Chain):
+
+    def __init__(self):
+        super(MLP, self).__init__()
+        with self.init_scope():
+            self.l1 = links.Linear(None, 4)
+            self.l2 = links.Linear(4, 3)
+
+    def __call__(self, x):
+        return self.l2(functions.relu(self.l1(x)))
+
+
+class Model(chainer.Chain):
+
+    def __init__(self):
+        super(Model, self).__init__()
+        with self.init_scope():
+            self.predictor = MLP()
+
+    def __call__(self, x):
+        return functions.sum(self.predictor(x))
+
+
+class TestProfilerHook(unittest.TestCase):
+
+    def setUp(self):
+        self.model = Model()
+        self.x = numpy.random.uniform(-1, 1, (2, 5)).astype(numpy.float32)
+
+    def run_model(self, hook, x, n_iter=2):
+        with hook:
+            for _ in six.moves.range(n_iter):
+                loss = self.model(x)
+                loss.backward()
+
+    def test_name(self):
+        self.assertEqual(
+            function_hooks.ProfilerHook().name, 'ProfilerHook')
+
+    def check_summary(self, x):
+        hook = function_hooks.ProfilerHook(self.model)
+        self.run_model(hook, x)
+        summary = hook.summary()
+        for phase in ('forward', 'backward'):
+            for path in ('predictor/l1', 'predictor/l2'):
+                entry = summary[(path, 'LinearFunction', phase)]
+                self.assertEqual(entry['occurrence'], 2)
+                self.assertGreater(entry['elapsed_time'], 0)
+                self.assertGreaterEqual(
+                    entry['elapsed_time'], entry['self_time'])
+            # Functions without parameters are attributed to the parent of
+            # the last link.
+            self.assertEqual(
+                summary[('predictor', 'ReLU', phase)]['occurrence'], 2)
+            self.assertEqual(
+                summary[('predictor', 'Sum', phase)]['occurrence'], 2)
+
+        link_summary = hook.link_summary()
+        self.assertEqual(
+            set(link_summary), {'', 'predictor', 'predictor/l1',
+                                'predictor/l2'})
+        root = link_summary['']
+        self.assertEqual(
+            root['occurrence'], sum(e['occurrence'] for e in summary.values()))
+        testing.assert_allclose(
+            root['forward'] + root['backward'], hook.total_time())
+        self.assertLessEqual(
+            link_summary['predictor/l1']['forward'],
+            link_summary['predictor']['forward'])
+        self.assertEqual(set(hook.link_summary(depth=1)), {'', 'predictor'})
+
+    def test_summary_cpu(self):
+        self.check_summary(self.x)
+
+    @attr.gpu
+    def test_summary_gpu(self):
+        self.model.to_gpu()
+        self.check_summary(cuda.to_gpu(self.x))
+
+    @attr.gpu
+    def test_to_gpu_while_profiling(self):
+        hook = function_hooks.ProfilerHook(self.model)
+        self.run_model(hook, self.x, n_iter=1)
+        self.model.to_gpu()
+        self.run_model(hook, cuda.to_gpu(self.x), n_iter=1)
+        entry = hook.summary()[('predictor/l1', 'LinearFunction', 'forward')]
+        self.assertEqual(entry['occurrence'], 2)
+
+    def test_without_link(self):
+        hook = function_hooks.ProfilerHook()
+        self.run_model(hook, self.x)
+        self.assertEqual(set(hook.link_summary()), {''})
+        self.assertIn(('', 'LinearFunction', 'forward'), hook.summary())
+
+    def test_print_report(self):
+        hook = function_hooks.ProfilerHook(self.model)
+        self.run_model(hook, self.x)
+        f = six.StringIO()
+        hook.print_report(file=f)
+        lines = f.getvalue().splitlines()
+        self.assertEqual(len(lines), 5)
+        self.assertIn('predictor/l1', f.getvalue())
+        self.assertIn('(root)', f.getvalue())
+
+    def test_chrome_trace(self):
+        hook = function_hooks.ProfilerHook(self.model, trace_size=5)
+        self.run_model(hook, self.x)
+        f = six.StringIO()
+        hook.export_chrome_trace(f)
+        events = json.loads(f.getvalue())['traceEvents']
+        self.assertEqual(len(events), 5)
+        for event in events:
+            self.assertEqual(event['ph'], 'X')
+            self.assertIn(event['cat'], ('forward', 'backward'))
+            self.assertGreaterEqual(event['dur'], 0)
+
+    def test_chrome_trace_file(self):
+        hook = function_hooks.ProfilerHook(self.model, trace_size=100)
+        self.run_model(hook, self.x, n_iter=1)
+        fd, path = tempfile.mkstemp()
+        os.close(fd)
+        try:
+            hook.export_chrome_trace(path)
+            with open(path) as f:
+                events = json.load(f)['traceEvents']
+        finally:
+            os.remove(path)
+        self.assertGreater(len(events), 0)
+        self.assertLess(len(events), 100)
+
+    def test_flamegraph(self):
+        hook = function_hooks.ProfilerHook(self.model)
+        self.run_model(hook, self.x)
+        f = six.StringIO()
+        hook.export_flamegraph(f)
+        lines = f.getvalue().splitlines()
+        self.assertEqual(len(lines), len(hook.summary()))
+        self.assertIn(
+            '(root);predictor;l1;LinearFunction (forward)',
+            [line.rsplit(' ', 1)[0] for line in lines])
+        for line in lines:
+            int(line.rsplit(' ', 1)[1])
+
+    @unittest.skipUnless(
+        function_hooks.profiler._tracemalloc_available,
+        'tracemalloc is not available')
+    def test_memory_sampling(self):
+        hook = function_hooks.ProfilerHook(
+            self.model, memory_sampling_interval=1)
+        self.run_model(hook, self.x)
+        summary = hook.summary()
+        entry = summary[('predictor/l1', 'LinearFunction', 'forward')]
+        self.assertEqual(entry['memory_samples'], 2)
+        self.assertGreater(entry['peak_memory'], 0)
+        self.assertGreater(entry['mean_peak_memory'], 0)
+
+
+testing.run_module(__name__, __file__)
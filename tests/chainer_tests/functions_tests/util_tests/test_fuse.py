@@ -0,0 +1,139 @@
+import unittest
+
+import numpy
+
+import chainer
+from chainer import functions
+from chainer import gradient_check
+from chainer import testing
+
+
+def _affine_relu(x, a, b):
+    return functions.relu(x * a + b)
+
+
+def _gates(x, y):
+    return functions.sigmoid(x) * functions.tanh(y) + (1 - x) / 2
+
+
+def _multi_output(x, y):
+    z = x * y - 3
+    return functions.exp(z) + z * z, -z ** 2 / (x + 3)
+
+
+def _unary_ops(x, y):
+    x = x + 2
+    return functions.sqrt(x) + functions.log(x) + functions.square(y) - y
+
+
+_funcs = {
+    'affine_relu': _affine_relu,
+    'gates': _gates,
+    'multi_output': _multi_output,
+    'unary_ops': _unary_ops,
+}
+
+
+@testing.parameterize(*testing.product({
+    'func': ['affine_relu', 'gates', 'multi_output', 'unary_ops'],
+    'dtype': [numpy.float32, numpy.float64],
+}))
+class TestFuse(unittest.TestCase):
+
+    shape = (3, 4)
+
+    def setUp(self):
+        self.func = _funcs[self.func]
+        n_args = 3 if self.func is _affine_relu else 2
+        self.xs = tuple(
+            numpy.random.uniform(-1, 1, self.shape).astype(self.dtype)
+            for _ in range(n_args))
+        self.fused = functions.fuse(self.func)
+
+    def _outputs(self, ys):
+        if not isinstance(ys, tuple):
+            ys = ys,
+        return ys
+
+    def test_forward(self):
+        expects = self._outputs(
+            self.func(*[chainer.Variable(x) for x in self.xs]))
+        for _ in range(2):
+            ys = self._outputs(self.fused(*self.xs))
+            self.assertEqual(len(ys), len(expects))
+            for y, expect in zip(ys, expects):
+                self.assertIsInstance(
+                    y.creator, functions.util.fuse.FusedElementwise)
+                self.assertEqual(y.dtype, self.dtype)
+                testing.assert_allclose(y.array, expect.array)
+
+    def test_forward_no_backprop(self):
+        expects = self._outputs(
+            self.func(*[chainer.Variable(x) for x in self.xs]))
+        with chainer.no_backprop_mode():
+            ys = self._outputs(self.fused(*self.xs))
+        for y, expect in zip(ys, expects):
+            testing.assert_allclose(y.array, expect.array)
+
+    def _loss(self, ys, gys):
+        return sum(functions.sum(y * gy) for y, gy in zip(ys, gys))
+
+    def test_backward(self):
+        xs = [chainer.Variable(x) for x in self.xs]
+        fused_xs = [chainer.Variable(x) for x in self.xs]
+        ys = self._outputs(self.func(*xs))
+        fused_ys = self._outputs(self.fused(*fused_xs))
+        gys = [numpy.random.uniform(-1, 1, self.shape).astype(self.dtype)
+               for _ in ys]
+        self._loss(ys, gys).backward()
+        self._loss(fused_ys, gys).backward()
+        for x, fused_x in zip(xs, fused_xs):
+            testing.assert_allclose(x.grad, fused_x.grad)
+
+    def test_check_backward(self):
+        ys = self._outputs(
+            self.func(*[chainer.Variable(x) for x in self.xs]))
+        gys = tuple(
+            numpy.random.uniform(-1, 1, self.shape).astype(self.dtype)
+            for _ in ys)
+        gradient_check.check_backward(
+            self.fused, self.xs, gys, dtype=numpy.float64,
+            atol=1e-4, rtol=1e-3)
+
+
+class TestFuseCapture(unittest.TestCase):
+
+    def test_parameter(self):
+        w = chainer.Parameter(numpy.random.uniform(-1, 1, 5)
+                              .astype(numpy.float32))
+
+        @functions.fuse
+        def f(x):
+            return functions.tanh(x * w)
+
+        x = chainer.Variable(
+            numpy.random.uniform(-1, 1, 5).astype(numpy.float32))
+        y = f(x)
+        self.assertIsInstance(y.creator, functions.util.fuse.FusedElementwise)
+        y.grad = numpy.ones_like(y.array)
+        y.backward()
+        expect = functions.tanh(x * w)
+        testing.assert_allclose(y.array, expect.array)
+        testing.assert_allclose(w.grad, (1 - y.array ** 2) * x.array)
+
+        # Updated values of the captured parameter are used.
+        w.array[...] = 0
+        testing.assert_allclose(f(x).array, numpy.zeros(5))
+
+    def test_fallback(self):
+        @functions.fuse
+        def f(x):
+            return functions.sum(x * 2)
+
+        x = numpy.arange(4, dtype=numpy.float32)
+        y = f(x)
+        self.assertIsInstance(y.creator, functions.math.sum.Sum)
+        testing.assert_allclose(y.array, 12)
+
+
+testing.run_module(__name__, __file__)
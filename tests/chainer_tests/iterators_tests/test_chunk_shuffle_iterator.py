@@ -0,0 +1,182 @@
+from __future__ import division
+import unittest
+
+import numpy
+
+from chainer import iterators
+from chainer import serializer
+from chainer import testing
+
+
+class DummySerializer(serializer.Serializer):
+
+    def __init__(self, target):
+        super(DummySerializer, self).__init__()
+        self.target = target
+
+    def __getitem__(self, key):
+        raise NotImplementedError
+
+    def __call__(self, key, value):
+        self.target[key] = value
+        return self.target[key]
+
+
+class DummyDeserializer(serializer.Deserializer):
+
+    def __init__(self, target):
+        super(DummyDeserializer, self).__init__()
+        self.target = target
+
+    def __getitem__(self, key):
+        raise NotImplementedError
+
+    def __call__(self, key, value):
+        if value is None:
+            value = self.target[key]
+        elif isinstance(value, numpy.ndarray):
+            numpy.copyto(value, self.target[key])
+        else:
+            value = type(value)(numpy.asarray(self.target[key]))
+        return value
+
+
+class RecordingDataset(object):
+
+    # Dataset that records the slices it is read by.
+
+    def __init__(self, n):
+        self.n = n
+        self.reads = []
+
+    def __len__(self):
+        return self.n
+
+    def __getitem__(self, index):
+        assert isinstance(index, slice)
+        start, stop, step = index.indices(self.n)
+        assert step == 1
+        self.reads.append((start, stop))
+        return list(range(start, stop))
+
+
+@testing.parameterize(*testing.product({
+    'n': [10, 13],
+    'batch_size': [1, 3, 4],
+    'chunk_size': [1, 3, 16],
+    'buffer_size': [1, 5, 32],
+}))
+class TestChunkShuffleIterator(unittest.TestCase):
+
+    def setUp(self):
+        self.dataset = RecordingDataset(self.n)
+        self.it = iterators.ChunkShuffleIterator(
+            self.dataset, self.batch_size, chunk_size=self.chunk_size,
+            buffer_size=self.buffer_size)
+
+    def test_epoch(self):
+        examples = []
+        while self.it.epoch < 3:
+            batch = self.it.next()
+            self.assertLessEqual(len(batch), self.batch_size)
+            examples.extend(batch)
+        self.assertTrue(self.it.is_new_epoch)
+        # The examples are concatenated across the epochs.
+        for epoch in range(3):
+            self.assertEqual(
+                sorted(examples[epoch * self.n:(epoch + 1) * self.n]),
+                list(range(self.n)))
+
+    def test_reads(self):
+        n_chunks = -(-self.n // self.chunk_size)
+        while self.it.epoch < 1:
+            self.it.next()
+        # Each chunk is read once by a contiguous slice in the epoch.
+        expected = [(i, min(i + self.chunk_size, self.n))
+                    for i in range(0, self.n, self.chunk_size)]
+        self.assertEqual(sorted(self.dataset.reads[:n_chunks]), expected)
+
+    def test_serialize(self):
+        consumed = set(self.it.next() + self.it.next())
+        target = {}
+        self.it.serialize(DummySerializer(target))
+
+        dataset = RecordingDataset(self.n)
+        it = iterators.ChunkShuffleIterator(
+            dataset, self.batch_size, chunk_size=self.chunk_size,
+            buffer_size=self.buffer_size)
+        it.serialize(DummyDeserializer(target))
+        self.assertEqual(it.epoch_detail, self.it.epoch_detail)
+        self.assertEqual(it.previous_epoch_detail,
+                         self.it.previous_epoch_detail)
+
+        rest = self.n - self.it.current_position
+        n_rest = -(-rest // self.batch_size)
+        examples = []
+        expected = []
+        for k in range(n_rest):
+            if k == n_rest - 1:
+                reads = list(dataset.reads)
+            examples.extend(it.next())
+            expected.extend(self.it.next())
+        self.assertTrue(it.is_new_epoch)
+        # The examples of the next epoch are shuffled independently.
+        self.assertEqual(examples[:rest], expected[:rest])
+
+        # The chunks consumed before the snapshot are not read again.
+        for start, stop in reads:
+            self.assertFalse(set(range(start, stop)) <= consumed)
+
+    def test_serialize_keeps_buffer(self):
+        self.it.next()
+        order = self.it._order.copy()
+        position = self.it.current_position
+        buffer = dict(self.it._buffer)
+        n_reads = len(self.dataset.reads)
+
+        # Saving a snapshot does not discard the buffer.
+        self.it.serialize(DummySerializer({}))
+        self.assertEqual(self.it._buffer, buffer)
+        numpy.testing.assert_array_equal(self.it._order, order)
+        batch = self.it.next()
+        n = min(self.batch_size, self.n - position)
+        self.assertEqual(batch[:n], list(order[position:position + n]))
+        if set(batch[:n]) <= set(buffer):
+            self.assertEqual(len(self.dataset.reads), n_reads)
+
+
+class TestChunkShuffleIteratorOrder(unittest.TestCase):
+
+    def test_buffer_bound(self):
+        # With the buffer of one chunk, the chunks are not mixed.
+        dataset = RecordingDataset(12)
+        it = iterators.ChunkShuffleIterator(
+            dataset, 4, chunk_size=4, buffer_size=4)
+        for _ in range(3):
+            batch = it.next()
+            self.assertEqual(sorted(batch),
+                             list(range(batch[0] // 4 * 4,
+                                        batch[0] // 4 * 4 + 4)))
+
+    def test_no_shuffle(self):
+        it = iterators.ChunkShuffleIterator(
+            list(range(5)), 2, shuffle=False, chunk_size=2)
+        self.assertEqual(it.next(), [0, 1])
+        self.assertEqual(it.next(), [2, 3])
+        self.assertEqual(it.next(), [4, 0])
+        self.assertTrue(it.is_new_epoch)
+
+    def test_not_repeat(self):
+        it = iterators.ChunkShuffleIterator(
+            list(range(5)), 2, repeat=False, chunk_size=2, buffer_size=3)
+        examples = sum(list(it), [])
+        self.assertEqual(sorted(examples), list(range(5)))
+
+    def test_invalid_arguments(self):
+        with self.assertRaises(ValueError):
+            iterators.ChunkShuffleIterator([1], 1, chunk_size=0)
+        with self.assertRaises(ValueError):
+            iterators.ChunkShuffleIterator([1], 1, buffer_size=0)
+
+
+testing.run_module(__name__, __file__)
@@ -1,6 +1,7 @@
 from __future__ import division
 import copy
 import errno
+import multiprocessing
 import os
 import signal
 import subprocess
@@ -13,6 +14,7 @@ import unittest
 import numpy
 import six
 
+from chainer import datasets
 from chainer import iterators
 from chainer import serializer
 from chainer import testing
@@ -391,6 +393,75 @@ class TestMultiprocessIteratorSerialize(unittest.TestCase):
         self.assertAlmostEqual(it.previous_epoch_detail, 4 / 6)
 
 
+@testing.parameterize(*testing.product({
+    'start_method': [None, 'fork', 'spawn', 'forkserver'],
+    'shared_memory_dataset': [False, True],
+    'maxtasksperchild': [None, 2],
+}))
+class TestMultiprocessIteratorStartMethod(unittest.TestCase):
+
+    def setUp(self):
+        if self.start_method is not None:
+            if not hasattr(multiprocessing, 'get_context'):
+                raise unittest.SkipTest('start_method is not supported')
+            if (self.start_method not in
+                    multiprocessing.get_all_start_methods()):
+                raise unittest.SkipTest(
+                    '{} is not available'.format(self.start_method))
+        x = numpy.arange(12, dtype=numpy.float32).reshape(6, 2)
+        t = numpy.arange(6, dtype=numpy.int32)
+        if self.shared_memory_dataset:
+            self.dataset = datasets.SharedMemoryDataset(x, t)
+        else:
+            self.dataset = datasets.TupleDataset(x, t)
+        self.options = {'n_processes': 2,
+                        'start_method': self.start_method,
+                        'maxtasksperchild': self.maxtasksperchild}
+
+    def test_iterator(self):
+        it = iterators.MultiprocessIterator(self.dataset, 2, **self.options)
+        for epoch in range(3):
+            labels = []
+            for _ in range(3):
+                batch = it.next()
+                for x, t in batch:
+                    numpy.testing.assert_array_equal(x, [t * 2, t * 2 + 1])
+                    labels.append(int(t))
+            self.assertTrue(it.is_new_epoch)
+            self.assertEqual(sorted(labels), list(range(6)))
+        it.finalize()
+
+    def test_get_worker_rss(self):
+        it = iterators.MultiprocessIterator(self.dataset, 2, **self.options)
+        self.assertEqual(it.get_worker_rss(), {})
+        for _ in range(6):
+            it.next()
+        worker_rss = it.get_worker_rss()
+        it.finalize()
+        try:
+            import resource  # NOQA
+        except ImportError:
+            self.assertEqual(worker_rss, {})
+            return
+        self.assertGreater(len(worker_rss), 0)
+        self.assertNotIn(os.getpid(), worker_rss)
+        for rss in worker_rss.values():
+            self.assertGreater(rss, 0)
+
+
+class TestMultiprocessIteratorInvalidOptions(unittest.TestCase):
+
+    def test_invalid_start_method(self):
+        with self.assertRaises(ValueError):
+            iterators.MultiprocessIterator(
+                [1, 2, 3], 1, start_method='no_such_method')
+
+    def test_invalid_maxtasksperchild(self):
+        with self.assertRaises(ValueError):
+            iterators.MultiprocessIterator(
+                [1, 2, 3], 1, maxtasksperchild=0)
+
+
 class TestMultiprocessIteratorConcurrency(unittest.TestCase):
 
     def test_finalize_not_deadlock(self):
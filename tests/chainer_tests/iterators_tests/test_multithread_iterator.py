@@ -45,11 +45,15 @@ class DummyDeserializer(serializer.Deserializer):
 
 @testing.parameterize(*testing.product({
     'n_threads': [1, 2],
+    'n_prefetch': [1, 3],
+    'ordered': [True, False],
 }))
 class TestMultithreadIterator(unittest.TestCase):
 
     def setUp(self):
-        self.options = {'n_threads': self.n_threads}
+        self.options = {'n_threads': self.n_threads,
+                        'n_prefetch': self.n_prefetch,
+                        'ordered': self.ordered}
 
     def test_iterator_repeat(self):
         dataset = [1, 2, 3, 4, 5, 6]
@@ -283,11 +287,15 @@ class TestMultithreadIterator(unittest.TestCase):
 
 @testing.parameterize(*testing.product({
     'n_threads': [1, 2],
+    'n_prefetch': [1, 3],
+    'ordered': [True, False],
 }))
 class TestMultithreadIteratorSerialize(unittest.TestCase):
 
     def setUp(self):
-        self.options = {'n_threads': self.n_threads}
+        self.options = {'n_threads': self.n_threads,
+                        'n_prefetch': self.n_prefetch,
+                        'ordered': self.ordered}
 
     def test_iterator_serialize(self):
         dataset = [1, 2, 3, 4, 5, 6]
@@ -327,4 +335,65 @@ class TestMultithreadIteratorSerialize(unittest.TestCase):
         self.assertAlmostEqual(it.previous_epoch_detail, 4 / 6)
 
 
+@testing.parameterize(*testing.product({
+    'n_threads': [1, 3],
+    'n_prefetch': [1, 2, 5],
+}))
+class TestMultithreadIteratorPrefetch(unittest.TestCase):
+
+    def test_ordered(self):
+        dataset = list(range(7))
+        it = iterators.MultithreadIterator(
+            dataset, 3, shuffle=False, n_threads=self.n_threads,
+            n_prefetch=self.n_prefetch)
+        expected = [[0, 1, 2], [3, 4, 5], [6, 0, 1], [2, 3, 4], [5, 6, 0]]
+        expected_epochs = [0, 0, 1, 1, 2]
+        for batch, epoch in zip(expected, expected_epochs):
+            self.assertEqual(it.next(), batch)
+            self.assertEqual(it.epoch, epoch)
+        it.finalize()
+
+    def test_unordered(self):
+        dataset = list(range(7))
+        it = iterators.MultithreadIterator(
+            dataset, 3, shuffle=False, n_threads=self.n_threads,
+            n_prefetch=self.n_prefetch, ordered=False)
+        self.assertEqual(sorted(it.next()), [0, 1, 2])
+        self.assertEqual(sorted(it.next()), [3, 4, 5])
+        self.assertEqual(sorted(it.next()), [0, 1, 6])
+        it.finalize()
+
+    def test_no_repeat(self):
+        dataset = list(range(5))
+        it = iterators.MultithreadIterator(
+            dataset, 2, repeat=False, shuffle=False,
+            n_threads=self.n_threads, n_prefetch=self.n_prefetch)
+        self.assertEqual(list(it), [[0, 1], [2, 3], [4]])
+        it.finalize()
+
+    def test_serialize(self):
+        dataset = list(range(7))
+        it = iterators.MultithreadIterator(
+            dataset, 3, n_threads=self.n_threads, n_prefetch=self.n_prefetch)
+        it.next()
+        it.next()
+        target = dict()
+        it.serialize(DummySerializer(target))
+
+        it2 = iterators.MultithreadIterator(
+            dataset, 3, n_threads=self.n_threads, n_prefetch=self.n_prefetch)
+        it2.serialize(DummyDeserializer(target))
+        # The first example is the last one of the current epoch, and the
+        # rest are taken from the order of the next epoch.
+        self.assertEqual(it2.next()[0], it.next()[0])
+        self.assertEqual(it.epoch, it2.epoch)
+        self.assertAlmostEqual(it.epoch_detail, it2.epoch_detail)
+        it.finalize()
+        it2.finalize()
+
+    def test_invalid_n_prefetch(self):
+        with self.assertRaises(ValueError):
+            iterators.MultithreadIterator([1, 2], 1, n_prefetch=0)
+
+
 testing.run_module(__name__, __file__)
@@ -367,4 +367,72 @@ class TestNStepBiLSTM(unittest.TestCase):
         self.assertEqual(self.rnn.n_cells, 2)
 
 
+@testing.parameterize(*testing.product({
+    'hidden_none': [True, False],
+}))
+class TestNStepLSTMDecoder(unittest.TestCase):
+
+    batch = 3
+    length = 4
+    n_layer = 2
+    in_size = 3
+    out_size = 2
+
+    def setUp(self):
+        shape = (self.n_layer, self.batch, self.out_size)
+        if self.hidden_none:
+            self.h = self.c = None
+        else:
+            self.h = numpy.random.uniform(-1, 1, shape).astype('f')
+            self.c = numpy.random.uniform(-1, 1, shape).astype('f')
+        self.xs = numpy.random.uniform(
+            -1, 1, (self.batch, self.length, self.in_size)).astype('f')
+        self.rnn = links.NStepLSTM(
+            self.n_layer, self.in_size, self.out_size, 0.0)
+
+    def check_step(self, h, c, xs):
+        hy, cy, ys = self.rnn(h, c, list(xs))
+        decoder = self.rnn.decoder(h, c, batch_size=self.batch)
+        for t in range(self.length):
+            y = decoder.step(xs[:, t])
+            for b in range(self.batch):
+                testing.assert_allclose(y.data[b], ys[b].data[t])
+        dhy, dcy = decoder.states
+        testing.assert_allclose(dhy.data, hy.data)
+        testing.assert_allclose(dcy.data, cy.data)
+
+    def test_step_cpu(self):
+        self.check_step(self.h, self.c, self.xs)
+
+    @attr.gpu
+    def test_step_gpu(self):
+        self.rnn.to_gpu()
+        if not self.hidden_none:
+            self.h = cuda.to_gpu(self.h)
+            self.c = cuda.to_gpu(self.c)
+        self.check_step(self.h, self.c, cuda.to_gpu(self.xs))
+
+    def test_reorder(self):
+        decoder = self.rnn.decoder(self.h, self.c, batch_size=self.batch)
+        decoder.step(self.xs[:, 0])
+        h, c = decoder.states
+        indices = numpy.array([2, 2, 0, 1], 'i')
+        decoder.reorder(indices)
+        rh, rc = decoder.states
+        self.assertEqual(rh.shape, (self.n_layer, 4, self.out_size))
+        testing.assert_allclose(rh.data, h.data[:, indices])
+        testing.assert_allclose(rc.data, c.data[:, indices])
+
+    def test_no_batch_size(self):
+        if self.hidden_none:
+            with self.assertRaises(ValueError):
+                self.rnn.decoder()
+
+    def test_bi_direction(self):
+        rnn = links.NStepBiLSTM(
+            self.n_layer, self.in_size, self.out_size, 0.0)
+        with self.assertRaises(ValueError):
+            rnn.decoder(batch_size=self.batch)
+
+
 testing.run_module(__name__, __file__)
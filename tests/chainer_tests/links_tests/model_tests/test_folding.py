@@ -0,0 +1,134 @@
+import unittest
+
+import numpy
+
+import chainer
+from chainer.backends import cuda
+from chainer import functions
+from chainer import links
+from chainer import testing
+from chainer.testing import attr
+
+
+def _count_affine_links(model):
+    return len([link for link in model.links() if isinstance(
+        link, (links.BatchNormalization, links.Scale))])
+
+
+def _randomize_bn(bn):
+    size = bn.avg_mean.shape
+    bn.avg_mean[...] = numpy.random.uniform(-1, 1, size)
+    bn.avg_var[...] = numpy.random.uniform(0.5, 2, size)
+    if hasattr(bn, 'gamma'):
+        bn.gamma.array[...] = numpy.random.uniform(0.5, 2, size)
+    if hasattr(bn, 'beta'):
+        bn.beta.array[...] = numpy.random.uniform(-1, 1, size)
+
+
+class ConvBNChain(chainer.Chain):
+
+    def __init__(self):
+        super(ConvBNChain, self).__init__()
+        with self.init_scope():
+            self.conv1 = links.Convolution2D(3, 4, 3, pad=1, nobias=True)
+            self.bn1 = links.BatchNormalization(4)
+            self.conv2 = links.Convolution2D(4, 4, 3, pad=1)
+            self.bn2 = links.BatchNormalization(4)
+            # Caffe style: normalization without parameters and scale
+            self.conv3 = links.Convolution2D(4, 4, 1)
+            self.bn3 = links.BatchNormalization(
+                4, use_gamma=False, use_beta=False)
+            self.scale3 = links.Scale(W_shape=(4,), bias_term=True)
+            self.fc = links.Linear(None, 5)
+            self.bn4 = links.BatchNormalization(5)
+        for bn in (self.bn1, self.bn2, self.bn3, self.bn4):
+            _randomize_bn(bn)
+        self.scale3.W.array[...] = numpy.random.uniform(0.5, 2, 4)
+        self.scale3.bias.b.array[...] = numpy.random.uniform(-1, 1, 4)
+
+    def __call__(self, x):
+        h = functions.relu(self.bn1(self.conv1(x)))
+        h = h + self.bn2(self.conv2(h))
+        h = functions.relu(self.scale3(self.bn3(self.conv3(h))))
+        return self.bn4(self.fc(h))
+
+
+class SharedOutputChain(chainer.Chain):
+
+    def __init__(self):
+        super(SharedOutputChain, self).__init__()
+        with self.init_scope():
+            self.conv = links.Convolution2D(3, 4, 3)
+            self.bn = links.BatchNormalization(4)
+        _randomize_bn(self.bn)
+
+    def __call__(self, x):
+        h = self.conv(x)
+        return self.bn(h) + h
+
+
+class TestFoldBatchNormalization(unittest.TestCase):
+
+    def setUp(self):
+        self.x = numpy.random.uniform(
+            -1, 1, (2, 3, 8, 8)).astype(numpy.float32)
+
+    def check_fold(self, model, x, n_folded):
+        n_links = _count_affine_links(model)
+        with chainer.using_config('train', False):
+            expect = model(x).array
+        folded = links.fold_batch_normalization(model, x)
+        self.assertEqual(_count_affine_links(model), n_links)
+        self.assertEqual(_count_affine_links(folded), n_links - n_folded)
+
+        with chainer.using_config('train', False):
+            y = folded(x).array
+        testing.assert_allclose(y, expect, atol=1e-4, rtol=1e-4)
+        with chainer.using_config('train', False):
+            testing.assert_allclose(model(x).array, expect)
+        return folded
+
+    def test_chain(self):
+        model = ConvBNChain()
+        folded = self.check_fold(model, self.x, 5)
+        self.assertEqual(_count_affine_links(folded), 0)
+        self.assertIsNotNone(folded.conv1.b)
+
+    @attr.gpu
+    def test_chain_gpu(self):
+        model = ConvBNChain()
+        model.to_gpu()
+        self.check_fold(model, cuda.to_gpu(self.x), 5)
+
+    def test_sequential(self):
+        model = chainer.Sequential(
+            links.Convolution2D(3, 4, 3), links.BatchNormalization(4),
+            functions.relu)
+        _randomize_bn(model[1])
+        folded = self.check_fold(model, self.x, 1)
+        self.assertEqual(len(folded), 2)
+
+    def test_shared_output(self):
+        model = SharedOutputChain()
+        folded = self.check_fold(model, self.x, 0)
+        self.assertIsInstance(folded.bn, links.BatchNormalization)
+
+    @attr.slow
+    def test_resnet50(self):
+        model = links.ResNet50Layers(pretrained_model=None)
+        for link in model.links():
+            if isinstance(link, links.BatchNormalization):
+                _randomize_bn(link)
+        x = numpy.random.uniform(
+            -1, 1, (1, 3, 64, 64)).astype(numpy.float32)
+        with chainer.using_config('train', False):
+            expect = model(x, layers=['fc6'])['fc6'].array
+        folded = links.fold_batch_normalization(model, x)
+        self.assertEqual(_count_affine_links(folded), 0)
+        with chainer.using_config('train', False):
+            y = folded(x, layers=['fc6'])['fc6'].array
+        scale = abs(expect).max()
+        testing.assert_allclose(y / scale, expect / scale, atol=1e-4)
+
+
+testing.run_module(__name__, __file__)
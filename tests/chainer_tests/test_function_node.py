@@ -470,6 +470,65 @@ class TestNoBackpropMode(unittest.TestCase):
         self.assertTrue(y.creator_node is not None)
 
 
+class TestInferenceMode(unittest.TestCase):
+
+    def setUp(self):
+        self.x = chainer.Variable(numpy.array([1.], 'f'))
+        self.f = chainer.FunctionNode()
+        self.f.check_type_forward = mock.MagicMock()
+        self.f.forward = mock.MagicMock(
+            return_value=(numpy.array([2.], 'f'),))
+
+    def test_inference_mode(self):
+        with chainer.inference_mode():
+            self.assertFalse(chainer.config.enable_backprop)
+            self.assertTrue(chainer.config.inference)
+            y, = self.f.apply((self.x,))
+        self.assertIsInstance(y, chainer.Variable)
+        self.assertIsNone(y.creator_node)
+        self.assertFalse(y.requires_grad)
+        numpy.testing.assert_array_equal(y.data, numpy.array([2.], 'f'))
+        self.f.forward.assert_called_once_with((self.x.data,))
+        self.assertFalse(self.f.check_type_forward.called)
+
+        self.assertTrue(chainer.config.enable_backprop)
+        self.assertFalse(chainer.config.inference)
+
+    def test_raw_array_input(self):
+        with chainer.inference_mode():
+            y, = self.f.apply((self.x.data,))
+        self.assertIsInstance(y, chainer.Variable)
+        self.f.forward.assert_called_once_with((self.x.data,))
+
+    def test_force_backprop_mode(self):
+        with chainer.inference_mode():
+            with chainer.force_backprop_mode():
+                y, = self.f.apply((self.x,))
+        self.assertIs(y.creator_node, self.f)
+        self.assertTrue(self.f.check_type_forward.called)
+
+    def test_debug_mode(self):
+        with chainer.inference_mode(), chainer.using_config('debug', True):
+            self.f.apply((self.x,))
+        self.assertTrue(self.f.check_type_forward.called)
+
+    def test_function_hook(self):
+        hook = chainer.FunctionHook()
+        hook.forward_preprocess = mock.MagicMock()
+        with chainer.inference_mode(), hook:
+            self.f.apply((self.x,))
+        self.assertTrue(hook.forward_preprocess.called)
+        self.assertTrue(self.f.check_type_forward.called)
+
+    def test_functions(self):
+        x = numpy.random.uniform(-1, 1, (3, 4)).astype('f')
+        w = numpy.random.uniform(-1, 1, (2, 4)).astype('f')
+        expect = chainer.functions.relu(chainer.functions.linear(x, w) * 2)
+        with chainer.inference_mode():
+            y = chainer.functions.relu(chainer.functions.linear(x, w) * 2)
+        testing.assert_allclose(y.data, expect.data)
+
+
 class MyThread(threading.Thread):
 
     def run(self):
@@ -0,0 +1,119 @@
+import subprocess
+import sys
+import unittest
+
+import chainer
+from chainer import datasets
+from chainer import functions
+from chainer import links
+from chainer import testing
+from chainer.training import extensions
+
+
+def _run(code):
+    proc = subprocess.Popen(
+        [sys.executable, '-c', code],
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE)
+    stdoutdata, stderrdata = proc.communicate()
+    assert proc.returncode == 0, (
+        'Import test failed.\n'
+        '[code]:\n{}\n'
+        '[stdout]:{!r}\n'
+        '[stderr]:{!r}'.format(code, stdoutdata, stderrdata))
+    return stdoutdata.decode()
+
+
+_lazy_modules = [
+    'chainer.datasets.mnist',
+    'chainer.functions.loss.softmax_cross_entropy',
+    'chainer.links.connection.linear',
+    'chainer.links.model.vision.resnet',
+    'chainer.training.extensions.plot_report',
+]
+
+
+_load_all = '''
+import chainer
+import chainer.training.extensions
+for module in (chainer.datasets, chainer.functions, chainer.links,
+               chainer.training.extensions):
+    for name in module.__all__:
+        getattr(module, name)
+'''
+
+
+@unittest.skipUnless(sys.version_info >= (3, 5),
+                     'Attributes are imported eagerly in Python 2')
+class TestLazyImport(unittest.TestCase):
+
+    def test_import_chainer(self):
+        out = _run('import sys; import chainer; print(sorted(sys.modules))')
+        for name in _lazy_modules:
+            self.assertNotIn("'{}'".format(name), out)
+
+    def test_import_on_access(self):
+        out = _run(
+            'import sys; import chainer; chainer.links.Linear; '
+            'print(sorted(sys.modules))')
+        self.assertIn("'chainer.links.connection.linear'", out)
+        self.assertNotIn("'chainer.links.model.vision.resnet'", out)
+
+    def test_submodule_on_access(self):
+        _run('import chainer; '
+             'chainer.functions.loss.softmax_cross_entropy'
+             '.SoftmaxCrossEntropy')
+
+    def test_submodule_of_imported_subpackage(self):
+        _run('import chainer.links.model; '
+             'chainer.links.model.vision.resnet.ResNet50Layers')
+
+    def test_number_of_modules(self):
+        # Importing chainer loads only a small part of the implementations.
+        # The number of modules is compared instead of the import time,
+        # which is dominated by NumPy and fluctuates.
+        code = ('import sys\n{}\n'
+                'print(len([name for name in sys.modules '
+                'if name.startswith("chainer.")]))')
+        lazy = int(_run(code.format('import chainer')))
+        eager = int(_run(code.format(_load_all)))
+        self.assertLess(lazy, eager * 0.5)
+
+
+class TestLazyAttributes(unittest.TestCase):
+
+    def test_attributes(self):
+        self.assertIs(
+            functions.relu, chainer.functions.activation.relu.relu)
+        self.assertIs(links.Linear, chainer.links.connection.linear.Linear)
+        self.assertIs(
+            datasets.TupleDataset,
+            chainer.datasets.tuple_dataset.TupleDataset)
+        self.assertIs(
+            extensions.snapshot,
+            chainer.training.extensions._snapshot.snapshot)
+
+    def test_alias(self):
+        self.assertIs(functions.mean, functions.average)
+
+    def test_from_import(self):
+        from chainer.functions import relu
+        self.assertIs(relu, functions.relu)
+
+    def test_dir(self):
+        self.assertIn('relu', dir(functions))
+        self.assertIn('Linear', dir(links))
+
+    def test_all(self):
+        self.assertIn('relu', functions.__all__)
+        self.assertIn('mean', functions.__all__)
+        for name in extensions.__all__:
+            self.assertTrue(hasattr(extensions, name))
+
+    def test_missing_attribute(self):
+        with self.assertRaises(AttributeError):
+            functions.no_such_function
+        self.assertFalse(hasattr(links, 'NoSuchLink'))
+
+
+testing.run_module(__name__, __file__)
@@ -345,6 +345,123 @@ class TestGradientMethodLossScale(unittest.TestCase):
         self.check_update()
 
 
+@testing.parameterize(*testing.product({
+    'dtype': [np.float16, np.float32, np.float64],
+}))
+class TestGradientMethodDynamicLossScale(unittest.TestCase):
+
+    def setUp(self):
+        self.data = np.random.uniform(-1, 1, (4, 3)).astype(self.dtype)
+        self.target = chainer.ChainList(
+            SimpleLink(self.data.copy(), np.ones_like(self.data)),
+            SimpleLink(self.data.copy(), np.ones_like(self.data)))
+        self.optimizer = chainer.optimizers.SGD(0.5)
+        self.optimizer.loss_scaling(interval=2, initial_scale=8)
+
+    def setup_cpu(self):
+        self.optimizer.setup(self.target)
+
+    def setup_gpu(self, device=None):
+        self.target.to_gpu(device)
+        self.optimizer.setup(self.target)
+
+    def check_overflow(self, value):
+        self.target[1].param.grad[1, 2] = value
+        self.optimizer.update()
+        self.assertEqual(self.optimizer.t, 0)
+        self.assertEqual(self.optimizer.n_skipped_updates, 1)
+        self.assertEqual(self.optimizer.loss_scale, 4)
+        for link in self.target:
+            testing.assert_allclose(link.param.data, self.data)
+
+    def test_overflow_inf_cpu(self):
+        self.setup_cpu()
+        self.check_overflow(np.inf)
+
+    def test_overflow_nan_cpu(self):
+        self.setup_cpu()
+        self.check_overflow(np.nan)
+
+    @attr.gpu
+    def test_overflow_inf_gpu(self):
+        self.setup_gpu()
+        self.check_overflow(np.inf)
+
+    @attr.gpu
+    def test_overflow_nan_gpu(self):
+        self.setup_gpu()
+        self.check_overflow(np.nan)
+
+    def check_grow(self):
+        self.optimizer.update()
+        self.assertEqual(self.optimizer.loss_scale, 8)
+        self.optimizer.update()
+        self.assertEqual(self.optimizer.t, 2)
+        self.assertEqual(self.optimizer.n_skipped_updates, 0)
+        self.assertEqual(self.optimizer.loss_scale, 16)
+
+    def test_grow_cpu(self):
+        self.setup_cpu()
+        self.check_grow()
+
+    @attr.gpu
+    def test_grow_gpu(self):
+        self.setup_gpu()
+        self.check_grow()
+
+    def test_lower_bound(self):
+        self.optimizer.loss_scaling(initial_scale=1)
+        self.setup_cpu()
+        self.target[0].param.grad[0, 0] = np.inf
+        self.optimizer.update()
+        self.assertEqual(self.optimizer.loss_scale, 1)
+
+    def test_lossfun(self):
+        self.setup_cpu()
+        x = np.ones((4, 3), dtype=self.dtype)
+
+        def lossfun():
+            return chainer.functions.sum(self.target[0].param * x)
+
+        self.optimizer.update(lossfun)
+        self.assertEqual(self.optimizer.t, 1)
+        testing.assert_allclose(self.target[0].param.data, self.data - 0.5)
+        testing.assert_allclose(self.target[1].param.data, self.data)
+
+    def test_serialize(self):
+        self.setup_cpu()
+        self.target[0].param.grad[0, 0] = np.nan
+        self.optimizer.update()
+        self.optimizer.update()
+        serializer = chainer.serializers.DictionarySerializer()
+        self.optimizer.serialize(serializer)
+
+        optimizer = chainer.optimizers.SGD(0.5)
+        optimizer.loss_scaling()
+        optimizer.setup(self.target)
+        optimizer.serialize(
+            chainer.serializers.NpzDeserializer(serializer.target))
+        self.assertEqual(optimizer.loss_scale, 2)
+        self.assertEqual(optimizer.n_skipped_updates, 2)
+
+    def test_fixed_scale(self):
+        self.optimizer.loss_scaling(scale=10)
+        self.setup_cpu()
+        self.assertEqual(self.optimizer.loss_scale, 10)
+        self.target[0].param.grad[0, 0] = np.inf
+        self.optimizer.update()
+        self.assertEqual(self.optimizer.t, 1)
+        self.assertEqual(self.optimizer.n_skipped_updates, 0)
+
+    def test_invalid_arguments(self):
+        with self.assertRaises(ValueError):
+            self.optimizer.loss_scaling(scale=0)
+        with self.assertRaises(ValueError):
+            self.optimizer.loss_scaling(interval=0)
+        with self.assertRaises(ValueError):
+            self.optimizer.loss_scaling(initial_scale=0.5)
+
+
 class TestCleargradHook(unittest.TestCase):
 
     def setUp(self):
@@ -1,3 +1,4 @@
+import collections
 import contextlib
 import tempfile
 import unittest
@@ -423,5 +424,65 @@ class TestDictSummary(unittest.TestCase):
             'b': (2., 5.),
         })
 
+    def test_order(self):
+        self.summary.add({'a': 3., 'b': 1.})
+        self.summary.add(collections.OrderedDict([('b', 5.), ('a', 1.)]))
+        self.summary.add(collections.OrderedDict([('c', 9.), ('a', 2.)]))
+        self.summary.add({'a': 3., 'b': 5., 'c': 8.})
+
+        self.check(self.summary, {
+            'a': (3., 1., 2., 3.),
+            'b': (1., 5., 5.),
+            'c': (9., 8.),
+        })
+
+    def test_many_entries(self):
+        data = {str(i): numpy.random.uniform(size=3) for i in range(20)}
+        for j in range(3):
+            self.summary.add({k: v[j] for k, v in data.items()})
+
+        self.check(self.summary, data)
+
+    def test_serialize_fraction(self):
+        self.summary.add({'a': 0.25, 'b': numpy.array(0.5, 'f')})
+        self.summary.add({'a': 0.5, 'b': numpy.array(0.125, 'f')})
+
+        summary = chainer.reporter.DictSummary()
+        testing.save_and_load_npz(self.summary, summary)
+        summary.add({'a': 1.5})
+
+        self.check(summary, {
+            'a': (0.25, 0.5, 1.5),
+            'b': (0.5, 0.125),
+        })
+
+    @attr.gpu
+    def test_serialize_to_cupy(self):
+        xp = cuda.cupy
+        self.summary.add({'a': 3., 'b': 1.})
+        self.summary.add({'a': 1., 'b': 5.})
+
+        summary = chainer.reporter.DictSummary()
+        testing.save_and_load_npz(self.summary, summary)
+        summary.add({'a': xp.array(2, 'f'), 'b': 6.})
+
+        self.check(summary, {
+            'a': (3., 1., 2.),
+            'b': (1., 5., 6.),
+        })
+
+    @attr.multi_gpu(2)
+    def test_multi_gpu(self):
+        with cuda.Device(1):
+            b = cuda.cupy.array(1, 'f')
+        self.summary.add({'a': cuda.cupy.array(3, 'f'), 'b': b, 'c': 4.})
+        self.summary.add({'a': cuda.cupy.array(1, 'f'), 'c': 9.})
+
+        self.check(self.summary, {
+            'a': (3., 1.),
+            'b': (1.,),
+            'c': (4., 9.),
+        })
+
 
 testing.run_module(__name__, __file__)
@@ -0,0 +1,156 @@
+import json
+import os
+import shutil
+import tempfile
+import unittest
+
+import six
+
+import chainer
+from chainer import testing
+from chainer import training
+from chainer.training import extensions
+
+
+@training.make_extension(trigger=(1, 'iteration'),
+                         priority=training.PRIORITY_WRITER)
+def _report_iteration(trainer):
+    chainer.report({'value': float(trainer.updater.iteration)})
+
+
+class TestLogReport(unittest.TestCase):
+
+    def setUp(self):
+        self.out = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.out)
+
+    def run_trainer(self, log_report, n_iter, iteration=0):
+        trainer = testing.get_trainer_with_mock_updater(
+            stop_trigger=(n_iter, 'iteration'))
+        trainer.out = self.out
+        trainer.updater.iteration = iteration
+        trainer.extend(_report_iteration)
+        trainer.extend(log_report)
+        trainer.run()
+        return trainer
+
+    def read_lines(self, path):
+        with open(os.path.join(self.out, path)) as f:
+            return [json.loads(line) for line in f]
+
+    def test_json(self):
+        log_report = extensions.LogReport(trigger=(2, 'iteration'))
+        self.run_trainer(log_report, 10)
+        with open(os.path.join(self.out, 'log')) as f:
+            log = json.load(f)
+        self.assertEqual(len(log), 5)
+        self.assertEqual(log, log_report.log)
+        self.assertEqual([entry['value'] for entry in log],
+                         [1.5, 3.5, 5.5, 7.5, 9.5])
+
+    def test_json_lines(self):
+        log_report = extensions.LogReport(
+            trigger=(2, 'iteration'), format='json-lines')
+        self.run_trainer(log_report, 10)
+        log = self.read_lines('log')
+        self.assertEqual(len(log), 5)
+        self.assertEqual(log, log_report.log)
+        self.assertEqual([entry['iteration'] for entry in log],
+                         [2, 4, 6, 8, 10])
+
+    def test_json_lines_discard_previous_log(self):
+        with open(os.path.join(self.out, 'log'), 'w') as f:
+            f.write('{"iteration": 100}\n')
+        log_report = extensions.LogReport(
+            trigger=(2, 'iteration'), format='json-lines')
+        self.run_trainer(log_report, 4)
+        self.assertEqual(
+            [entry['iteration'] for entry in self.read_lines('log')], [2, 4])
+
+    def test_rotate_size(self):
+        log_report = extensions.LogReport(
+            trigger=(2, 'iteration'), format='json-lines', rotate_size=1)
+        self.run_trainer(log_report, 10)
+        self.assertEqual(
+            sorted(os.listdir(self.out)),
+            ['log', 'log.1', 'log.2', 'log.3', 'log.4'])
+        for i, path in enumerate(['log.1', 'log.2', 'log.3', 'log.4', 'log']):
+            log = self.read_lines(path)
+            self.assertEqual(len(log), 1)
+            self.assertEqual(log[0], log_report.log[i])
+
+    def test_rotate_interval(self):
+        log_report = extensions.LogReport(
+            trigger=(5, 'iteration'), format='json-lines', rotate_interval=0)
+        self.run_trainer(log_report, 10)
+        self.assertEqual(sorted(os.listdir(self.out)), ['log', 'log.1'])
+        self.assertEqual(self.read_lines('log.1')[0]['iteration'], 5)
+        self.assertEqual(self.read_lines('log')[0]['iteration'], 10)
+
+    def test_resume(self):
+        log_report = extensions.LogReport(
+            trigger=(2, 'iteration'), format='json-lines', rotate_size=100)
+        self.run_trainer(log_report, 6)
+        snapshot = os.path.join(self.out, 'snapshot')
+        os.mkdir(snapshot)
+        snapshot = os.path.join(snapshot, 'snapshot.npz')
+        chainer.serializers.save_npz(snapshot, log_report)
+        # The entries after the snapshot are discarded on resume.
+        self.run_trainer(log_report, 10, iteration=6)
+
+        log_report = extensions.LogReport(
+            trigger=(2, 'iteration'), format='json-lines', rotate_size=100)
+        chainer.serializers.load_npz(snapshot, log_report)
+        self.run_trainer(log_report, 12, iteration=6)
+
+        log = log_report.log
+        self.assertEqual([entry['iteration'] for entry in log],
+                         [2, 4, 6, 8, 10, 12])
+        lines = []
+        for path in sorted(os.listdir(self.out))[1:] + ['log']:
+            if path.startswith('log'):
+                lines += self.read_lines(path)
+        self.assertEqual(lines, log)
+
+    def test_lazy_log(self):
+        log_report = extensions.LogReport(
+            trigger=(2, 'iteration'), format='json-lines')
+        self.run_trainer(log_report, 4)
+        path = os.path.join(self.out, 'snapshot.npz')
+        chainer.serializers.save_npz(path, log_report)
+
+        log_report = extensions.LogReport(
+            trigger=(2, 'iteration'), format='json-lines')
+        chainer.serializers.load_npz(path, log_report)
+        trainer = testing.get_trainer_with_mock_updater()
+        trainer.out = self.out
+        log_report.initialize(trainer)
+        self.assertEqual(
+            [entry['iteration'] for entry in log_report.log], [2, 4])
+
+    def test_print_report(self):
+        log_report = extensions.LogReport(
+            trigger=(2, 'iteration'), format='json-lines')
+        out = six.StringIO()
+        trainer = testing.get_trainer_with_mock_updater(
+            stop_trigger=(4, 'iteration'))
+        trainer.out = self.out
+        # PrintReport updates the given LogReport.
+        trainer.extend(extensions.PrintReport(
+            ['iteration'], log_report=log_report, out=out))
+        trainer.run()
+        self.assertEqual(out.getvalue().replace('\033[J', '').split(),
+                         ['iteration', '2', '4'])
+
+    def test_invalid_format(self):
+        with self.assertRaises(ValueError):
+            extensions.LogReport(format='yaml')
+
+    def test_rotate_json(self):
+        with self.assertRaises(ValueError):
+            extensions.LogReport(rotate_size=100)
+
+
+testing.run_module(__name__, __file__)
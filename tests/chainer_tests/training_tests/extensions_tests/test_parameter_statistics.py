@@ -3,11 +3,13 @@ import time
 import unittest
 
 import mock
+import numpy
 import six
 
 import chainer
 from chainer.backends import cuda
 from chainer import testing
+from chainer.testing import attr
 from chainer import training
 from chainer.training import extensions
 
@@ -179,4 +181,135 @@ class TestParameterStatisticsCustomFunction(TestParameterStatisticsBase,
             self.assertEqual(value, self.expect)
 
 
+@testing.parameterize(*testing.product({
+    'size': [0, 1, 1000, (1 << 16) + 5],
+    'dtype': [numpy.float16, numpy.float32, numpy.float64],
+}))
+class TestMoments(unittest.TestCase):
+
+    def setUp(self):
+        self.x = numpy.random.uniform(-1, 1, self.size).astype(self.dtype)
+
+    def check(self, x):
+        moments = extensions.parameter_statistics._moments(x)
+        if self.size == 0:
+            for value in six.itervalues(moments):
+                self.assertTrue(numpy.isnan(value))
+            return
+        x = self.x.astype(numpy.float64)
+        testing.assert_allclose(moments['mean'], x.mean())
+        testing.assert_allclose(moments['std'], x.std(), atol=1e-6)
+        testing.assert_allclose(moments['min'], x.min())
+        testing.assert_allclose(moments['max'], x.max())
+
+    def test_cpu(self):
+        self.check(self.x)
+
+    @attr.gpu
+    def test_gpu(self):
+        self.check(cuda.to_gpu(self.x))
+
+    def check_nan(self, x):
+        moments = extensions.parameter_statistics._moments(x)
+        for value in six.itervalues(moments):
+            self.assertTrue(numpy.isnan(float(value)))
+
+    def test_nan_cpu(self):
+        # NaN in the last chunk is not hidden by the preceding values.
+        self.x[-1:] = numpy.nan
+        self.check_nan(self.x)
+
+    @attr.gpu
+    def test_nan_gpu(self):
+        self.x[-1:] = numpy.nan
+        self.check_nan(cuda.to_gpu(self.x))
+
+
+class TestParameterStatisticsOptions(unittest.TestCase):
+
+    def setUp(self):
+        self.link = chainer.links.Linear(30, 20)
+        self.link.cleargrads()
+        self.statistics = {
+            'size': lambda x: x.size,
+            'mean': extensions.ParameterStatistics.default_statistics['mean'],
+            'max': extensions.ParameterStatistics.default_statistics['max'],
+        }
+
+    def run_extension(self, n_iter=10, **kwargs):
+        trainer = _get_mocked_trainer([self.link], (n_iter, 'iteration'))
+        trainer.extend(extensions.ParameterStatistics(
+            self.link, statistics=self.statistics, report_grads=False,
+            trigger=(n_iter, 'iteration'), **kwargs))
+        trainer.run()
+        return trainer.observation
+
+    def test_fused(self):
+        observation = self.run_extension()
+        W = self.link.W.array
+        testing.assert_allclose(observation['None/W/data/mean'], W.mean())
+        testing.assert_allclose(observation['None/W/data/max'], W.max())
+        self.assertEqual(observation['None/W/data/size'], W.size)
+
+    def check_sampling(self, sampling):
+        observation = self.run_extension(sample_size=100, sampling=sampling)
+        self.assertEqual(observation['None/W/data/size'], 100)
+        self.assertEqual(observation['None/b/data/size'], 20)
+        W = self.link.W.array
+        self.assertLessEqual(observation['None/W/data/max'], W.max())
+        self.assertGreater(observation['None/W/data/max'], W.mean())
+
+    def test_random_sampling(self):
+        self.check_sampling('random')
+
+    def test_random_sampling_seed(self):
+        def sample_indices():
+            extension = extensions.ParameterStatistics(
+                self.link, sample_size=100, seed=0)
+            extension._sample('W', self.link.W.array.ravel())
+            return extension._sample_indices['W'][1]
+
+        state = numpy.random.get_state()
+        index = sample_indices()
+        self.assertEqual(len(numpy.unique(index)), 100)
+        numpy.testing.assert_array_equal(index, sample_indices())
+        # The global random state is not used.
+        numpy.testing.assert_array_equal(
+            numpy.random.get_state()[1], state[1])
+
+    def test_choice(self):
+        random = numpy.random.RandomState(0)
+        for n, size in ((1000, 10), (1000, 600), (10, 10)):
+            index = extensions.parameter_statistics._choice(random, n, size)
+            self.assertEqual(len(numpy.unique(index)), size)
+            self.assertTrue((numpy.diff(index) > 0).all())
+            self.assertTrue(0 <= index[0] and index[-1] < n)
+
+    def test_stride_sampling(self):
+        self.check_sampling('stride')
+
+    def test_invalid_sampling(self):
+        with self.assertRaises(ValueError):
+            extensions.ParameterStatistics(self.link, sampling='invalid')
+
+    def test_threads(self):
+        expect = self.run_extension()
+        observation = self.run_extension(n_threads=2)
+        self.assertEqual(set(observation), set(expect))
+        for key in expect:
+            testing.assert_allclose(observation[key], expect[key])
+
+    def test_max_overhead(self):
+        n_calls = [0]
+
+        def count(x):
+            n_calls[0] += 1
+            return 0
+
+        self.statistics = {'count': count}
+        self.run_extension(max_overhead=0.)
+        # The budget is exhausted by the first computation.
+        self.assertEqual(n_calls[0], 2)
+
+
 testing.run_module(__name__, __file__)
@@ -38,5 +38,19 @@ class TestPlotReport(unittest.TestCase):
 
         self.assertEqual(len(w), 0)
 
+    def test_background_new_points(self):
+        with warnings.catch_warnings(record=True):
+            report = extensions.PlotReport(['a', 'b'], background=True)
+        report._data['a'].extend([(1, 0.5), (2, 0.25)])
+        _, args = report._make_request('plot.png', None)
+        self.assertEqual(args[1], [('a', [(1, 0.5), (2, 0.25)]), ('b', [])])
+        self.assertTrue(args[2])
+
+        report._data['a'].append((3, 0.125))
+        report._data['b'].append((3, 1.))
+        _, args = report._make_request('plot.png', None)
+        self.assertEqual(args[1], [('a', [(3, 0.125)]), ('b', [(3, 1.)])])
+        self.assertFalse(args[2])
+
 
 testing.run_module(__name__, __file__)
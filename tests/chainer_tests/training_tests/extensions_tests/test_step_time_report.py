@@ -0,0 +1,91 @@
+import time
+import unittest
+import warnings
+
+import numpy
+
+import chainer
+from chainer import links
+from chainer import testing
+from chainer import training
+from chainer.training import extensions
+
+
+class SlowDataset(chainer.dataset.DatasetMixin):
+
+    def __init__(self, n, wait):
+        self.n = n
+        self.wait = wait
+
+    def __len__(self):
+        return self.n
+
+    def get_example(self, i):
+        time.sleep(self.wait)
+        return numpy.full((3,), i, numpy.float32), numpy.int32(i % 2)
+
+
+@testing.parameterize(
+    {'wait': 0, 'threshold': 1.},
+    {'wait': 0.01, 'threshold': 0.2},
+)
+class TestStepTimeReport(unittest.TestCase):
+
+    def setUp(self):
+        model = links.Classifier(links.Linear(3, 2))
+        optimizer = chainer.optimizers.SGD()
+        optimizer.setup(model)
+        iterator = chainer.iterators.SerialIterator(
+            SlowDataset(8, self.wait), 2)
+        updater = training.updaters.StandardUpdater(iterator, optimizer)
+        self.trainer = training.Trainer(updater, (4, 'iteration'))
+        self.report = extensions.StepTimeReport(
+            trigger=(2, 'iteration'), threshold=self.threshold)
+        self.trainer.extend(self.report)
+        self.observations = []
+        self.trainer.extend(
+            lambda trainer: self.observations.append(
+                dict(trainer.observation)),
+            name='collect', priority=training.PRIORITY_READER)
+
+    def test_run(self):
+        with warnings.catch_warnings(record=True) as w:
+            warnings.simplefilter('always')
+            self.trainer.run()
+        self.assertTrue(self.trainer.measure_time)
+        self.assertTrue(self.trainer.updater.measure_time)
+
+        for i, observation in enumerate(self.observations):
+            for key in ('iterator', 'forward', 'backward', 'update', 'step',
+                        'iterator_ratio'):
+                self.assertIn('time/' + key, observation)
+            if i > 0:
+                # Times of extensions are reported at the next iteration.
+                self.assertIn(
+                    'time/extension/StepTimeReport', observation)
+                self.assertIn('time/extensions', observation)
+
+        self.assertIn('time/iterator_ratio', self.report.summary)
+        starving = self.wait > 0
+        self.assertEqual(self.report.starving, starving)
+        starving_warnings = [
+            x for x in w if 'starved' in str(x.message)]
+        self.assertEqual(len(starving_warnings), 2 if starving else 0)
+
+
+class TestStepTimeReportDisabled(unittest.TestCase):
+
+    def test_no_time_measurement(self):
+        model = links.Classifier(links.Linear(3, 2))
+        optimizer = chainer.optimizers.SGD()
+        optimizer.setup(model)
+        iterator = chainer.iterators.SerialIterator(SlowDataset(4, 0), 2)
+        updater = training.updaters.StandardUpdater(iterator, optimizer)
+        trainer = training.Trainer(updater, (2, 'iteration'))
+        trainer.run()
+        self.assertFalse(trainer.measure_time)
+        self.assertFalse(
+            any(k.startswith('time/') for k in trainer.observation))
+
+
+testing.run_module(__name__, __file__)
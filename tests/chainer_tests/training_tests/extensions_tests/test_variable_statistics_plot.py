@@ -1,11 +1,15 @@
 import os
+import shutil
 import six
+import tempfile
 import unittest
 
 import numpy
 
 import chainer
+from chainer.backends import cuda
 from chainer import testing
+from chainer.testing import attr
 from chainer.training import extensions
 
 
@@ -94,4 +98,89 @@ class TestStatistician(unittest.TestCase):
         testing.assert_allclose(percentile[2], numpy.max(self.x))
 
 
+@testing.parameterize(*testing.product({
+    'shapes': [[(2, 7, 3)], [(100,), (30, 40), (1,)]],
+    'dtype': [numpy.float32, numpy.float64],
+}))
+class TestStreamingStatistician(unittest.TestCase):
+
+    def setUp(self):
+        self.xs = [numpy.random.uniform(-1, 1, shape).astype(self.dtype)
+                   for shape in self.shapes]
+        self.x = numpy.concatenate([x.ravel() for x in self.xs])
+
+    def check(self, xs):
+        percentile_sigmas = (0., 2.28, 50., 97.72, 100.)
+        n_bins = 100
+        statistician = \
+            extensions.variable_statistics_plot.StreamingStatistician(
+                collect_mean=True, collect_std=True,
+                percentile_sigmas=percentile_sigmas, n_bins=n_bins)
+        stat = statistician(xs)
+
+        testing.assert_allclose(stat['mean'], numpy.mean(self.x))
+        testing.assert_allclose(stat['std'], numpy.std(self.x))
+
+        percentile = stat['percentile']
+        self.assertIsInstance(percentile, numpy.ndarray)
+        expect = numpy.percentile(self.x, percentile_sigmas)
+        width = (self.x.max() - self.x.min()) / n_bins
+        testing.assert_allclose(percentile, expect, atol=width, rtol=0)
+        testing.assert_allclose(percentile[0], self.x.min())
+        testing.assert_allclose(percentile[-1], self.x.max())
+
+    def test_cpu(self):
+        self.check(self.xs)
+
+    @attr.gpu
+    def test_gpu(self):
+        self.check([cuda.to_gpu(x) for x in self.xs])
+
+
+class TestStreamingStatisticianConstant(unittest.TestCase):
+
+    def test_constant(self):
+        statistician = \
+            extensions.variable_statistics_plot.StreamingStatistician(
+                collect_mean=False, collect_std=False,
+                percentile_sigmas=50)
+        stat = statistician([numpy.full((3, 4), 2, numpy.float32)])
+        self.assertEqual(set(stat), {'percentile'})
+        testing.assert_allclose(stat['percentile'], numpy.array([2.]))
+
+
+def _write_pid(path):
+    with open(path, 'w') as f:
+        f.write(str(os.getpid()))
+
+
+class TestBackgroundRenderer(unittest.TestCase):
+
+    def setUp(self):
+        self.out = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.out)
+
+    def test_render(self):
+        renderer = extensions._renderer.BackgroundRenderer()
+        paths = [os.path.join(self.out, str(i)) for i in range(3)]
+        try:
+            for path in paths:
+                renderer.submit(_write_pid, path)
+        finally:
+            renderer.close()
+        # The last request is always rendered, and the requests superseded
+        # while the process is busy are skipped.
+        self.assertTrue(os.path.exists(paths[-1]))
+        with open(paths[-1]) as f:
+            self.assertNotEqual(int(f.read()), os.getpid())
+
+    def test_error(self):
+        renderer = extensions._renderer.BackgroundRenderer()
+        renderer.submit(_write_pid, os.path.join(self.out, 'no', 'such'))
+        with self.assertRaises(IOError):
+            renderer.close()
+
+
 testing.run_module(__name__, __file__)
@@ -179,4 +179,177 @@ class TestUpdaterUpdateArguments(unittest.TestCase):
         self.assertEqual(iterator.next_called, 1)
 
 
+class TestUpdaterMeasureTime(unittest.TestCase):
+
+    def setUp(self):
+        self.x = numpy.random.uniform(-1, 1, (4, 3)).astype(numpy.float32)
+        self.t = numpy.random.randint(0, 2, 4).astype(numpy.int32)
+
+    def _update(self, optimizer, measure_time):
+        iterator = DummyIterator(list(zip(self.x, self.t)))
+        updater = training.updaters.StandardUpdater(
+            iterator, optimizer, measure_time=measure_time)
+        reporter = chainer.Reporter()
+        reporter.add_observer('main', optimizer.target)
+        observation = {}
+        with reporter.scope(observation):
+            updater.update()
+        return observation
+
+    def test_gradient_method(self):
+        model = chainer.links.Classifier(chainer.links.Linear(3, 2))
+        expect = model.copy(mode='copy')
+        optimizer = chainer.optimizers.SGD()
+        optimizer.setup(expect)
+        self._update(optimizer, False)
+        optimizer = chainer.optimizers.SGD()
+        optimizer.setup(model)
+        observation = self._update(optimizer, True)
+
+        for key in ('iterator', 'converter', 'forward', 'backward', 'update',
+                    'step', 'throughput'):
+            self.assertIn('time/' + key, observation)
+            self.assertGreaterEqual(observation['time/' + key], 0)
+        self.assertLessEqual(
+            observation['time/forward'] + observation['time/backward'],
+            observation['time/step'])
+        testing.assert_allclose(
+            observation['time/throughput'], 4 / observation['time/step'])
+        for p, q in zip(model.params(), expect.params()):
+            testing.assert_allclose(p.array, q.array)
+
+    def test_other_optimizer(self):
+        optimizer = DummyOptimizer()
+        optimizer.setup(chainer.Link())
+        observation = self._update(optimizer, True)
+        self.assertEqual(optimizer.update.call_count, 1)
+        self.assertIn('time/update', observation)
+        self.assertNotIn('time/forward', observation)
+
+    def test_disabled(self):
+        optimizer = DummyOptimizer()
+        optimizer.setup(chainer.Link())
+        observation = self._update(optimizer, False)
+        self.assertFalse(any(k.startswith('time/') for k in observation))
+
+
+class TestUpdaterDynamicLossScale(unittest.TestCase):
+
+    def setUp(self):
+        self.x = numpy.random.uniform(-1, 1, (4, 3)).astype(numpy.float32)
+        self.t = numpy.random.randint(0, 2, 4).astype(numpy.int32)
+        self.model = chainer.links.Classifier(chainer.links.Linear(3, 2))
+        self.optimizer = chainer.optimizers.SGD()
+        self.optimizer.setup(self.model)
+
+    def _make_updater(self, measure_time=False):
+        iterator = DummyIterator(list(zip(self.x, self.t)))
+        return training.updaters.StandardUpdater(
+            iterator, self.optimizer, loss_scale='dynamic',
+            measure_time=measure_time)
+
+    def _update(self, updater):
+        # Classifier reports its loss, which needs a reporter observing it.
+        reporter = chainer.Reporter()
+        reporter.add_observer('main', self.model)
+        with reporter.scope({}), chainer.using_config('debug', False):
+            updater.update()
+
+    def check_skip(self, measure_time):
+        self.x[0, 0] = numpy.inf
+        expect = [p.array.copy() for p in self.model.params()]
+        updater = self._make_updater(measure_time)
+        # The updater enables the dynamic loss scaling.
+        scale = self.optimizer.loss_scale
+        self.assertIsNotNone(scale)
+        self._update(updater)
+        self.assertEqual(self.optimizer.n_skipped_updates, 1)
+        self.assertEqual(self.optimizer.loss_scale, scale / 2)
+        for p, q in zip(self.model.params(), expect):
+            testing.assert_allclose(p.array, q)
+
+    def test_skip(self):
+        self.check_skip(False)
+
+    def test_skip_measure_time(self):
+        self.check_skip(True)
+
+    def test_update(self):
+        expect = self.model.copy(mode='copy')
+        optimizer = chainer.optimizers.SGD()
+        optimizer.setup(expect)
+        reporter = chainer.Reporter()
+        reporter.add_observer('main', expect)
+        with reporter.scope({}):
+            optimizer.update(expect, self.x, self.t)
+        self._update(self._make_updater())
+        self.assertEqual(self.optimizer.t, 1)
+        for p, q in zip(self.model.params(), expect.params()):
+            testing.assert_allclose(p.array, q.array, rtol=1e-4, atol=1e-5)
+
+
+@testing.parameterize(*testing.product({
+    'n_micro_batches': [2, 3, 8],
+    'measure_time': [False, True],
+}))
+class TestUpdaterMicroBatches(unittest.TestCase):
+
+    def setUp(self):
+        self.x = numpy.random.uniform(-1, 1, (5, 3)).astype(numpy.float32)
+        self.t = numpy.random.randint(0, 2, 5).astype(numpy.int32)
+        self.model = chainer.links.Classifier(chainer.links.Linear(3, 2))
+
+    def _update(self, model, n_micro_batches):
+        iterator = DummyIterator(list(zip(self.x, self.t)))
+        optimizer = chainer.optimizers.SGD()
+        optimizer.setup(model)
+        updater = training.updaters.StandardUpdater(
+            iterator, optimizer, measure_time=self.measure_time,
+            n_micro_batches=n_micro_batches)
+        reporter = chainer.Reporter()
+        reporter.add_observer('main', model)
+        observation = {}
+        with reporter.scope(observation):
+            updater.update()
+        self.assertEqual(iterator.next_called, 1)
+        return observation
+
+    def test_update(self):
+        expect = self.model.copy(mode='copy')
+        expect_observation = self._update(expect, 1)
+        observation = self._update(self.model, self.n_micro_batches)
+
+        for p, q in zip(self.model.params(), expect.params()):
+            testing.assert_allclose(p.array, q.array, rtol=1e-4, atol=1e-5)
+        self.assertIn('main/loss', observation)
+        self.assertIn('main/accuracy', observation)
+        if self.measure_time:
+            for key in ('converter', 'forward', 'backward', 'update'):
+                self.assertIn('time/' + key, observation)
+            testing.assert_allclose(
+                observation['time/throughput'], 5 / observation['time/step'])
+        if self.n_micro_batches >= 5:
+            # Every micro-batch has one example.
+            testing.assert_allclose(
+                observation['main/accuracy'],
+                expect_observation['main/accuracy'].array)
+
+
+class TestUpdaterMicroBatchesInvalid(unittest.TestCase):
+
+    def test_invalid_n_micro_batches(self):
+        optimizer = chainer.optimizers.SGD()
+        optimizer.setup(chainer.Link())
+        with self.assertRaises(ValueError):
+            training.updaters.StandardUpdater(
+                DummyIterator([]), optimizer, n_micro_batches=0)
+
+    def test_non_gradient_method(self):
+        optimizer = DummyOptimizer()
+        optimizer.setup(chainer.Link())
+        with self.assertRaises(ValueError):
+            training.updaters.StandardUpdater(
+                DummyIterator([]), optimizer, n_micro_batches=2)
+
+
 testing.run_module(__name__, __file__)
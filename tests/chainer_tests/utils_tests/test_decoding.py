@@ -0,0 +1,145 @@
+import itertools
+import unittest
+
+import numpy
+
+import chainer
+from chainer.backends import cuda
+from chainer import testing
+from chainer.testing import attr
+from chainer import utils
+
+
+class SecondOrderModel(object):
+
+    # A toy model whose next-token distribution depends on the last two
+    # tokens. The older one is kept as a recurrent state.
+
+    def __init__(self, log_probs, state):
+        self.log_probs = log_probs
+        self.state = state
+
+    def step(self, ys):
+        scores = self.log_probs[self.state, ys]
+        self.state = ys
+        return chainer.Variable(scores)
+
+    def reorder(self, indices):
+        self.state = self.state[indices]
+
+
+def _exhaustive_search(log_probs, state, bos, eos, max_length, alpha):
+    n_vocab = log_probs.shape[-1]
+    best_seq, best_score = None, -numpy.inf
+    for length in range(1, max_length + 1):
+        for seq in itertools.product(range(n_vocab), repeat=length):
+            if eos in seq[:-1]:
+                continue
+            if length < max_length and seq[-1] != eos:
+                continue
+            score = 0
+            a, b = state, bos
+            for y in seq:
+                score += log_probs[a, b, y]
+                a, b = b, y
+            score /= length ** alpha
+            if score > best_score:
+                best_seq, best_score = seq, score
+    if best_seq[-1] == eos:
+        best_seq = best_seq[:-1]
+    return numpy.array(best_seq), best_score
+
+
+@testing.parameterize(*testing.product({
+    'length_penalty': [0, 1],
+}))
+class TestBeamSearch(unittest.TestCase):
+
+    n_vocab = 4
+    eos = 0
+    max_length = 3
+
+    def setUp(self):
+        logits = numpy.random.uniform(
+            -2, 2, (self.n_vocab,) * 3).astype(numpy.float32)
+        self.log_probs = logits - numpy.log(
+            numpy.exp(logits).sum(axis=2, keepdims=True))
+        self.state = numpy.array([1, 2, 3, 1], numpy.int32)
+        self.bos = numpy.array([1, 1, 2, 3], numpy.int32)
+
+    def check_beam_search(self, xp):
+        log_probs = xp.asarray(self.log_probs)
+        model = SecondOrderModel(log_probs, xp.asarray(self.state))
+        # Beam is large enough to keep all the hypotheses.
+        beam_size = self.n_vocab ** self.max_length
+        outs, scores = utils.beam_search(
+            model.step, model.reorder, xp.asarray(self.bos), self.eos,
+            beam_size, self.max_length, length_penalty=self.length_penalty)
+
+        self.assertEqual(len(outs), len(self.bos))
+        self.assertIsInstance(scores, numpy.ndarray)
+        for i in range(len(self.bos)):
+            expect_seq, expect_score = _exhaustive_search(
+                self.log_probs, self.state[i], self.bos[i], self.eos,
+                self.max_length, self.length_penalty)
+            numpy.testing.assert_array_equal(outs[i], expect_seq)
+            testing.assert_allclose(scores[i], expect_score)
+
+    def test_beam_search_cpu(self):
+        self.check_beam_search(numpy)
+
+    @attr.gpu
+    def test_beam_search_gpu(self):
+        self.check_beam_search(cuda.cupy)
+
+
+class TestGreedySearch(unittest.TestCase):
+
+    n_vocab = 5
+    eos = 0
+    max_length = 6
+
+    def setUp(self):
+        self.log_probs = numpy.log(numpy.random.uniform(
+            0.1, 1, (self.n_vocab,) * 3)).astype(numpy.float32)
+        self.state = numpy.array([1, 2, 3], numpy.int32)
+        self.bos = numpy.array([1, 4, 2], numpy.int32)
+
+    def check_greedy_search(self, xp):
+        log_probs = xp.asarray(self.log_probs)
+        model = SecondOrderModel(log_probs, xp.asarray(self.state))
+        outs = utils.greedy_search(
+            model.step, xp.asarray(self.bos), self.eos, self.max_length)
+
+        model = SecondOrderModel(log_probs, xp.asarray(self.state))
+        expects, _ = utils.beam_search(
+            model.step, model.reorder, xp.asarray(self.bos), self.eos, 1,
+            self.max_length)
+        self.assertEqual(len(outs), len(expects))
+        for out, expect in zip(outs, expects):
+            self.assertIsInstance(out, numpy.ndarray)
+            numpy.testing.assert_array_equal(out, expect)
+
+    def test_greedy_search_cpu(self):
+        self.check_greedy_search(numpy)
+
+    @attr.gpu
+    def test_greedy_search_gpu(self):
+        self.check_greedy_search(cuda.cupy)
+
+    def test_early_stopping(self):
+        calls = []
+
+        def step(ys):
+            calls.append(ys)
+            scores = numpy.zeros((len(ys), self.n_vocab), numpy.float32)
+            scores[:, self.eos] = 1
+            return scores
+
+        outs = utils.greedy_search(step, self.bos, self.eos, self.max_length)
+        self.assertEqual(len(calls), 1)
+        for out in outs:
+            self.assertEqual(len(out), 0)
+
+
+testing.run_module(__name__, __file__)
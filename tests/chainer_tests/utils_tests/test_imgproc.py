@@ -0,0 +1,317 @@
+import unittest
+
+import numpy
+
+from chainer import dataset
+from chainer import testing
+from chainer.utils import imgproc
+
+
+@testing.parameterize(*testing.product({
+    'dtype': [numpy.uint8, numpy.float32],
+}))
+class TestBatchedImgproc(unittest.TestCase):
+
+    def setUp(self):
+        self.images = numpy.random.randint(
+            0, 256, (4, 3, 6, 8)).astype(self.dtype)
+
+    def test_crop(self):
+        top = numpy.array([0, 1, 2, 3])
+        left = numpy.array([4, 0, 1, 2])
+        out = imgproc.crop(self.images, top, left, (3, 4))
+        self.assertEqual(out.shape, (4, 3, 3, 4))
+        self.assertEqual(out.dtype, self.dtype)
+        for i in range(4):
+            numpy.testing.assert_array_equal(
+                out[i], self.images[i, :, top[i]:top[i] + 3,
+                                    left[i]:left[i] + 4])
+
+    def test_crop_out(self):
+        top = numpy.array([0, 1, 2, 3])
+        left = numpy.array([4, 0, 1, 2])
+        out = numpy.empty((4, 3, 3, 4), dtype=self.dtype)
+        ret = imgproc.crop(self.images, top, left, (3, 4), out=out)
+        self.assertIs(ret, out)
+        numpy.testing.assert_array_equal(
+            out, imgproc.crop(self.images, top, left, (3, 4)))
+
+    def test_crop_out_out_of_range(self):
+        out = numpy.empty((4, 3, 3, 4), dtype=self.dtype)
+        with self.assertRaises(IndexError):
+            imgproc.crop(self.images, [0, 0, 0, 4], [0, 0, 0, 0], (3, 4),
+                         out=out)
+        with self.assertRaises(IndexError):
+            imgproc.crop(self.images, [0, 0, 0, 0], [0, -1, 0, 0], (3, 4),
+                         out=out)
+
+    def test_crop_out_invalid_shape(self):
+        out = numpy.empty((4, 3, 4, 3), dtype=self.dtype)
+        with self.assertRaises(ValueError):
+            imgproc.crop(self.images, [0] * 4, [0] * 4, (3, 4), out=out)
+
+    def test_crop_out_of_range(self):
+        with self.assertRaises(IndexError):
+            imgproc.crop(self.images, [0, 0, 0, 4], [0, 0, 0, 0], (3, 4))
+        with self.assertRaises(IndexError):
+            imgproc.crop(self.images, [0, 0, 0, 0], [0, -1, 0, 0], (3, 4))
+
+    def test_crop_invalid_size(self):
+        with self.assertRaises(ValueError):
+            imgproc.crop(self.images, [0] * 4, [0] * 4, (7, 4))
+
+    def test_flip(self):
+        mask = numpy.array([True, False, False, True])
+        out = imgproc.flip(self.images, mask)
+        for i in range(4):
+            if mask[i]:
+                expect = self.images[i, :, :, ::-1]
+            else:
+                expect = self.images[i]
+            numpy.testing.assert_array_equal(out[i], expect)
+
+    def test_flip_out(self):
+        mask = numpy.array([True, False, False, True])
+        expect = imgproc.flip(self.images, mask)
+        out = numpy.empty_like(self.images)
+        self.assertIs(imgproc.flip(self.images, mask, out=out), out)
+        numpy.testing.assert_array_equal(out, expect)
+
+    def test_flip_in_place(self):
+        mask = numpy.array([True, False, False, True])
+        expect = imgproc.flip(self.images, mask)
+        imgproc.flip(self.images, mask, out=self.images)
+        numpy.testing.assert_array_equal(self.images, expect)
+
+    def test_resized_crop_identity(self):
+        n = len(self.images)
+        out = imgproc.resized_crop(
+            self.images, [0] * n, [0] * n, [6] * n, [8] * n, (6, 8))
+        numpy.testing.assert_array_equal(out, self.images)
+
+    def test_resized_crop(self):
+        top = numpy.array([0, 2, 1, 0])
+        left = numpy.array([0, 4, 2, 1])
+        height = numpy.array([6, 2, 4, 3])
+        width = numpy.array([8, 4, 2, 6])
+        out = imgproc.resized_crop(
+            self.images, top, left, height, width, (2, 2))
+        self.assertEqual(out.shape, (4, 3, 2, 2))
+        for i in range(4):
+            ys = top[i] + (numpy.array([0.5, 1.5]) / 2 * height[i]).astype(int)
+            xs = left[i] + (numpy.array([0.5, 1.5]) / 2 * width[i]).astype(int)
+            numpy.testing.assert_array_equal(
+                out[i], self.images[i][:, ys][:, :, xs])
+
+    def test_resized_crop_outside(self):
+        with self.assertRaises(ValueError):
+            imgproc.resized_crop(
+                self.images, [0, 0, 0, 3], [0] * 4, [4] * 4, [4] * 4, (2, 2))
+
+    def test_adjust_color_identity(self):
+        out = imgproc.adjust_color(
+            self.images, brightness=numpy.ones(4), contrast=numpy.ones(4),
+            saturation=numpy.ones(4))
+        self.assertEqual(out.dtype, self.dtype)
+        numpy.testing.assert_allclose(out, self.images, atol=1e-3)
+
+    def test_adjust_brightness(self):
+        brightness = numpy.array([0., 0.5, 1., 2.])
+        out = imgproc.adjust_color(self.images, brightness=brightness)
+        expect = self.images.astype(numpy.float32) * brightness.reshape(
+            -1, 1, 1, 1)
+        if self.dtype == numpy.uint8:
+            expect = numpy.clip(numpy.rint(expect), 0, 255)
+        numpy.testing.assert_allclose(out, expect, atol=1e-3)
+
+    def test_adjust_saturation_zero(self):
+        out = imgproc.adjust_color(self.images, saturation=numpy.zeros(4))
+        # All the channels are the luma.
+        numpy.testing.assert_allclose(out[:, 0], out[:, 1], atol=1)
+        numpy.testing.assert_allclose(out[:, 0], out[:, 2], atol=1)
+
+    def test_adjust_contrast_zero(self):
+        out = imgproc.adjust_color(self.images, contrast=numpy.zeros(4))
+        # All the pixels are the mean luma.
+        for i in range(4):
+            numpy.testing.assert_allclose(out[i], out[i, 0, 0, 0], atol=1)
+
+    def test_not_batch(self):
+        with self.assertRaises(ValueError):
+            imgproc.flip(self.images[0], [True])
+
+
+@testing.parameterize(*testing.product({
+    'dtype': [numpy.uint8, numpy.float32],
+    'interpolation': ['nearest', 'bilinear'],
+}))
+class TestResize(unittest.TestCase):
+
+    def setUp(self):
+        self.images = numpy.random.randint(
+            0, 256, (2, 3, 4, 6)).astype(self.dtype)
+
+    def test_identity(self):
+        out = imgproc.resize(self.images, (4, 6), self.interpolation)
+        self.assertEqual(out.dtype, self.dtype)
+        numpy.testing.assert_array_equal(out, self.images)
+
+    def test_constant(self):
+        images = numpy.full((2, 3, 4, 6), 7, dtype=self.dtype)
+        out = imgproc.resize(images, (7, 5), self.interpolation)
+        self.assertEqual(out.shape, (2, 3, 7, 5))
+        numpy.testing.assert_allclose(out, 7, atol=1e-5)
+
+    def test_downscale(self):
+        out = imgproc.resize(self.images, (2, 3), self.interpolation)
+        if self.interpolation == 'nearest':
+            expect = self.images[:, :, 1::2, 1::2]
+        else:
+            # Each output pixel is the mean of 2x2 input pixels.
+            x = self.images.astype(numpy.float32)
+            expect = (x[:, :, 0::2, 0::2] + x[:, :, 0::2, 1::2] +
+                      x[:, :, 1::2, 0::2] + x[:, :, 1::2, 1::2]) / 4
+            if self.dtype == numpy.uint8:
+                expect = numpy.rint(expect)
+        numpy.testing.assert_allclose(out, expect, atol=1e-4)
+
+    def test_out(self):
+        expect = imgproc.resize(self.images, (3, 5), self.interpolation)
+        out = numpy.empty((2, 3, 3, 5), dtype=self.dtype)
+        ret = imgproc.resize(self.images, (3, 5), self.interpolation,
+                             out=out)
+        self.assertIs(ret, out)
+        numpy.testing.assert_array_equal(out, expect)
+
+    def test_out_float32(self):
+        out = numpy.empty((2, 3, 4, 6), dtype=numpy.float32)
+        imgproc.resize(self.images, (4, 6), self.interpolation, out=out)
+        numpy.testing.assert_array_equal(out, self.images)
+
+    def test_invalid_interpolation(self):
+        with self.assertRaises(ValueError):
+            imgproc.resize(self.images, (2, 3), 'cubic')
+
+
+class TestNormalize(unittest.TestCase):
+
+    def setUp(self):
+        self.images = numpy.random.randint(
+            0, 256, (2, 3, 4, 5)).astype(numpy.uint8)
+        self.mean = numpy.random.uniform(0, 255, (3, 1, 1))
+        self.std = numpy.random.uniform(1, 100, (3, 1, 1))
+
+    def test_normalize(self):
+        out = imgproc.normalize(self.images, self.mean, self.std)
+        self.assertEqual(out.dtype, numpy.float32)
+        numpy.testing.assert_allclose(
+            out, (self.images - self.mean) / self.std, rtol=1e-5, atol=1e-4)
+
+    def test_mean_only(self):
+        mean = numpy.random.uniform(0, 255, (3, 4, 5))
+        out = imgproc.normalize(self.images, mean)
+        numpy.testing.assert_allclose(
+            out, self.images - mean, rtol=1e-5, atol=1e-4)
+
+    def test_std_only(self):
+        out = imgproc.normalize(self.images, std=255, dtype=numpy.float64)
+        self.assertEqual(out.dtype, numpy.float64)
+        numpy.testing.assert_allclose(out, self.images / 255.)
+
+    def test_out(self):
+        out = numpy.empty((2, 3, 4, 5), dtype=numpy.float32)
+        ret = imgproc.normalize(self.images, self.mean, self.std, out=out)
+        self.assertIs(ret, out)
+        numpy.testing.assert_allclose(
+            out, (self.images - self.mean) / self.std, rtol=1e-5, atol=1e-4)
+
+    def test_invalid_dtype(self):
+        with self.assertRaises(ValueError):
+            imgproc.normalize(self.images, std=255, dtype=numpy.int32)
+        out = numpy.empty((2, 3, 4, 5), dtype=numpy.int32)
+        with self.assertRaises(ValueError):
+            imgproc.normalize(self.images, std=255, out=out)
+
+    def test_in_place(self):
+        images = self.images.astype(numpy.float32)
+        imgproc.normalize(images, self.mean, self.std, out=images)
+        numpy.testing.assert_allclose(
+            images, (self.images - self.mean) / self.std,
+            rtol=1e-5, atol=1e-4)
+
+
+class TestHWCToCHW(unittest.TestCase):
+
+    def setUp(self):
+        self.images = numpy.random.randint(
+            0, 256, (2, 4, 5, 3)).astype(numpy.uint8)
+
+    def test_hwc_to_chw(self):
+        out = imgproc.hwc_to_chw(self.images)
+        self.assertTrue(out.flags.c_contiguous)
+        numpy.testing.assert_array_equal(
+            out, self.images.transpose(0, 3, 1, 2))
+
+    def test_out(self):
+        out = numpy.empty((2, 3, 4, 5), dtype=numpy.float32)
+        self.assertIs(imgproc.hwc_to_chw(self.images, out=out), out)
+        numpy.testing.assert_array_equal(
+            out, self.images.transpose(0, 3, 1, 2))
+
+    def test_not_batch(self):
+        with self.assertRaises(ValueError):
+            imgproc.hwc_to_chw(self.images[0])
+
+
+class TestImgprocPipeline(unittest.TestCase):
+
+    # Compares the batched preprocessing with the per-example preprocessing
+    # as in examples/imagenet, i.e. random crop, random flip, mean
+    # subtraction and scaling of each example followed by concatenation.
+
+    def setUp(self):
+        self.images = numpy.random.randint(
+            0, 256, (64, 3, 256, 256)).astype(numpy.uint8)
+        self.mean = numpy.random.uniform(0, 255, (3, 1, 1)).astype(
+            numpy.float32)
+        self.crop_size = 224
+        n = len(self.images)
+        self.top = numpy.random.randint(0, 256 - self.crop_size + 1, n)
+        self.left = numpy.random.randint(0, 256 - self.crop_size + 1, n)
+        self.mask = numpy.random.rand(n) < 0.5
+        size = (self.crop_size, self.crop_size)
+        self.cropped = numpy.empty((n, 3) + size, dtype=numpy.uint8)
+        self.flipped = numpy.empty_like(self.cropped)
+        self.out = numpy.empty(self.cropped.shape, dtype=numpy.float32)
+
+    def per_example(self):
+        batch = []
+        for i, image in enumerate(self.images):
+            image = image.astype(numpy.float32)
+            if self.mask[i]:
+                image = image[:, :, ::-1]
+            top, left = self.top[i], self.left[i]
+            image = image[:, top:top + self.crop_size,
+                          left:left + self.crop_size]
+            image -= self.mean
+            image *= 1 / 255
+            batch.append(image)
+        return dataset.concat_examples(batch)
+
+    def batched(self):
+        size = (self.crop_size, self.crop_size)
+        # Flipping the images before cropping is equivalent to cropping at
+        # the mirrored position.
+        left = numpy.where(
+            self.mask, 256 - self.crop_size - self.left, self.left)
+        imgproc.crop(self.images, self.top, left, size, out=self.cropped)
+        imgproc.flip(self.cropped, self.mask, out=self.flipped)
+        return imgproc.normalize(
+            self.flipped, self.mean, 255, out=self.out)
+
+    def test_equivalent(self):
+        numpy.testing.assert_allclose(
+            self.batched(), self.per_example(), rtol=1e-5, atol=1e-6)
+
+
+testing.run_module(__name__, __file__)